@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+""" Measures memory, that is allocated per vertex, per edge, per genome and per multicolor object, as well as per vertex / edge of a whole breakpoint graph
+
+Usage::
+
+    python benchmarks/memory_footprint.py [--objects 100000] [--genes 20000] [--genomes 3]
+
+Measurements are performed with ``tracemalloc``, so only allocations made by python itself are accounted for.
+"""
+from __future__ import print_function, division
+
+import argparse
+import gc
+import tracemalloc
+
+from bg.edge import BGEdge
+from bg.genome import BGGenome
+from bg.grimm import GRIMMReader
+from bg.multicolor import Multicolor
+from bg.vertices import TaggedBlockVertex, TaggedInfinityVertex
+
+__author__ = "Sergey Aganezov"
+__email__ = "aganezov(at)cs.jhu.edu"
+__status__ = "production"
+
+
+def measure(factory):
+    """ Provides a number of bytes, that were allocated by supplied factory, and are still referenced by its result """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = factory()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return allocated
+
+
+def grimm_data(genes, genomes):
+    """ Produces GRIMM formatted lines of several genomes with a single linear chromosome each, and a reversal in every genome """
+    result = []
+    for genome_cnt in range(genomes):
+        order = [str(gene) for gene in range(1, genes + 1)]
+        start, end = genome_cnt * 10, genome_cnt * 10 + 5
+        order[start:end] = ["-" + gene for gene in reversed(order[start:end])]
+        result.extend([">genome{cnt}".format(cnt=genome_cnt), " ".join(order) + " $"])
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory footprint of bg objects")
+    parser.add_argument("--objects", type=int, default=100000, help="number of standalone objects to be created")
+    parser.add_argument("--genes", type=int, default=20000, help="number of genes in every genome of a breakpoint graph")
+    parser.add_argument("--genomes", type=int, default=3, help="number of genomes in a breakpoint graph")
+    args = parser.parse_args()
+    n = args.objects
+    genome1, genome2 = BGGenome("genome1"), BGGenome("genome2")
+    vertices = [TaggedBlockVertex(str(cnt) + "t") for cnt in range(n)]
+    measurements = [
+        ("TaggedBlockVertex", lambda: [TaggedBlockVertex(str(cnt) + "t") for cnt in range(n)]),
+        ("TaggedInfinityVertex", lambda: [TaggedInfinityVertex(str(cnt) + "t") for cnt in range(n)]),
+        ("BGGenome", lambda: [BGGenome(str(cnt)) for cnt in range(n)]),
+        ("Multicolor", lambda: [Multicolor(genome1, genome2) for _ in range(n)]),
+        ("BGEdge", lambda: [BGEdge(vertex1=vertex, vertex2=vertex, multicolor=None, data={}) for vertex in vertices]),
+    ]
+    ############################################################################################################
+    #
+    # names of standalone objects are built lazily, so their cost is measured separately
+    #
+    ############################################################################################################
+    names = measure(lambda: [hash(vertex) for vertex in vertices])
+    print("{:<24}{:>16}".format("object", "bytes / object"))
+    for name, factory in measurements:
+        print("{:<24}{:>16.1f}".format(name, measure(factory) / n))
+    print("{:<24}{:>16.1f}".format("cached vertex name", names / n))
+    data = grimm_data(genes=args.genes, genomes=args.genomes)
+    holder = []
+    allocated = measure(lambda: holder.append(GRIMMReader.get_breakpoint_graph(data)))
+    graph = holder[0]
+    number_of_vertices = len(list(graph.nodes()))
+    number_of_edges = len(list(graph.edges()))
+    print("")
+    print("BreakpointGraph with {vertices} vertices and {edges} edges: {total:.1f} MB, "
+          "{per_vertex:.1f} bytes / vertex, {per_edge:.1f} bytes / edge (whole graph is attributed to each)"
+          "".format(vertices=number_of_vertices, edges=number_of_edges, total=allocated / 2 ** 20,
+                    per_vertex=allocated / number_of_vertices, per_edge=allocated / number_of_edges))
+
+
+if __name__ == "__main__":
+    main()
@@ -16,5 +16,7 @@ __all__ = ["grimm",
            "tree",
            "vertices",
            "utils",
-           "distances"]
+           "distances",
+           "storage",
+           "components"]
 
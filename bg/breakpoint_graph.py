@@ -1,14 +1,18 @@
 # -*- coding: utf-8 -*-
 import itertools
+from collections import namedtuple
+from contextlib import contextmanager
 from copy import deepcopy
 
 import networkx as nx
 from networkx import MultiGraph
 
+from bg.components import BGComponentTracker
 from bg.edge import BGEdge, BGEdge_JSON_SCHEMA_JSON_KEY
 from bg.genome import BGGenome, BGGenome_JSON_SCHEMA_JSON_KEY
 from bg.kbreak import KBreak
-from bg.multicolor import Multicolor
+from bg.multicolor import FrozenMulticolor, Multicolor, SplitGuidance
+from bg.storage import CompactMultiGraph, ForkedMultiGraph, FrozenMultiGraph
 from bg.utils import get_from_dict_with_path, merge_fragment_edge_data, recursive_dict_update
 from bg.vertices import BGVertex_JSON_SCHEMA_JSON_KEY, BlockVertex, BGVertex, InfinityVertex, TaggedInfinityVertex, \
     TaggedBlockVertex, TaggedVertex
@@ -18,7 +22,235 @@ __email__ = "aganezov(at)cs.jhu.edu"
 __status__ = "production"
 
 
-class BreakpointGraph(object):
+class BGGraphEvent(namedtuple("BGGraphEvent", ["kind", "vertex1", "vertex2", "key", "multicolor", "previous_multicolor"])):
+    """ A compact record of a single low-level change of a :class:`BreakpointGraph`, that is passed to its subscribers (see :meth:`BreakpointGraph.subscribe`)
+
+    *   ``EDGE_ADDED``: an edge ``(vertex1, vertex2, key)`` with ``multicolor`` was added (``previous_multicolor`` is ``None``)
+    *   ``EDGE_REMOVED``: an edge ``(vertex1, vertex2, key)`` with ``previous_multicolor`` was removed (``multicolor`` is ``None``).
+        An edge, that loses all of its colors on multicolor deletion, is first reported as ``MULTICOLOR_CHANGED`` to an empty multicolor, and then as ``EDGE_REMOVED``
+    *   ``MULTICOLOR_CHANGED``: a multicolor of an edge ``(vertex1, vertex2, key)`` was changed from ``previous_multicolor`` to ``multicolor``
+    *   ``VERTEX_ADDED`` / ``VERTEX_REMOVED``: a ``vertex1`` was explicitly added / removed (all other fields are ``None``). Vertices, that are implicitly created by edge addition, are not reported separately
+
+    Reported multicolors are immutable :class:`bg.multicolor.FrozenMulticolor` objects, stored in the graph.
+    """
+    __slots__ = ()
+
+    EDGE_ADDED = "edge_added"
+    EDGE_REMOVED = "edge_removed"
+    MULTICOLOR_CHANGED = "multicolor_changed"
+    VERTEX_ADDED = "vertex_added"
+    VERTEX_REMOVED = "vertex_removed"
+
+
+class BGGenomeOrdersMixin(object):
+    """ A mixin providing recovery of genomes gene / fragment orders by traversal of a single genome breakpoint graph
+
+    Relies only on ``nodes``, ``get_edges_by_vertex`` and ``get_overall_set_of_colors`` methods of the class it is mixed into,
+    and thus is shared by :class:`BreakpointGraph` and its read-only genome views (:class:`BGGenomeView`).
+    """
+
+    def get_blocks_order(self):
+        genome = set(self.get_overall_set_of_colors()).pop()
+        result = {genome: []}
+        visited_vertices = set()
+        for vertex in self.nodes():
+            if vertex in visited_vertices:
+                continue
+            visited_vertices.add(vertex)
+            chr_type_f, fragment_part_forward = self._traverse_blocks_forward_from_vertex(vertex=vertex,
+                                                                                          visited_vertices=visited_vertices)
+            chr_type_r, fragment_part_reverse = self._traverse_blocks_reverse_from_vertex(vertex=vertex,
+                                                                                          visited_vertices=visited_vertices)
+            if chr_type_f != chr_type_r:
+                raise Exception("During the gene order sequence traversal we got a conflicted situation. "
+                                "Most probably case for this to happen is to have a genome with non-unique gene content")
+            if chr_type_f == "$":
+                fragment = fragment_part_reverse + fragment_part_forward
+            else:
+                fragment = fragment_part_forward if len(fragment_part_forward) > len(
+                    fragment_part_reverse) else fragment_part_reverse
+            result[genome].append((chr_type_f, fragment))
+        return result
+
+    def _traverse_blocks_from_vertex(self, vertex, visited_vertices, direction):
+        result = []
+        current_vertex = vertex
+        visited_vertices.add(current_vertex)
+        if current_vertex.is_irregular_vertex:
+            edge = list(self.get_edges_by_vertex(vertex=current_vertex))[0]
+            current_vertex = edge.vertex1 if edge.vertex1 != current_vertex else edge.vertex2
+            visited_vertices.add(current_vertex)
+        if current_vertex.is_tail_vertex and direction == "forward" or current_vertex.is_head_vertex and direction == "reverse":
+            result.append(("+", current_vertex.block_name))
+            current_vertex = current_vertex.mate_vertex
+            visited_vertices.add(current_vertex)
+        edge = list(self.get_edges_by_vertex(vertex=current_vertex))[0]
+        current_vertex = edge.vertex1 if edge.vertex1 != current_vertex else edge.vertex2
+        while current_vertex not in visited_vertices and current_vertex.is_regular_vertex:
+            visited_vertices.add(current_vertex)
+            if direction == "forward":
+                sign = "+" if current_vertex.is_tail_vertex else "-"
+            elif direction == "reverse":
+                sign = "-" if current_vertex.is_tail_vertex else "+"
+            else:
+                sign = "*"
+            result.append((sign, current_vertex.block_name))
+            current_vertex = current_vertex.mate_vertex
+            visited_vertices.add(current_vertex)
+            edge = list(self.get_edges_by_vertex(vertex=current_vertex))[0]
+            current_vertex = edge.vertex1 if edge.vertex1 != current_vertex else edge.vertex2
+        visited_vertices.add(current_vertex)
+        if current_vertex.is_irregular_vertex:
+            chr_type = "$"
+        else:
+            chr_type = "@"
+        if direction == "reverse":
+            result = result[::-1]
+        return chr_type, result
+
+    def _traverse_blocks_forward_from_vertex(self, vertex, visited_vertices):
+        return self._traverse_blocks_from_vertex(vertex=vertex, visited_vertices=visited_vertices, direction="forward")
+
+    def _traverse_blocks_reverse_from_vertex(self, vertex, visited_vertices):
+        return self._traverse_blocks_from_vertex(vertex=vertex, visited_vertices=visited_vertices, direction="reverse")
+
+    def _traverse_fragments_forward_from_vertex(self, vertex, visited_vertices):
+        return self._traverse_fragments_from_vertex(vertex=vertex, visited_vertices=visited_vertices,
+                                                    direction="forward")
+
+    def _traverse_fragments_reverse_from_vertex(self, vertex, visited_vertices):
+        return self._traverse_fragments_from_vertex(vertex=vertex, visited_vertices=visited_vertices,
+                                                    direction="reverse")
+
+    def get_fragments_orders(self):
+        genome = set(self.get_overall_set_of_colors()).pop()
+        result = {genome: []}
+        visited_vertices = set()
+        ivs = (v for v in self.nodes() if v.is_irregular_vertex)
+        rvs = (v for v in self.nodes() if v.is_regular_vertex)
+        for vertex in itertools.chain(ivs, rvs):
+            if vertex in visited_vertices:
+                continue
+            chr_type_f, fragments_order_part_forward = self._traverse_fragments_forward_from_vertex(vertex=vertex,
+                                                                                                    visited_vertices=visited_vertices)
+            chr_type_r, fragments_order_part_reverse = self._traverse_fragments_reverse_from_vertex(vertex=vertex,
+                                                                                                    visited_vertices=visited_vertices)
+            if chr_type_f != chr_type_r:
+                raise Exception("During the fragment order sequence traversal we got a conflicted situation. "
+                                "Most probably case for this to happen is to have a genome with non-unique gene content")
+            if chr_type_f == "$":
+                if len(fragments_order_part_forward) == 0:
+                    fragment = fragments_order_part_reverse
+                elif len(fragments_order_part_reverse) == 0:
+                    fragment = fragments_order_part_forward
+                else:
+                    coincide = fragments_order_part_reverse[-1][0] == fragments_order_part_forward[0][0]
+                    coincide &= fragments_order_part_reverse[-1][1] == fragments_order_part_forward[0][1]
+                    if coincide:
+                        fragment = fragments_order_part_reverse[:-1] + fragments_order_part_forward
+                    else:
+                        fragment = fragments_order_part_reverse + fragments_order_part_forward
+            else:
+                fragment = fragments_order_part_forward if len(fragments_order_part_forward) > len(
+                    fragments_order_part_reverse) else fragments_order_part_reverse
+                if len(fragment) > 1 and fragment[-1][0] == fragment[0][0] and fragment[-1][1] == fragment[0][1]:
+                    fragment = fragment[:-1]
+            result[genome].append((chr_type_f, fragment))
+        return result
+
+    def _traverse_fragments_from_vertex(self, vertex, visited_vertices, direction):
+        result = []
+        current_vertex = vertex
+        current_fragment_name = None
+        current_fragment_orientation = None
+        if current_vertex.is_tail_vertex and direction == "forward" or current_vertex.is_head_vertex and direction == "reverse":
+            current_vertex = current_vertex.mate_vertex
+        elif not (current_vertex.is_irregular_vertex and current_vertex in visited_vertices):
+            visited_vertices.add(current_vertex)
+            edge = list(self.get_edges_by_vertex(vertex=current_vertex))[0]
+            fragment_names = get_from_dict_with_path(source_dict=edge.data, key="name", path=["fragment"])
+            if not isinstance(fragment_names, list):
+                fragment_names = [fragment_names]
+            fragment_orientations = self._get_fragment_to_edge_orientation(current_vertex=current_vertex, edge=edge)
+            fragment_orientations = self.update_orientation_with_direction(orientation=fragment_orientations,
+                                                                           direction=direction)
+            for name, orientation in zip(fragment_names, fragment_orientations):
+                new_encounter = current_fragment_name != name or current_fragment_orientation != name
+                if name not in [None, ""] and orientation not in [None, ""] and new_encounter:
+                    current_fragment_name = name
+                    current_fragment_orientation = orientation
+                    result.append((current_fragment_orientation, current_fragment_name))
+            current_vertex = edge.vertex1 if edge.vertex1 != current_vertex else edge.vertex2
+            visited_vertices.add(current_vertex)
+            if not current_vertex.is_irregular_vertex:
+                current_vertex = current_vertex.mate_vertex
+        while current_vertex not in visited_vertices and not current_vertex.is_irregular_vertex:
+            visited_vertices.add(current_vertex)
+            edge = list(self.get_edges_by_vertex(vertex=current_vertex))[0]
+            fragment_names = get_from_dict_with_path(source_dict=edge.data, key="name", path=["fragment"])
+            if not isinstance(fragment_names, list):
+                fragment_names = [fragment_names]
+            fragment_orientations = self._get_fragment_to_edge_orientation(current_vertex=current_vertex, edge=edge)
+            fragment_orientations = self.update_orientation_with_direction(orientation=fragment_orientations,
+                                                                           direction=direction)
+            if current_fragment_name == fragment_names[-1]:
+                fragment_names = fragment_names[::-1]
+                fragment_orientations = fragment_orientations[::-1]
+            for name, orientation in zip(fragment_names, fragment_orientations):
+                initial_state = current_fragment_name is None or current_fragment_orientation is None
+                new_encounter = current_fragment_name != name or current_fragment_orientation != orientation
+                new_encounter &= name not in [None, ""] and orientation not in [None, ""]
+                if initial_state or new_encounter:
+                    current_fragment_name = name
+                    current_fragment_orientation = orientation
+                    if current_fragment_name not in [None, ""] and current_fragment_orientation not in [None, ""]:
+                        result.append((current_fragment_orientation, current_fragment_name))
+            current_vertex = edge.vertex1 if edge.vertex1 != current_vertex else edge.vertex2
+            if current_vertex.is_irregular_vertex:
+                break
+            visited_vertices.add(current_vertex)
+            current_vertex = current_vertex.mate_vertex
+
+        visited_vertices.add(current_vertex)
+        if current_vertex.is_irregular_vertex:
+            chr_type = "$"
+        else:
+            chr_type = "@"
+        if direction == "reverse":
+            result = result[::-1]
+        return chr_type, result
+
+    @staticmethod
+    def _get_fragment_to_edge_orientation(current_vertex, edge):
+        v1, v2 = (edge.vertex1, edge.vertex2) if edge.vertex1 == current_vertex else (edge.vertex2, edge.vertex1)
+        forward_orientation = get_from_dict_with_path(source_dict=edge.data, key="forward_orientation",
+                                                      path=["fragment"])
+        if isinstance(forward_orientation, list):
+            return ["+" if BGGenomeOrdersMixin._forward_orientation(v1, v2, orientation) else "-" for orientation in
+                    forward_orientation]
+        else:
+            return ["+" if BGGenomeOrdersMixin._forward_orientation(v1, v2, forward_orientation) else "-"]
+
+    @staticmethod
+    def _forward_orientation(v1, v2, forward_orientation):
+        if forward_orientation is None:
+            return True
+        left_v = v1 not in forward_orientation or forward_orientation[0] == v1
+        right_v = v2 not in forward_orientation or forward_orientation[1] == v2
+        return left_v and right_v
+
+    @staticmethod
+    def update_orientation_with_direction(orientation, direction):
+        result = []
+        for entry in orientation:
+            if direction == "forward":
+                result.append(entry)
+            else:
+                result.append("-" if entry == "+" else "+")
+        return result
+
+
+class BreakpointGraph(BGGenomeOrdersMixin):
     """ Class providing implementation of breakpoint graph data structure and most utilized operations on it.
 
     :class:`BreakpointGraph` anticipates to work with :class:`bg.vertex.BGVertex`, :class:`bg.edge.BGEdge` and :class:`bg.multicolor.Multicolor` classes instances, but is not limited to them. Extreme caution has to be assumed when working with non-expected classes.
@@ -27,9 +259,11 @@ class BreakpointGraph(object):
 
     The engine of graph information storage, low-level algorithms implementation is powered by NetworkX package MultiGraph data structure. This class provides a smart wrapping around it to perform most useful, from combinatorial bioinformatics stand point, operations and manipulations.
 
+    Alternatively, an integer-indexed :class:`bg.storage.CompactMultiGraph` storage engine can be utilized (``backend="compact"``), which keeps vertices and edges records in arrays, while supporting the same set of operations.
+
     Class carries following attributes carrying information about graphs structure:
 
-    *   :attr:`BreakpointGraph.bg`: instance of NetworkX MultiGraph class
+    *   :attr:`BreakpointGraph.bg`: instance of NetworkX MultiGraph class (or :class:`bg.storage.CompactMultiGraph` instance for ``compact`` backend)
 
     Main operations:
 
@@ -64,18 +298,49 @@ class BreakpointGraph(object):
                              "TaggedBlockVertexJSONSchema": TaggedBlockVertex.TaggedBlockVertexJSONSchema,
                              "TaggedInfinityVertexJSONSchema": TaggedInfinityVertex.TaggedInfinityVertexJSONSchema}
 
-    def __init__(self, graph=None):
+    # class wide dict of storage engines, that can power the breakpoint graph, and a name of the one used by default
+    # both can be updated on the fly, for example to make all newly created graphs (including ones produced by GRIMMReader) compact
+    backends = {"networkx": MultiGraph,
+                "compact": CompactMultiGraph}
+    default_backend = "networkx"
+
+    def __init__(self, graph=None, backend=None):
         """ Initialization of a :class:`BreakpointGraph` object.
 
         :param graph: is supplied, :class:`BreakpointGraph` is initialized with supplied or brand new (empty) instance of NetworkX MultiGraph.
         :type graph: instance of NetworkX MultiGraph is expected.
+        :param backend: name of storage engine (from :attr:`BreakpointGraph.backends`) to create an empty graph with, if no ``graph`` is supplied. :attr:`BreakpointGraph.default_backend` is used by default.
+        :type backend: ``str``
+        :raises: ``ValueError`` if unknown backend is specified
         """
         self.cache = {}
         self.cache_valid = {}
         if graph is None:
-            self.bg = MultiGraph()
+            backend = self.default_backend if backend is None else backend
+            if backend not in self.backends:
+                raise ValueError("Unknown BreakpointGraph backend `{backend}`. Available are: {backends}"
+                                 "".format(backend=backend, backends=", ".join(sorted(self.backends))))
+            self.bg = self.backends[backend]()
         else:
             self.bg = graph
+            backend = next((name for name, graph_class in self.backends.items() if type(graph) is graph_class), None)
+        # name of a storage engine, current graph was created with (or derived from, for forked and frozen graphs), ``None`` if unknown
+        self.__backend = backend
+        # name -> vertex index, that is lazily built from the underlying graph on first lookup, and is maintained on every
+        # vertex insertion / removal afterwards
+        self.__vertex_index = None
+        # color -> edges index, where each edge is identified by a ``(vertex1, vertex2, key)`` handle
+        # it is lazily built on first per-genome (or colors) request, and is maintained by edges insertion / removal / multicolor change primitives afterwards
+        # number of handles, kept for each color, serves as a reference count of that color in current graph
+        self.__color_index = None
+        # an opt-in incremental connected components tracker, that is notified by the same primitives
+        self.__components_tracker = None
+        # a journal of performed primitive changes, that is kept only while there are active checkpoints (see `checkpoint` method)
+        self.__journal = None
+        self.__checkpoints = []
+        self.__last_checkpoint_id = 0
+        # callables, that are notified about every primitive change (see `subscribe` method)
+        self.__subscribers = []
 
     def __edges(self, nbunch=None, keys=False):
         """ Iterates over edges in current :class:`BreakpointGraph` instance.
@@ -89,14 +354,59 @@ class BreakpointGraph(object):
         :return: generator over edges in current :class:`BreakpointGraph`
         :rtype: ``generator``
         """
-        for v1, v2, key, data in self.bg.edges(nbunch=nbunch, data=True, keys=True):
-            bgedge = BGEdge(vertex1=v1, vertex2=v2, multicolor=data["attr_dict"]["multicolor"],
-                            data=data["attr_dict"]["data"])
+        for v1, v2, key, multicolor, data in self.__iter_edges_raw(nbunch=nbunch):
+            bgedge = BGEdge(vertex1=v1, vertex2=v2, multicolor=multicolor, data=data)
             if not keys:
                 yield bgedge
             else:
                 yield bgedge, key
 
+    def __iter_edges_raw(self, nbunch=None):
+        """ Iterates over edges in current :class:`BreakpointGraph` instance as plain ``(vertex1, vertex2, key, multicolor, data)`` tuples.
+
+        No :class:`bg.edge.BGEdge` objects are created. If the underlying storage can provide plain edge records on its own (as :class:`bg.storage.CompactMultiGraph` does), no per-edge attribute views are created either.
+
+        :param nbunch: a vertex to iterate over edges outgoing from, if not provided, iteration over all edges is performed.
+        :type nbunch: any hashable python object
+        :return: generator over ``(vertex1, vertex2, key, multicolor, data)`` tuples
+        :rtype: ``generator``
+        """
+        edge_records = getattr(self.bg, "edge_records", None)
+        if edge_records is not None:
+            for record in edge_records(nbunch=nbunch):
+                yield record
+        else:
+            for v1, v2, key, attributes in self.bg.edges(nbunch=nbunch, data="attr_dict", keys=True):
+                yield v1, v2, key, attributes["multicolor"], attributes["data"]
+
+    def iter_edges_raw(self, nbunch=None):
+        """ Iterates over edges in current :class:`BreakpointGraph` instance as plain ``(vertex1, vertex2, key, multicolor, data)`` tuples.
+
+        Proxies a call to :meth:`BreakpointGraph._BreakpointGraph__iter_edges_raw`.
+
+        Yielded ``multicolor`` and ``data`` objects are the ones stored in current :class:`BreakpointGraph`, and must not be modified.
+
+        :param nbunch: a vertex to iterate over edges outgoing from, if not provided, iteration over all edges is performed.
+        :type nbunch: any hashable python object
+        :return: generator over ``(vertex1, vertex2, key, multicolor, data)`` tuples
+        :rtype: ``generator``
+        """
+        return self.__iter_edges_raw(nbunch=nbunch)
+
+    def iter_incident_raw(self, vertex):
+        """ Iterates over edges, that are incident to supplied vertex, as plain ``(vertex, neighbour, key, multicolor, data)`` tuples.
+
+        Yielded ``multicolor`` and ``data`` objects are the ones stored in current :class:`BreakpointGraph`, and must not be modified.
+
+        :param vertex: a vertex object in current :class:`BreakpointGraph` object
+        :type vertex: any hashable object. :class:`bg.vertex.BGVertex` object is expected.
+        :return: generator over ``(vertex, neighbour, key, multicolor, data)`` tuples (empty, if supplied vertex is not present in current :class:`BreakpointGraph`)
+        :rtype: ``generator``
+        """
+        if vertex not in self.bg:
+            return iter(())
+        return self.__iter_edges_raw(nbunch=[vertex])
+
     def edges(self, nbunch=None, keys=False):
         """ Iterates over edges in current :class:`BreakpointGraph` instance.
 
@@ -151,42 +461,436 @@ class BreakpointGraph(object):
         """
         if bgedge.vertex1 in self.bg and bgedge.vertex2 in self.bg[bgedge.vertex1] and merge:
             key = min(self.bg[bgedge.vertex1][bgedge.vertex2].keys())
-            self.bg[bgedge.vertex1][bgedge.vertex2][key]["attr_dict"]["multicolor"] += bgedge.multicolor
-            self.bg[bgedge.vertex1][bgedge.vertex2][key]["attr_dict"]["data"] = {}
+            self.__change_edge_multicolor(vertex1=bgedge.vertex1, vertex2=bgedge.vertex2, key=key,
+                                          multicolor=bgedge.multicolor)
+            self.__set_edge_data(vertex1=bgedge.vertex1, vertex2=bgedge.vertex2, key=key, data={})
         else:
-            self.bg.add_edge(bgedge.vertex1, bgedge.vertex2, attr_dict={"multicolor": deepcopy(bgedge.multicolor),
-                                                                        "data": bgedge.data})
+            self.__insert_edge(vertex1=bgedge.vertex1, vertex2=bgedge.vertex2,
+                               multicolor=bgedge.multicolor, data=bgedge.data)
         self.cache_valid["overall_set_of_colors"] = False
 
-    def add_bgedge(self, bgedge, merge=True):
-        """ Adds supplied :class:`bg.edge.BGEdge` object to current instance of :class:`BreakpointGraph`.
+    def __add_bgedges(self, bgedges, merge=True):
+        """ Adds supplied :class:`bg.edge.BGEdge` objects to current instance of :class:`BreakpointGraph`.
 
-        Proxies a call to :meth:`BreakpointGraph._BreakpointGraph__add_bgedge` method.
+        Result is the same, as if supplied edges were added one by one with :meth:`BreakpointGraph._BreakpointGraph__add_bgedge` method.
+        If **merge** option is provided, supplied edges are first grouped by pairs of vertices they connect (in order of first appearance), multicolors in each group are merged at once,
+        and a single edge insertion (or multicolor change of the first existing edge between respective vertices) is performed per group.
 
-        :param bgedge: instance of :class:`bg.edge.BGEdge` infromation form which is to be added to current :class:`BreakpointGraph`
-        :type bgedge: :class:`bg.edge.BGEdge`
+        :param bgedges: :class:`bg.edge.BGEdge` instances infromation form which is to be added to current :class:`BreakpointGraph`
+        :type bgedges: iterable of :class:`bg.edge.BGEdge`
         :param merge: a flag to merge supplied information from multi-color perspective into a first existing edge between two supplied vertices
         :type merge: ``Boolean``
         :return: ``None``, performs inplace changes
         """
-        self.__add_bgedge(bgedge=bgedge, merge=merge)
+        if not merge:
+            for bgedge in bgedges:
+                self.__insert_edge(vertex1=bgedge.vertex1, vertex2=bgedge.vertex2,
+                                   multicolor=bgedge.multicolor, data=bgedge.data)
+        else:
+            groups = {}
+            for bgedge in bgedges:
+                pair = frozenset((bgedge.vertex1, bgedge.vertex2))
+                if pair in groups:
+                    groups[pair][2].append(bgedge.multicolor)
+                else:
+                    groups[pair] = (bgedge.vertex1, bgedge.vertex2, [bgedge.multicolor], bgedge.data)
+            for vertex1, vertex2, multicolors, data in groups.values():
+                if vertex1 in self.bg and vertex2 in self.bg[vertex1]:
+                    key = min(self.bg[vertex1][vertex2].keys())
+                    self.__change_edge_multicolor(vertex1=vertex1, vertex2=vertex2, key=key,
+                                                  multicolor=Multicolor.merge(*multicolors))
+                    self.__set_edge_data(vertex1=vertex1, vertex2=vertex2, key=key, data={})
+                elif len(multicolors) == 1:
+                    self.__insert_edge(vertex1=vertex1, vertex2=vertex2, multicolor=multicolors[0], data=data)
+                else:
+                    ############################################################################################################
+                    #
+                    # as edges are merged, data of the first of them is not kept, the same way it happens on one by one addition
+                    #
+                    ############################################################################################################
+                    self.__insert_edge(vertex1=vertex1, vertex2=vertex2, multicolor=Multicolor.merge(*multicolors),
+                                       data={})
+        self.cache_valid["overall_set_of_colors"] = False
 
-    def __get_vertex_by_name(self, vertex_name):
-        """ Obtains a vertex object by supplied label
+    ############################################################################################################
+    #
+    # all structural changes of the underlying graph are performed through the following primitives
+    # (edge insertion / removal, in place edge multicolor / data change and vertex removal), so that all indices, that are
+    # kept alongside with the underlying graph (name -> vertex, color -> edges), are always up to date
+    # and every change can be recorded in the journal, if there are active checkpoints
+    #
+    ############################################################################################################
 
-        Returns a :class:`bg.vertex.BGVertex` or its subclass instance
+    def __insert_edge(self, vertex1, vertex2, multicolor, data, key=None):
+        """ Adds a new edge with supplied multicolor and data (and unique identifier, if supplied) into the underlying graph and indices
 
-        :param vertex_name: a vertex label it is identified by.
-        :type vertex_name: any hashable python object. ``str`` expected.
-        :return: vertex with supplied label if present in current :class:`BreakpointGraph`, ``None`` otherwise
+        Supplied multicolor is stored as a :class:`bg.multicolor.FrozenMulticolor`, so that it is never shared with the caller, while being shared by reference among edges, forks and copies.
+
+        :return: unique (among edges between supplied vertices) identifier of the new edge
+        :rtype: ``int``
         """
-        vertex_class = BGVertex.get_vertex_class_from_vertex_name(vertex_name)
-        data = vertex_name.split(BlockVertex.NAME_SEPARATOR)
-        root_name, data = data[0], data[1:]
-        if issubclass(vertex_class, TaggedVertex):
-            tags = [entry.split(TaggedVertex.TAG_SEPARATOR) for entry in data]
-            for tag_entry in tags:
-                if len(tag_entry) == 1:
+        multicolor = FrozenMulticolor.freeze(multicolor)
+        if self.__journal is not None:
+            new_vertices = [vertex for vertex in {vertex1: None, vertex2: None} if vertex not in self.bg]
+        key = self.bg.add_edge(vertex1, vertex2, key=key, attr_dict={"multicolor": multicolor, "data": data})
+        if self.__journal is not None:
+            self.__journal.append(("insert_edge", vertex1, vertex2, key, new_vertices))
+        self.__index_vertex(vertex1)
+        self.__index_vertex(vertex2)
+        self.__index_edge_colors(vertex1=vertex1, vertex2=vertex2, key=key, colors=multicolor.colors)
+        if self.__components_tracker is not None:
+            self.__components_tracker.add_edge(vertex1, vertex2)
+        if self.__subscribers:
+            self.__emit(BGGraphEvent(BGGraphEvent.EDGE_ADDED, vertex1, vertex2, key, multicolor, None))
+        return key
+
+    def __remove_edge(self, vertex1, vertex2, key):
+        """ Removes an edge, specified by its unique identifier, from the underlying graph and indices """
+        attributes = self.bg[vertex1][vertex2][key]["attr_dict"]
+        multicolor, data = attributes["multicolor"], attributes["data"]
+        self.bg.remove_edge(vertex1, vertex2, key=key)
+        if self.__journal is not None:
+            self.__journal.append(("remove_edge", vertex1, vertex2, key, multicolor, data))
+        self.__unindex_edge_colors(vertex1=vertex1, vertex2=vertex2, key=key, colors=multicolor.colors)
+        if self.__components_tracker is not None:
+            self.__components_tracker.remove_edge(vertex1, vertex2)
+        if self.__subscribers:
+            self.__emit(BGGraphEvent(BGGraphEvent.EDGE_REMOVED, vertex1, vertex2, key, None, multicolor))
+
+    def __change_edge_multicolor(self, vertex1, vertex2, key, multicolor, subtract=False):
+        """ Merges supplied multicolor into (or subtracts it from, if ``subtract`` flag is set) a multicolor of an edge, specified by its unique identifier
+
+        :return: the multicolor of the changed edge
+        :rtype: :class:`bg.multicolor.Multicolor`
+        """
+        attributes = self.bg[vertex1][vertex2][key]["attr_dict"]
+        previous_multicolor = attributes["multicolor"]
+        if subtract:
+            new_multicolor = FrozenMulticolor.freeze(previous_multicolor - multicolor)
+        else:
+            new_multicolor = FrozenMulticolor.freeze(previous_multicolor + multicolor)
+        self.__replace_edge_attributes(vertex1=vertex1, vertex2=vertex2, key=key, multicolor=new_multicolor,
+                                       data=attributes["data"])
+        if self.__journal is not None:
+            if subtract:
+                # subtraction is not exactly reversible (multiplicities are cut at zero), so the actually removed portion is recorded
+                self.__journal.append(("change_multicolor", vertex1, vertex2, key,
+                                       previous_multicolor - new_multicolor, True))
+            else:
+                self.__journal.append(("change_multicolor", vertex1, vertex2, key, Multicolor.merge(multicolor), False))
+        colors_before, colors_after = previous_multicolor.colors, new_multicolor.colors
+        self.__unindex_edge_colors(vertex1=vertex1, vertex2=vertex2, key=key, colors=colors_before - colors_after)
+        self.__index_edge_colors(vertex1=vertex1, vertex2=vertex2, key=key, colors=colors_after - colors_before)
+        if self.__components_tracker is not None:
+            self.__components_tracker.touch(vertex1)
+        if self.__subscribers:
+            self.__emit(BGGraphEvent(BGGraphEvent.MULTICOLOR_CHANGED, vertex1, vertex2, key, new_multicolor,
+                                     previous_multicolor))
+        return new_multicolor
+
+    def __set_edge_data(self, vertex1, vertex2, key, data):
+        """ Replaces a data dict of an edge, specified by its unique identifier """
+        attributes = self.bg[vertex1][vertex2][key]["attr_dict"]
+        previous_data = attributes["data"]
+        self.__replace_edge_attributes(vertex1=vertex1, vertex2=vertex2, key=key, multicolor=attributes["multicolor"],
+                                       data=data)
+        if self.__journal is not None:
+            self.__journal.append(("set_data", vertex1, vertex2, key, previous_data))
+
+    def __replace_edge_attributes(self, vertex1, vertex2, key, multicolor, data):
+        """ Replaces a record of an existing edge, specified by its unique identifier, with a new one
+
+        Stored records are never changed inplace (and multicolors in them are immutable :class:`bg.multicolor.FrozenMulticolor` objects), so that they can be safely shared among forked graphs (see :meth:`BreakpointGraph.fork`).
+        """
+        self.bg.add_edge(vertex1, vertex2, key=key, attr_dict={"multicolor": multicolor, "data": data})
+
+    def __get_color_index(self):
+        """ Provides access to the color -> edges index, building it from the underlying graph if it was not built yet """
+        if self.__color_index is None:
+            self.__color_index = {}
+            for vertex1, vertex2, key, multicolor, _ in self.__iter_edges_raw():
+                self.__index_edge_colors(vertex1=vertex1, vertex2=vertex2, key=key, colors=multicolor.colors)
+        return self.__color_index
+
+    def __index_edge_colors(self, vertex1, vertex2, key, colors):
+        """ Records an edge, specified by its unique identifier, under each of supplied colors in the color -> edges index (if such index is built) """
+        if self.__color_index is None:
+            return
+        for color in colors:
+            self.__color_index.setdefault(color, {})[(vertex1, vertex2, key)] = None
+
+    def __unindex_edge_colors(self, vertex1, vertex2, key, colors):
+        """ Removes an edge, specified by its unique identifier, from the color -> edges index entries for each of supplied colors
+
+        As an edge may be referenced in both orientations, both respective handles are checked.
+        """
+        if self.__color_index is None:
+            return
+        for color in colors:
+            color_edges = self.__color_index.get(color, {})
+            if (vertex1, vertex2, key) in color_edges:
+                del color_edges[(vertex1, vertex2, key)]
+            else:
+                color_edges.pop((vertex2, vertex1, key), None)
+
+    def __get_vertex_index(self):
+        """ Provides access to the name -> vertex index, building it from the underlying graph if it was not built yet """
+        if self.__vertex_index is None:
+            self.__vertex_index = {}
+            for vertex in self.bg.nodes():
+                self.__index_vertex(vertex)
+        return self.__vertex_index
+
+    def __index_vertex(self, vertex):
+        """ Records a vertex, that is present in current :class:`BreakpointGraph`, in the name -> vertex index (if such index is built)
+
+        If a vertex with the same name is already indexed, the instance, that was stored in the graph first, is kept.
+        """
+        if self.__vertex_index is not None and isinstance(vertex, BGVertex):
+            self.__vertex_index.setdefault(vertex.name, vertex)
+
+    def __remove_vertex(self, vertex):
+        """ Removes a vertex (alongside with all edges incident to it) from current :class:`BreakpointGraph` and the name -> vertex index """
+        for _, neighbour, key, _, _ in list(self.iter_incident_raw(vertex=vertex)):
+            self.__remove_edge(vertex1=vertex, vertex2=neighbour, key=key)
+        if self.__journal is not None:
+            self.__journal.append(("remove_vertex", vertex))
+        self.bg.remove_node(vertex)
+        if self.__components_tracker is not None:
+            self.__components_tracker.remove_vertex(vertex, neighbours=[])
+        if self.__vertex_index is not None and isinstance(vertex, BGVertex):
+            self.__vertex_index.pop(vertex.name, None)
+        if self.__subscribers:
+            self.__emit(BGGraphEvent(BGGraphEvent.VERTEX_REMOVED, vertex, None, None, None, None))
+
+    def __add_vertex(self, vertex):
+        """ Adds a vertex (without any edges incident to it) into the underlying graph and indices """
+        self.bg.add_node(vertex)
+        self.__index_vertex(vertex)
+        if self.__components_tracker is not None:
+            self.__components_tracker.add_vertex(vertex)
+        if self.__subscribers:
+            self.__emit(BGGraphEvent(BGGraphEvent.VERTEX_ADDED, vertex, None, None, None, None))
+
+    def __undo(self, record):
+        """ Reverts a single primitive change, recorded in the journal """
+        operation, arguments = record[0], record[1:]
+        if operation == "insert_edge":
+            vertex1, vertex2, key, new_vertices = arguments
+            self.__remove_edge(vertex1=vertex1, vertex2=vertex2, key=key)
+            for vertex in new_vertices:
+                self.__remove_vertex(vertex)
+        elif operation == "remove_edge":
+            vertex1, vertex2, key, multicolor, data = arguments
+            self.__insert_edge(vertex1=vertex1, vertex2=vertex2, multicolor=multicolor, data=data, key=key)
+        elif operation == "change_multicolor":
+            vertex1, vertex2, key, multicolor, subtract = arguments
+            self.__change_edge_multicolor(vertex1=vertex1, vertex2=vertex2, key=key, multicolor=multicolor,
+                                          subtract=not subtract)
+        elif operation == "set_data":
+            vertex1, vertex2, key, data = arguments
+            self.__set_edge_data(vertex1=vertex1, vertex2=vertex2, key=key, data=data)
+        elif operation == "remove_vertex":
+            self.__add_vertex(arguments[0])
+
+    def __get_checkpoint_index(self, checkpoint):
+        if checkpoint is None:
+            if len(self.__checkpoints) == 0:
+                raise ValueError("There are no active checkpoints in current BreakpointGraph")
+            return len(self.__checkpoints) - 1
+        for index, (checkpoint_id, _) in enumerate(self.__checkpoints):
+            if checkpoint_id == checkpoint:
+                return index
+        raise ValueError("Checkpoint `{checkpoint}` is not active in current BreakpointGraph"
+                         "".format(checkpoint=checkpoint))
+
+    def checkpoint(self):
+        """ Creates a checkpoint, that current :class:`BreakpointGraph` can be later rolled back to
+
+        While there are active checkpoints, all low-level changes (edges insertion / deletion, multicolor and data changes, vertices removal), that are performed by any method of current :class:`BreakpointGraph`
+        (:meth:`BreakpointGraph.apply_kbreak`, :meth:`BreakpointGraph.split_bgedge`, :meth:`BreakpointGraph.merge_all_edges_between_two_vertices`, etc.), are recorded in a journal.
+        Thus the rollback costs O(number of changes) and not O(size of the graph), as deep copying does.
+        Checkpoints can be nested. Changes, that are performed directly on the underlying graph (:attr:`BreakpointGraph.bg`), are not recorded.
+
+        :return: an identifier of created checkpoint
+        :rtype: ``int``
+        """
+        if self.__journal is None:
+            self.__journal = []
+        self.__last_checkpoint_id += 1
+        self.__checkpoints.append((self.__last_checkpoint_id, len(self.__journal)))
+        return self.__last_checkpoint_id
+
+    def rollback(self, checkpoint=None):
+        """ Reverts all changes, performed on current :class:`BreakpointGraph` since the supplied (or the latest, if not supplied) checkpoint was created
+
+        Supplied checkpoint, as well as all checkpoints created after it, become inactive.
+
+        :param checkpoint: an identifier of a checkpoint to roll back to
+        :type checkpoint: ``int``
+        :return: ``None``, performs inplace changes
+        :raises: ``ValueError``, if supplied checkpoint is not active
+        """
+        index = self.__get_checkpoint_index(checkpoint=checkpoint)
+        position = self.__checkpoints[index][1]
+        del self.__checkpoints[index:]
+        journal, self.__journal = self.__journal, None
+        try:
+            while len(journal) > position:
+                self.__undo(journal.pop())
+        finally:
+            self.__journal = journal if len(self.__checkpoints) > 0 else None
+            self.cache_valid["overall_set_of_colors"] = False
+
+    def commit(self, checkpoint=None):
+        """ Makes supplied (or the latest, if not supplied) checkpoint inactive, keeping all changes, performed since it was created
+
+        Changes still can be reverted by a rollback to any of the earlier checkpoints. Once there are no active checkpoints, no changes are recorded.
+
+        :param checkpoint: an identifier of a checkpoint to be released
+        :type checkpoint: ``int``
+        :return: ``None``
+        :raises: ``ValueError``, if supplied checkpoint is not active
+        """
+        index = self.__get_checkpoint_index(checkpoint=checkpoint)
+        del self.__checkpoints[index:]
+        if len(self.__checkpoints) == 0:
+            self.__journal = None
+
+    @contextmanager
+    def transaction(self):
+        """ A context manager, that rolls current :class:`BreakpointGraph` back, if an exception is raised inside the managed block, and keeps all changes otherwise
+
+        Yields an identifier of the respective checkpoint, so that changes can be reverted explicitly inside the block with :meth:`BreakpointGraph.rollback`.
+        """
+        checkpoint = self.checkpoint()
+        try:
+            yield checkpoint
+        except Exception:
+            if any(checkpoint_id == checkpoint for checkpoint_id, _ in self.__checkpoints):
+                self.rollback(checkpoint=checkpoint)
+            raise
+        else:
+            if any(checkpoint_id == checkpoint for checkpoint_id, _ in self.__checkpoints):
+                self.commit(checkpoint=checkpoint)
+
+    def fork(self):
+        """ Creates a copy-on-write copy of current :class:`BreakpointGraph`
+
+        Underlying graph of current :class:`BreakpointGraph` is frozen and becomes a shared base for two :class:`bg.storage.ForkedMultiGraph` layers:
+        one powers current :class:`BreakpointGraph` from now on, the other one powers the fork. Thus the fork costs O(1), and afterwards every change, performed on either graph,
+        copies adjacencies of affected vertices only (O(degree) of each of them), while the rest of the graph stays shared. Changes of one graph are never visible in the other one.
+
+        Multicolor (immutable :class:`bg.multicolor.FrozenMulticolor`) and data objects of edges are shared among forks. :class:`BreakpointGraph` methods never change data inplace, and neither shall the user.
+        Layers do not pile up along chains of forks: once their number reaches :attr:`bg.storage.ForkedMultiGraph.MAX_DEPTH`, they are compacted into a single one.
+        A fork does not inherit checkpoints or components tracking of current :class:`BreakpointGraph`.
+        If current :class:`BreakpointGraph` is frozen (see :meth:`BreakpointGraph.freeze`), its storage serves as a base as is, and current graph is left untouched.
+
+        :return: a new :class:`BreakpointGraph`, that holds the same edges as current one
+        :rtype: :class:`BreakpointGraph`
+        """
+        if self.is_frozen:
+            result = self.__class__(graph=ForkedMultiGraph(base=self.bg))
+        else:
+            base = self.bg
+            while isinstance(base, ForkedMultiGraph) and base.is_pristine():
+                base = base.base
+            self.bg = ForkedMultiGraph(base=base)
+            if self.__components_tracker is not None:
+                self.__components_tracker.graph = self.bg
+            result = self.__class__(graph=ForkedMultiGraph(base=base))
+        result.__backend = self.__backend
+        return result
+
+    def freeze(self):
+        """ Creates an immutable snapshot of current :class:`BreakpointGraph`
+
+        Underlying graph of a snapshot is a :class:`bg.storage.FrozenMultiGraph`, that keeps adjacency of every vertex as a sorted array slice, rather than nested dictionaries.
+        All lazily built structures (name -> vertex index, color -> edges index, the overall set of colors and connected components labels (see :meth:`BreakpointGraph.enable_components_tracking`))
+        are precomputed, so that no read-only method of a snapshot changes its state, and it can be shared among threads without any locking.
+        Every attempt to change a snapshot raises ``NetworkXError``. Mutable copies of a snapshot can be cheaply obtained with :meth:`BreakpointGraph.fork`.
+
+        Snapshot is independent of current :class:`BreakpointGraph`: further changes of either of them are not visible in the other one.
+
+        :return: a frozen copy of current :class:`BreakpointGraph` (or current :class:`BreakpointGraph` itself, if it is frozen already)
+        :rtype: :class:`BreakpointGraph`
+        """
+        if self.is_frozen:
+            return self
+        result = self.__class__(graph=FrozenMultiGraph(graph=self.bg))
+        result.__backend = self.__backend
+        result.__get_vertex_index()
+        result.__get_color_index()
+        result.get_overall_set_of_colors()
+        result.enable_components_tracking()
+        return result
+
+    @property
+    def is_frozen(self):
+        """ A flag indicating if current :class:`BreakpointGraph` is an immutable snapshot, produced by :meth:`BreakpointGraph.freeze` """
+        return isinstance(self.bg, FrozenMultiGraph)
+
+    def add_bgedge(self, bgedge, merge=True):
+        """ Adds supplied :class:`bg.edge.BGEdge` object to current instance of :class:`BreakpointGraph`.
+
+        Proxies a call to :meth:`BreakpointGraph._BreakpointGraph__add_bgedge` method.
+
+        :param bgedge: instance of :class:`bg.edge.BGEdge` infromation form which is to be added to current :class:`BreakpointGraph`
+        :type bgedge: :class:`bg.edge.BGEdge`
+        :param merge: a flag to merge supplied information from multi-color perspective into a first existing edge between two supplied vertices
+        :type merge: ``Boolean``
+        :return: ``None``, performs inplace changes
+        """
+        self.__add_bgedge(bgedge=bgedge, merge=merge)
+
+    def add_bgedges(self, bgedges, merge=True):
+        """ Adds supplied :class:`bg.edge.BGEdge` objects to current instance of :class:`BreakpointGraph` in bulk.
+
+        Proxies a call to :meth:`BreakpointGraph._BreakpointGraph__add_bgedges` method.
+
+        :param bgedges: :class:`bg.edge.BGEdge` instances infromation form which is to be added to current :class:`BreakpointGraph`
+        :type bgedges: iterable of :class:`bg.edge.BGEdge`
+        :param merge: a flag to merge supplied information from multi-color perspective into a first existing edge between two supplied vertices
+        :type merge: ``Boolean``
+        :return: ``None``, performs inplace changes
+        """
+        self.__add_bgedges(bgedges=bgedges, merge=merge)
+
+    def __get_vertex_by_name(self, vertex_name):
+        """ Obtains a vertex object by supplied label
+
+        Returns a :class:`bg.vertex.BGVertex` or its subclass instance
+
+        A lookup in the name -> vertex index is performed first.
+        Only if it is unsuccessful (label specifies tags in a non canonical order, or the underlying graph was changed directly), a vertex is recovered from the supplied label.
+
+        :param vertex_name: a vertex label it is identified by.
+        :type vertex_name: any hashable python object. ``str`` expected.
+        :return: vertex with supplied label if present in current :class:`BreakpointGraph`, ``None`` otherwise
+        """
+        vertex_index = self.__get_vertex_index()
+        result = vertex_index.get(vertex_name, None)
+        if result is not None and result in self.bg:
+            return result
+        result = self.__recover_vertex_by_name(vertex_name=vertex_name)
+        if result is not None and not self.is_frozen:
+            vertex_index[vertex_name] = result
+        return result
+
+    def __recover_vertex_by_name(self, vertex_name):
+        """ Obtains a vertex object by parsing supplied label and looking up a respective vertex in the underlying graph
+
+        :param vertex_name: a vertex label it is identified by.
+        :type vertex_name: any hashable python object. ``str`` expected.
+        :return: vertex with supplied label if present in current :class:`BreakpointGraph`, ``None`` otherwise
+        """
+        vertex_class = BGVertex.get_vertex_class_from_vertex_name(vertex_name)
+        data = vertex_name.split(BlockVertex.NAME_SEPARATOR)
+        root_name, data = data[0], data[1:]
+        if issubclass(vertex_class, TaggedVertex):
+            tags = [entry.split(TaggedVertex.TAG_SEPARATOR) for entry in data]
+            for tag_entry in tags:
+                if len(tag_entry) == 1:
                     tag_entry.append(None)
                 elif len(tag_entry) > 2:
                     tag_entry[1:] = [TaggedVertex.TAG_SEPARATOR.join(tag_entry[1:])]
@@ -257,6 +961,23 @@ class BreakpointGraph(object):
         """
         return self.__get_edge_by_two_vertices(vertex1=vertex1, vertex2=vertex2, key=key)
 
+    def __get_edges_attributes_between_two_vertices(self, vertex1, vertex2):
+        """ Obtains a ``key -> edge attributes`` mapping for all edges between two supplied vertices
+
+        Underlying storage keeps edges indexed by pairs of vertices they connect (NetworkX MultiGraph adjacency, :class:`bg.storage.CompactMultiGraph` pair index),
+        so the lookup is performed in O(1) and iteration over the result costs O(number of parallel edges) rather than O(degree of ``vertex1``).
+
+        :param vertex1: a first vertex out of two, edges of interest are incident to
+        :type vertex1: any hashable object, :class:`bg.vertex.BGVertex` is expected
+        :param vertex2: a second vertex out of two, edges of interest are incident to
+        :type vertex2: any hashable object, :class:`bg.vertex.BGVertex` is expected
+        :return: a mapping from edge keys to their attributes (empty, if there are no edges between supplied vertices)
+        :rtype: ``Mapping``
+        """
+        if vertex1 not in self.bg:
+            return {}
+        return self.bg[vertex1].get(vertex2, {})
+
     def __get_edges_by_vertex(self, vertex, keys=False):
         """ Iterates over edges that are incident to supplied vertex argument in current :class:`BreakpointGraph`
 
@@ -269,15 +990,12 @@ class BreakpointGraph(object):
         :return: generator over edges (tuples ``edge, edge_id`` if keys specified) in current :class:`BreakpointGraph` wrapped in :class:`bg.vertex.BGEVertex`
         :rtype: ``generator``
         """
-        if vertex in self.bg:
-            for vertex2, edges in self.bg[vertex].items():
-                for key, data in self.bg[vertex][vertex2].items():
-                    bg_edge = BGEdge(vertex1=vertex, vertex2=vertex2, multicolor=data["attr_dict"]["multicolor"],
-                                     data=data["attr_dict"]["data"])
-                    if keys:
-                        yield bg_edge, key
-                    else:
-                        yield bg_edge
+        for _, vertex2, key, multicolor, data in self.iter_incident_raw(vertex=vertex):
+            bg_edge = BGEdge(vertex1=vertex, vertex2=vertex2, multicolor=multicolor, data=data)
+            if keys:
+                yield bg_edge, key
+            else:
+                yield bg_edge
 
     def get_edges_by_vertex(self, vertex, keys=False):
         """ Iterates over edges that are incident to supplied vertex argument in current :class:`BreakpointGraph`
@@ -313,12 +1031,13 @@ class BreakpointGraph(object):
             if vertex not in self.bg:
                 raise ValueError("Supplied vertex ({vertex_name}) is not present in current BreakpointGraph"
                                  "".format(vertex_name=str(vertex.name)))
-        for bgedge, key in self.__get_edges_by_vertex(vertex=vertex1, keys=True):
-            if bgedge.vertex2 == vertex2:
-                if keys:
-                    yield bgedge, key
-                else:
-                    yield bgedge
+        for key, data in list(self.__get_edges_attributes_between_two_vertices(vertex1=vertex1, vertex2=vertex2).items()):
+            bgedge = BGEdge(vertex1=vertex1, vertex2=vertex2, multicolor=data["attr_dict"]["multicolor"],
+                            data=data["attr_dict"]["data"])
+            if keys:
+                yield bgedge, key
+            else:
+                yield bgedge
 
     def edges_between_two_vertices(self, vertex1, vertex2, keys=False):
         """ Iterates over edges between two supplied vertices in current :class:`BreakpointGraph`
@@ -337,20 +1056,171 @@ class BreakpointGraph(object):
         for entry in self.__edges_between_two_vertices(vertex1=vertex1, vertex2=vertex2, keys=keys):
             yield entry
 
+    def enable_components_tracking(self):
+        """ Turns on incremental tracking of connected components of current :class:`BreakpointGraph`
+
+        Once enabled, component ids of vertices are maintained by all methods, that change current :class:`BreakpointGraph` (edges addition / deletion / splitting / merging, k-breaks application),
+        and only the portion of the graph around a deleted edge is inspected to detect a split of a component.
+        Changes, that are performed directly on the underlying graph (:attr:`BreakpointGraph.bg`), are not tracked.
+
+        :return: a components tracker of current :class:`BreakpointGraph`
+        :rtype: :class:`bg.components.BGComponentTracker`
+        """
+        if self.__components_tracker is None:
+            self.__components_tracker = BGComponentTracker(graph=self.bg)
+        return self.__components_tracker
+
+    def disable_components_tracking(self):
+        """ Turns off incremental tracking of connected components of current :class:`BreakpointGraph`
+
+        :return: ``None``, performs inplace changes
+        """
+        self.__components_tracker = None
+
+    def subscribe(self, callback):
+        """ Registers a callable, that is notified about every low-level change of current :class:`BreakpointGraph`
+
+        Supplied callable is invoked with a single :class:`BGGraphEvent` argument right after respective change is performed by any method of current :class:`BreakpointGraph`
+        (edges addition / deletion / splitting / merging, k-breaks application, rollbacks, etc.), so subscribers can maintain their own structures in O(number of changes).
+        Changes, that are performed directly on the underlying graph (:attr:`BreakpointGraph.bg`), are not reported. Subscribers are not inherited by forks and snapshots.
+
+        :param callback: a callable to be notified
+        :type callback: callable, that accepts a single :class:`BGGraphEvent` argument
+        :return: supplied callable (so that the method can be used as a decorator)
+        """
+        self.__subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        """ Stops notifying supplied callable about changes of current :class:`BreakpointGraph`
+
+        :raises: ``ValueError`` if supplied callable is not subscribed
+        """
+        self.__subscribers.remove(callback)
+
+    def __emit(self, event):
+        for callback in list(self.__subscribers):
+            callback(event)
+
+    @property
+    def components_tracker(self):
+        """ A connected components tracker of current :class:`BreakpointGraph`, ``None`` if components tracking is not enabled """
+        return self.__components_tracker
+
+    def get_component_id(self, vertex):
+        """ Provides an id of a connected component, supplied vertex belongs to
+
+        Enables components tracking (see :meth:`BreakpointGraph.enable_components_tracking`), if it was not enabled yet.
+
+        :param vertex: a vertex object in current :class:`BreakpointGraph` object
+        :type vertex: any hashable object. :class:`bg.vertex.BGVertex` object is expected.
+        :return: a component id, or ``None`` if supplied vertex is not present in current :class:`BreakpointGraph`
+        :rtype: ``int``
+        """
+        return self.enable_components_tracking().get_component_id(vertex)
+
+    def get_touched_components(self):
+        """ Provides connected components, that were created or changed since the previous call (or since components tracking was enabled)
+
+        Enables components tracking (see :meth:`BreakpointGraph.enable_components_tracking`), if it was not enabled yet.
+
+        :return: a mapping from component ids to respective sets of vertices
+        :rtype: ``dict``
+        """
+        return self.enable_components_tracking().get_touched_components()
+
     def connected_components_subgraphs(self, copy=True):
-        """ Iterates over connected components in current :class:`BreakpointGraph` object, and yields new instances of :class:`BreakpointGraph` with respective information deep-copied by default (week reference is possible of specified in method call).
+        """ Iterates over connected components in current :class:`BreakpointGraph` object, and yields new instances of :class:`BreakpointGraph` with respective information copied by default (subgraphs, that share storage with current graph, are used if specified in method call).
+
+        If only a summary of components is needed (for example, for their filtering), :meth:`BreakpointGraph.connected_components_views` shall be used instead.
+        If components tracking is enabled (see :meth:`BreakpointGraph.enable_components_tracking`), components are obtained from the tracker, rather than recomputed.
 
-        :param copy: a flag to signal if graph information has to be deep copied while producing new :class:`BreakpointGraph` instances, of just reference to respective data has to be made.
+        :param copy: a flag to signal if graph information has to be copied while producing new :class:`BreakpointGraph` instances, or subgraphs of the underlying graph, that share its storage, have to be used as is.
         :type copy: ``Boolean``
         :return: generator over connected components in current :class:`BreakpointGraph` wrapping respective connected components into new :class:`BreakpointGraph` objects.
         :rtype: ``generator``
         """
-        for component in nx.connected_components(self.bg):
+        for component in self.__get_connected_components():
             component = self.bg.subgraph(component)
             if copy:
-                component.copy()
+                component = component.copy()
             yield BreakpointGraph(component)
 
+    def __get_connected_components(self):
+        """ Provides sets of vertices of connected components of current :class:`BreakpointGraph` (from components tracker, if it is enabled) """
+        if self.__components_tracker is not None:
+            return [vertices for _, vertices in self.__components_tracker.get_components()]
+        return nx.connected_components(self.bg)
+
+    def connected_components_views(self):
+        """ Iterates over connected components in current :class:`BreakpointGraph` object, and yields lightweight read-only views on them
+
+        Unlike :meth:`BreakpointGraph.connected_components_subgraphs`, no subgraphs, nor new :class:`BreakpointGraph` objects are created.
+        While a component is discovered, its summary (number of vertices, number of edges, set of colors, presence of irregular vertices) is computed in a single pass over its edges
+        and is stored in a respective :class:`BGComponentView`, so that filtering of components does not require to iterate over them again.
+        If components tracking is enabled (see :meth:`BreakpointGraph.enable_components_tracking`), components are obtained from the tracker, rather than recomputed.
+
+        Views are not updated on further changes of current :class:`BreakpointGraph`.
+
+        :return: generator over connected components in current :class:`BreakpointGraph`
+        :rtype: ``generator`` over :class:`BGComponentView`
+        """
+        for component in self.__get_connected_components():
+            number_of_edges = 0
+            colors = set()
+            for _, _, _, multicolor, _ in self.__iter_edges_raw(nbunch=component):
+                number_of_edges += 1
+                colors.update(multicolor.multicolors)
+            yield BGComponentView(breakpoint_graph=self, vertices=component, number_of_edges=number_of_edges,
+                                  colors=colors,
+                                  has_irregular_vertices=any(vertex.is_irregular_vertex for vertex in component))
+
+    def map_components(self, func, workers=None, chunksize=1):
+        """ Applies supplied function to every connected component of current :class:`BreakpointGraph`, optionally in a pool of worker processes
+
+        Every connected component is converted into a compact payload (see :meth:`BGComponentView.to_payload`), that is shipped to a worker,
+        where a new :class:`BreakpointGraph` is rebuilt from it (see :meth:`BreakpointGraph.from_component_payload`) and supplied function is called on it.
+        As payloads are pickled to be sent to worker processes, supplied function (and values it returns) must be picklable as well (i.e. a module level function is expected).
+        If **workers** is not specified, or is equal to 1, components are processed sequentially in the current process, through the same payloads.
+
+        Results are gathered in the order components are produced by :meth:`BreakpointGraph.connected_components_views`, regardless of the order workers finish in.
+
+        :param func: a function to be applied to every connected component
+        :type func: callable, that accepts a single :class:`BreakpointGraph` argument
+        :param workers: a number of worker processes to use
+        :type workers: ``int``
+        :param chunksize: a number of components to be sent to a worker process at once
+        :type chunksize: ``int``
+        :return: results of supplied function application to every connected component
+        :rtype: ``list``
+        """
+        payloads = [component.to_payload() for component in self.connected_components_views()]
+        if workers is None or workers <= 1 or len(payloads) <= 1:
+            return [_apply_to_component_payload(func, payload) for payload in payloads]
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_apply_to_component_payload, itertools.repeat(func, len(payloads)), payloads,
+                                     chunksize=chunksize))
+
+    @classmethod
+    def from_component_payload(cls, payload, backend=None):
+        """ Creates a new :class:`BreakpointGraph` out of a compact connected component payload, produced by :meth:`BGComponentView.to_payload`
+
+        :param payload: a pair of a sequence of vertices and a sequence of ``(vertex1, vertex2, multicolor, data)`` edge tuples
+        :type payload: ``tuple``
+        :param backend: name of storage engine (from :attr:`BreakpointGraph.backends`) to create a graph with
+        :type backend: ``str``
+        :return: a new breakpoint graph, that contains all vertices and edges from supplied payload
+        :rtype: :class:`BreakpointGraph`
+        """
+        vertices, edges = payload
+        result = cls(backend=backend)
+        for vertex in vertices:
+            result.__add_vertex(vertex)
+        result.__add_bgedges(bgedges=[BGEdge(vertex1=v1, vertex2=v2, multicolor=multicolor, data=deepcopy(data))
+                                      for v1, v2, multicolor, data in edges], merge=False)
+        return result
+
     def __delete_bgedge(self, bgedge, key=None, keep_vertices=False):
         """ Deletes a supplied :class:`bg.edge.BGEdge` from a perspective of multi-color substitution. If unique identifier ``key`` is not provided, most similar (from perspective of :meth:`bg.multicolor.Multicolor.similarity_score` result) edge between respective vertices is chosen for change.
 
@@ -378,25 +1248,27 @@ class BreakpointGraph(object):
             # even if that edge is not the most suited to the edge to be deleted
             #
             ############################################################################################################
-            self.bg[bgedge.vertex1][bgedge.vertex2][key]["attr_dict"]["multicolor"] -= bgedge.multicolor
-            if len(self.bg[bgedge.vertex1][bgedge.vertex2][key]["attr_dict"]["multicolor"].multicolors) == 0:
+            multicolor = self.__change_edge_multicolor(vertex1=bgedge.vertex1, vertex2=bgedge.vertex2, key=key,
+                                                       multicolor=bgedge.multicolor, subtract=True)
+            if len(multicolor.multicolors) == 0:
                 ############################################################################################################
                 #
                 # since edge deletion correspond to multicolor substitution one must make sure
                 # that no edges with empty multicolor are left in the graph
                 #
                 ############################################################################################################
-                self.bg.remove_edge(v=bgedge.vertex1, u=bgedge.vertex2, key=key)
+                self.__remove_edge(vertex1=bgedge.vertex1, vertex2=bgedge.vertex2, key=key)
                 if keep_vertices:
                     self.bg.add_node(bgedge.vertex1)
                     self.bg.add_node(bgedge.vertex2)
         else:
             candidate_data, candidate_id, candidate_score = self.__determine_most_suitable_edge_for_deletion(bgedge)
             if candidate_data is not None:
-                candidate_data["attr_dict"]["multicolor"] -= bgedge.multicolor
-                if len(self.bg[bgedge.vertex1][bgedge.vertex2][candidate_id]["attr_dict"][
-                           "multicolor"].multicolors) == 0:
-                    self.bg.remove_edge(v=bgedge.vertex1, u=bgedge.vertex2, key=candidate_id)
+                multicolor = self.__change_edge_multicolor(vertex1=bgedge.vertex1, vertex2=bgedge.vertex2,
+                                                           key=candidate_id, multicolor=bgedge.multicolor,
+                                                           subtract=True)
+                if len(multicolor.multicolors) == 0:
+                    self.__remove_edge(vertex1=bgedge.vertex1, vertex2=bgedge.vertex2, key=candidate_id)
                     if keep_vertices:
                         self.bg.add_node(bgedge.vertex1)
                         self.bg.add_node(bgedge.vertex2)
@@ -406,18 +1278,18 @@ class BreakpointGraph(object):
         candidate_id = None
         candidate_score = -1
         candidate_data = None
-        for v1, v2, key, data in self.bg.edges(nbunch=bgedge.vertex1, data=True, keys=True):
+        for key, data in self.__get_edges_attributes_between_two_vertices(vertex1=bgedge.vertex1,
+                                                                          vertex2=bgedge.vertex2).items():
             ############################################################################################################
             #
-            # iterate over all edges and determine which edge has a multicolor most related to the provided for deletion edge
+            # iterate over all edges between two vertices and determine which edge has a multicolor most related to the provided for deletion edge
             #
             ############################################################################################################
-            if v2 == bgedge.vertex2:
-                score = Multicolor.similarity_score(bgedge.multicolor, data["attr_dict"]["multicolor"])
-                if score > candidate_score:
-                    candidate_id = key
-                    candidate_data = data
-                    candidate_score = score
+            score = Multicolor.similarity_score(bgedge.multicolor, data["attr_dict"]["multicolor"])
+            if score > candidate_score:
+                candidate_id = key
+                candidate_data = data
+                candidate_score = score
         return candidate_data, candidate_id, candidate_score
 
     def delete_edge(self, vertex1, vertex2, multicolor, key=None):
@@ -462,7 +1334,7 @@ class BreakpointGraph(object):
         :param bgedge: an edge to find most "similar to" among existing edges for a split
         :type bgedge: :class:`bg.edge.BGEdge`
         :param guidance: a guidance for underlying :class:`bg.multicolor.Multicolor` object to be split
-        :type guidance: iterable where each entry is iterable with colors entries
+        :type guidance: iterable where each entry is iterable with colors entries, or :class:`bg.multicolor.SplitGuidance`
         :param duplication_splitting: flag (**not** currently implemented) for a splitting of color-based splitting to take into account multiplicity of respective colors
         :type duplication_splitting: ``Boolean``
         :param key: unique identifier of edge to be split
@@ -484,13 +1356,13 @@ class BreakpointGraph(object):
                 self.__add_bgedge(BGEdge(vertex1=bgedge.vertex1, vertex2=bgedge.vertex2, multicolor=multicolor),
                                   merge=False)
         else:
-            for v1, v2, key, data in self.bg.edges(nbunch=bgedge.vertex1, data=True, keys=True):
-                if v2 == bgedge.vertex2:
-                    score = Multicolor.similarity_score(bgedge.multicolor, data["attr_dict"]["multicolor"])
-                    if score > candidate_score:
-                        candidate_id = key
-                        candidate_data = data
-                        candidate_score = score
+            for key, data in self.__get_edges_attributes_between_two_vertices(vertex1=bgedge.vertex1,
+                                                                              vertex2=bgedge.vertex2).items():
+                score = Multicolor.similarity_score(bgedge.multicolor, data["attr_dict"]["multicolor"])
+                if score > candidate_score:
+                    candidate_id = key
+                    candidate_data = data
+                    candidate_score = score
             if candidate_data is not None:
                 new_multicolors = Multicolor.split_colors(multicolor=candidate_data["attr_dict"]["multicolor"],
                                                           guidance=guidance, sorted_guidance=sorted_guidance,
@@ -535,7 +1407,7 @@ class BreakpointGraph(object):
         :param bgedge: an edge to find most "similar to" among existing edges for a split
         :type bgedge: :class:`bg.edge.BGEdge`
         :param guidance: a guidance for underlying :class:`bg.multicolor.Multicolor` object to be split
-        :type guidance: iterable where each entry is iterable with colors entries
+        :type guidance: iterable where each entry is iterable with colors entries, or :class:`bg.multicolor.SplitGuidance`
         :param duplication_splitting: flag (**not** currently implemented) for a splitting of color-based splitting to take into account multiplicity of respective colors
         :type duplication_splitting: ``Boolean``
         :param key: unique identifier of edge to be split
@@ -557,10 +1429,13 @@ class BreakpointGraph(object):
         :param vertex2: a second out of two vertices edges between which are to be split
         :type vertex2: any python hashable object. :class:`bg.vertex.BGVertex` is expected
         :param guidance: a guidance for underlying :class:`bg.multicolor.Multicolor` objects to be split
-        :type guidance: iterable where each entry is iterable with colors entries
+        :type guidance: iterable where each entry is iterable with colors entries, or :class:`bg.multicolor.SplitGuidance`
         :return: ``None``, performs inplace changes
         """
-        edges_to_be_split_keys = [key for v1, v2, key in self.bg.edges(nbunch=vertex1, keys=True) if v2 == vertex2]
+        guidance = self.__get_split_guidance(guidance=guidance, sorted_guidance=sorted_guidance,
+                                             account_for_colors_multiplicity_in_guidance=account_for_colors_multiplicity_in_guidance)
+        edges_to_be_split_keys = list(self.__get_edges_attributes_between_two_vertices(vertex1=vertex1,
+                                                                                       vertex2=vertex2).keys())
         for key in edges_to_be_split_keys:
             self.__split_bgedge(BGEdge(vertex1=vertex1, vertex2=vertex2, multicolor=None), guidance=guidance,
                                 sorted_guidance=sorted_guidance,
@@ -578,7 +1453,7 @@ class BreakpointGraph(object):
         :param vertex2: a second out of two vertices edges between which are to be split
         :type vertex2: any python hashable object. :class:`bg.vertex.BGVertex` is expected
         :param guidance: a guidance for underlying :class:`bg.multicolor.Multicolor` objects to be split
-        :type guidance: iterable where each entry is iterable with colors entries
+        :type guidance: iterable where each entry is iterable with colors entries, or :class:`bg.multicolor.SplitGuidance`
         :return: ``None``, performs inplace changes
         """
         self.__split_all_edges_between_two_vertices(vertex1=vertex1, vertex2=vertex2, guidance=guidance,
@@ -588,17 +1463,29 @@ class BreakpointGraph(object):
     def split_all_edges(self, guidance=None, sorted_guidance=False, account_for_colors_multiplicity_in_guidance=True):
         """ Splits all edge in current :class:`BreakpointGraph` instance with respect to the provided guidance.
 
-        Iterate over all possible distinct pairs of vertices in current :class:`BreakpointGraph` instance and splits all edges between such pairs with respect to provided guidance.
+        Iterates over all edges in current :class:`BreakpointGraph` instance and splits each of them (once) with respect to provided guidance.
+        Supplied guidance is prepared (see :class:`bg.multicolor.SplitGuidance`) only once for all edges.
 
         :param guidance: a guidance for underlying :class:`bg.multicolor.Multicolor` objects to be split
-        :type guidance: iterable where each entry is iterable with colors entries
+        :type guidance: iterable where each entry is iterable with colors entries, or :class:`bg.multicolor.SplitGuidance`
         :return: ``None``, performs inplace changes
         """
-        vertex_pairs = [(edge.vertex1, edge.vertex2) for edge in self.edges()]
-        for v1, v2 in vertex_pairs:
-            self.__split_all_edges_between_two_vertices(vertex1=v1, vertex2=v2, guidance=guidance,
-                                                        sorted_guidance=sorted_guidance,
-                                                        account_for_colors_multiplicity_in_guidance=account_for_colors_multiplicity_in_guidance)
+        guidance = self.__get_split_guidance(guidance=guidance, sorted_guidance=sorted_guidance,
+                                             account_for_colors_multiplicity_in_guidance=account_for_colors_multiplicity_in_guidance)
+        edges = [(v1, v2, key) for v1, v2, key, _, _ in self.__iter_edges_raw()]
+        for v1, v2, key in edges:
+            self.__split_bgedge(BGEdge(vertex1=v1, vertex2=v2, multicolor=None), guidance=guidance, key=key)
+
+    @staticmethod
+    def __get_split_guidance(guidance, sorted_guidance=False, account_for_colors_multiplicity_in_guidance=True):
+        """ Prepares a :class:`bg.multicolor.SplitGuidance` object out of supplied guidance, so that it is sorted / deduplicated only once, and not for every split edge
+
+        :return: supplied guidance, if it is either ``None``, or a :class:`bg.multicolor.SplitGuidance` instance already, a new :class:`bg.multicolor.SplitGuidance` otherwise
+        """
+        if guidance is None or isinstance(guidance, SplitGuidance):
+            return guidance
+        return SplitGuidance(guidance=guidance, sorted_guidance=sorted_guidance,
+                             account_for_color_multiplicity_in_guidance=account_for_colors_multiplicity_in_guidance)
 
     def __delete_all_bgedges_between_two_vertices(self, vertex1, vertex2):
         """ Deletes all edges between two supplied vertices
@@ -609,11 +1496,11 @@ class BreakpointGraph(object):
         :type vertex2: any python hashable object. :class:`bg.vertex.BGVertex` is expected
         :return: ``None``, performs inplace changes
         """
-        edges_to_be_deleted_with_keys = [(key, data) for v1, v2, key, data in self.bg.edges(nbunch=vertex1, keys=True,
-                                                                                            data=True) if v2 == vertex2]
-        for key, data in edges_to_be_deleted_with_keys:
-            self.__delete_bgedge(BGEdge(vertex1=vertex1, vertex2=vertex2, multicolor=data["attr_dict"]["multicolor"]),
-                                 key=key)
+        edges_to_be_deleted_with_keys = [(key, data["attr_dict"]["multicolor"]) for key, data in
+                                         self.__get_edges_attributes_between_two_vertices(vertex1=vertex1,
+                                                                                          vertex2=vertex2).items()]
+        for key, multicolor in edges_to_be_deleted_with_keys:
+            self.__delete_bgedge(BGEdge(vertex1=vertex1, vertex2=vertex2, multicolor=multicolor), key=key)
 
     def delete_all_edges_between_two_vertices(self, vertex1, vertex2):
         """ Deletes all edges between two supplied vertices
@@ -637,17 +1524,31 @@ class BreakpointGraph(object):
         :type vertex2: any python hashable object. :class:`bg.vertex.BGVertex` is expected
         :return: ``None``, performs inplace changes
         """
-        ############################################################################################################
-        #
-        # no actual merging is performed, but rather all edges between two vertices are deleted
-        # and then added with a merge argument set to true
-        #
-        ############################################################################################################
-        edges_multicolors = [deepcopy(data["attr_dict"]["multicolor"]) for v1, v2, data in
-                             self.bg.edges(nbunch=vertex1, data=True) if v2 == vertex2]
-        self.__delete_all_bgedges_between_two_vertices(vertex1=vertex1, vertex2=vertex2)
-        for multicolor in edges_multicolors:
-            self.__add_bgedge(BGEdge(vertex1=vertex1, vertex2=vertex2, multicolor=multicolor), merge=True)
+        edges = [(key, data["attr_dict"]["multicolor"]) for key, data in
+                 self.__get_edges_attributes_between_two_vertices(vertex1=vertex1, vertex2=vertex2).items()]
+        self.__collapse_parallel_edges(vertex1=vertex1, vertex2=vertex2, edges=edges)
+
+    def __collapse_parallel_edges(self, vertex1, vertex2, edges):
+        """ Collapses supplied parallel edges between two vertices into a single one
+
+        An edge with the smallest key is kept, multicolors of all other edges are merged into it (and its data is reset to the default one, as :meth:`BreakpointGraph.merge_all_edges` always did it), while all other edges are removed.
+        A single edge is left untouched.
+
+        :param edges: ``(key, multicolor)`` pairs for all edges between supplied vertices
+        :type edges: ``list``
+        :return: a flag indicating if any edges were collapsed
+        :rtype: ``Boolean``
+        """
+        if len(edges) < 2:
+            return False
+        edges = sorted(edges, key=lambda entry: entry[0])
+        key = edges[0][0]
+        for other_key, _ in edges[1:]:
+            self.__remove_edge(vertex1=vertex1, vertex2=vertex2, key=other_key)
+        self.__change_edge_multicolor(vertex1=vertex1, vertex2=vertex2, key=key,
+                                      multicolor=Multicolor.merge(*[multicolor for _, multicolor in edges[1:]]))
+        self.__set_edge_data(vertex1=vertex1, vertex2=vertex2, key=key, data=BGEdge.create_default_data_dict())
+        return True
 
     def merge_all_edges_between_two_vertices(self, vertex1, vertex2):
         """ Merges all edge between two supplied vertices into a single edge from a perspective of multi-color merging.
@@ -665,21 +1566,32 @@ class BreakpointGraph(object):
     def merge_all_edges(self):
         """ Merges all edges in a current :class`BreakpointGraph` instance between same pairs of vertices into a single edge from a perspective of multi-color merging.
 
-        Iterates over all possible pairs of vertices in current :class:`BreakpointGraph` and merges all edges between respective pairs.
+        Parallel edges are grouped by pairs of vertices they connect in a single sweep over all edges, and edges in each group are then collapsed at once.
+        Pairs of vertices, connected by a single edge, are left untouched.
 
-        :return: ``None``, performs inplace changes
+        :return: a number of pairs of vertices, parallel edges between which were collapsed
+        :rtype: ``int``
         """
-        pairs_of_vetices = [(edge.vertex1, edge.vertex2) for edge in self.edges()]
-        for v1, v2 in pairs_of_vetices:
+        groups = {}
+        for v1, v2, key, multicolor, _ in self.__iter_edges_raw():
             ############################################################################################################
             #
-            # we iterate over all pairs of vertices in the given graph and merge edges between them
+            # we iterate over all edges in the given graph and group them by the pair of vertices they connect
             #
             ############################################################################################################
-            self.__merge_all_bgedges_between_two_vertices(vertex1=v1, vertex2=v2)
+            pair = frozenset((v1, v2))
+            if pair in groups:
+                groups[pair][2].append((key, multicolor))
+            else:
+                groups[pair] = (v1, v2, [(key, multicolor)])
+        result = 0
+        for v1, v2, edges in groups.values():
+            if self.__collapse_parallel_edges(vertex1=v1, vertex2=v2, edges=edges):
+                result += 1
+        return result
 
     @classmethod
-    def merge(cls, breakpoint_graph1, breakpoint_graph2, merge_edges=False):
+    def merge(cls, breakpoint_graph1, breakpoint_graph2, merge_edges=False, backend=None):
         """ Merges two given instances of :class`BreakpointGraph` into a new one, that gather all available information from both supplied objects.
 
         Depending of a ``merge_edges`` flag, while merging of two dat structures is occurring, edges between similar vertices can be merged during the creation of a result :class`BreakpointGraph` obejct.
@@ -692,14 +1604,14 @@ class BreakpointGraph(object):
         :type breakpoint_graph2: :class`BreakpointGraph`
         :param merge_edges: flag to indicate if edges in a new merged :class`BreakpointGraph` object has to be merged between same vertices, or if splitting from supplied graphs shall be preserved.
         :type merge_edges: ``Boolean``
+        :param backend: name of storage engine for the resulting graph
+        :type backend: ``str``
         :return: a new breakpoint graph object that contains all information gathered from both supplied breakpoint graphs
         :rtype: :class`BreakpointGraph`
         """
-        result = cls()
-        for bgedge in breakpoint_graph1.edges():
-            result.__add_bgedge(bgedge=bgedge, merge=merge_edges)
-        for bgedge in breakpoint_graph2.edges():
-            result.__add_bgedge(bgedge=bgedge, merge=merge_edges)
+        result = cls(backend=backend)
+        result.__add_bgedges(bgedges=itertools.chain(breakpoint_graph1.edges(), breakpoint_graph2.edges()),
+                             merge=merge_edges)
         return result
 
     def __update(self, breakpoint_graph, merge_edges=False):
@@ -713,8 +1625,7 @@ class BreakpointGraph(object):
         :type merge_edges: ``Boolean``
         :return: ``None``, performs inplace changes
         """
-        for bgedge in breakpoint_graph.edges():
-            self.__add_bgedge(bgedge=deepcopy(bgedge), merge=merge_edges)
+        self.__add_bgedges(bgedges=(deepcopy(bgedge) for bgedge in breakpoint_graph.edges()), merge=merge_edges)
 
     def update(self, breakpoint_graph, merge_edges=False):
         """ Updates a current :class`BreakpointGraph` object with information from a supplied :class`BreakpointGraph` instance.
@@ -742,6 +1653,8 @@ class BreakpointGraph(object):
         New edges of specified in kbreak multicolor are added between all pairs of vertices in kbreak.result_edges (except for paired infinity vertices).
         If after the kbreak application there is an infinity vertex, that now has no edges incident to it, it is deleted form the current :class:`BreakpointGraph`.
 
+        Proxies a call to :meth:`BreakpointGraph.apply_kbreaks` with a single k-break.
+
         :param kbreak: a k-break to be applied to current :class:`BreakpointGraph`
         :type kbreak: `bg.kbreak.KBreak`
         :param merge: a flag to indicate on how edges, that will be created by a k-break, will be added to current :class:`BreakpointGraph`
@@ -750,70 +1663,159 @@ class BreakpointGraph(object):
         :rtype: ``None``
         :raises: ``ValueError``, ``TypeError``
         """
-        ############################################################################################################
-        #
-        # k-break must ba valid to be applied
-        #
-        ############################################################################################################
-        vertices = {}
-        edge_data = {}
-        if not isinstance(kbreak, KBreak):
-            raise TypeError("Only KBreak and derivatives are allowed as kbreak argument")
-        if not KBreak.valid_kbreak_matchings(kbreak.start_edges, kbreak.result_edges):
-            raise ValueError("Supplied KBreak is not valid form perspective of starting/resulting sets of vertices")
-        for vertex1, vertex2 in kbreak.start_edges:
+        self.apply_kbreaks(kbreaks=[kbreak], merge=merge)
 
-            if vertex1.is_infinity_vertex and vertex2.is_infinity_vertex:
+    def apply_kbreaks(self, kbreaks, merge=True, validate=True):
+        """ Applies supplied k-breaks to current :class:`BreakpointGraph` one after another
+
+        Each k-break is applied the same way, as :meth:`BreakpointGraph.apply_kbreak` does it, with the following differences:
+
+        *   the whole batch is validated before any change is performed. Application of k-breaks is simulated on a ledger of multicolors of edges between affected pairs of vertices,
+            so k-breaks, that target edges created by earlier k-breaks in the batch, are valid, while k-breaks, that target the same edge that was already consumed by an earlier k-break (a conflict), are not.
+            Thus either all k-breaks are applied, or the graph is not changed at all.
+        *   the batch is applied inside a :meth:`BreakpointGraph.transaction`, so if some k-break fails nevertheless (for example, when validation is turned off), all changes, performed by the batch, are rolled back
+        *   every k-break is applied in a single pass over its start edges (vertices lookup, edge to be changed determination and its deletion)
+        *   infinity vertices, that are left without incident edges, are deleted once, after all k-breaks are applied
+
+        :param kbreaks: k-breaks to be applied to current :class:`BreakpointGraph` (in supplied order)
+        :type kbreaks: iterable of :class:`bg.kbreak.KBreak`
+        :param merge: a flag to indicate on how edges, that will be created by k-breaks, will be added to current :class:`BreakpointGraph`
+        :type merge: ``Boolean``
+        :param validate: a flag to indicate if the batch is to be validated. Validation shall be turned off only for k-breaks, that are known to be applicable (for example, ones recorded during earlier application)
+        :type validate: ``Boolean``
+        :return: nothing, performs inplace changes
+        :rtype: ``None``
+        :raises: ``ValueError``, ``TypeError``
+        """
+        kbreaks = list(kbreaks)
+        if validate:
+            self.__validate_kbreaks(kbreaks=kbreaks, merge=merge)
+        infinity_vertices = {}
+        with self.transaction():
+            for kbreak in kbreaks:
+                self.__apply_kbreak(kbreak=kbreak, merge=merge, infinity_vertices=infinity_vertices)
+            for vertex in infinity_vertices:
+                ############################################################################################################
+                #
+                # after k-breaks are applied one must make sure we don't leave any infinity vertices
+                # that have edges going to them, as infinity vertex is a special artificial vertex
+                #  and it has meaning only if there are edges going to / from it
+                #
+                ############################################################################################################
+                if vertex in self.bg and len(self.bg[vertex]) == 0:
+                    self.__remove_vertex(vertex)
+
+    def __validate_kbreaks(self, kbreaks, merge):
+        """ Checks that supplied k-breaks can be applied to current :class:`BreakpointGraph` one after another, without changing it
+
+        Multicolors of edges between pairs of vertices, targeted by k-breaks, are copied into a ledger (on first access), and k-breaks application is performed on it,
+        following the same rules of edge selection for deletion / merging, as the actual application does.
+
+        :raises: ``ValueError``, ``TypeError``
+        """
+        ledger = {}
+        added_vertices = set()
+
+        def get_pair_edges(vertex1, vertex2):
+            pair = frozenset((vertex1, vertex2))
+            if pair not in ledger:
+                if vertex1 in self.bg and vertex2 in self.bg[vertex1]:
+                    ledger[pair] = {key: data["attr_dict"]["multicolor"]
+                                    for key, data in self.bg[vertex1][vertex2].items()}
+                else:
+                    ledger[pair] = {}
+            return ledger[pair]
+
+        for kbreak in kbreaks:
+            ############################################################################################################
+            #
+            # k-break must ba valid to be applied
+            #
+            ############################################################################################################
+            if not isinstance(kbreak, KBreak):
+                raise TypeError("Only KBreak and derivatives are allowed as kbreak argument")
+            if not KBreak.valid_kbreak_matchings(kbreak.start_edges, kbreak.result_edges):
+                raise ValueError("Supplied KBreak is not valid form perspective of starting/resulting sets of vertices")
+            start_edges = [(vertex1, vertex2) for vertex1, vertex2 in kbreak.start_edges
+                           if not (vertex1.is_infinity_vertex and vertex2.is_infinity_vertex)]
+            for vertex1, vertex2 in start_edges:
                 ############################################################################################################
                 #
                 # when we encounter a fully infinity edge (both vertices are infinity vertices)
                 # we shall not check if they are present in the current graph, because hat portion of a kbreak is artificial
                 #
                 ############################################################################################################
-                continue
-            if vertex1 not in self.bg or vertex2 not in self.bg:
-                raise ValueError("Supplied KBreak targets vertices (`{v1}` and `{v2}`) at least one of which "
-                                 "does not exist in current BreakpointGraph"
-                                 "".format(v1=vertex1.name, v2=vertex2.name))
-        for vertex1, vertex2 in kbreak.start_edges:
-            if vertex1.is_infinity_vertex and vertex2.is_infinity_vertex:
-                continue
-            for bgedge in self.__edges_between_two_vertices(vertex1=vertex1, vertex2=vertex2):
+                if (vertex1 not in self.bg and vertex1 not in added_vertices) or \
+                        (vertex2 not in self.bg and vertex2 not in added_vertices):
+                    raise ValueError("Supplied KBreak targets vertices (`{v1}` and `{v2}`) at least one of which "
+                                     "does not exist in current BreakpointGraph"
+                                     "".format(v1=vertex1.name, v2=vertex2.name))
+            for vertex1, vertex2 in start_edges:
                 ############################################################################################################
                 #
                 # at least one edge between supplied pair of vertices must contain a multicolor that is specified for the kbreak
                 #
                 ############################################################################################################
-                if kbreak.multicolor <= bgedge.multicolor:
-                    break
-            else:
-                raise ValueError("Some targeted by kbreak edge with specified multicolor does not exists")
+                if not any(kbreak.multicolor <= multicolor
+                           for multicolor in get_pair_edges(vertex1=vertex1, vertex2=vertex2).values()):
+                    raise ValueError("Some targeted by kbreak edge with specified multicolor does not exists")
+            for vertex1, vertex2 in start_edges:
+                pair_edges = get_pair_edges(vertex1=vertex1, vertex2=vertex2)
+                candidate_id, candidate_score = None, -1
+                for key, multicolor in pair_edges.items():
+                    score = Multicolor.similarity_score(kbreak.multicolor, multicolor)
+                    if score > candidate_score:
+                        candidate_id, candidate_score = key, score
+                multicolor = pair_edges[candidate_id] - kbreak.multicolor
+                if len(multicolor.multicolors) == 0:
+                    del pair_edges[candidate_id]
+                else:
+                    pair_edges[candidate_id] = multicolor
+            for vertex1, vertex2 in kbreak.result_edges:
+                if vertex1.is_infinity_vertex and vertex2.is_infinity_vertex:
+                    continue
+                pair_edges = get_pair_edges(vertex1=vertex1, vertex2=vertex2)
+                if merge and len(pair_edges) > 0:
+                    key = min(pair_edges.keys())
+                    pair_edges[key] = pair_edges[key] + kbreak.multicolor
+                else:
+                    key = len(pair_edges)
+                    while key in pair_edges:
+                        key += 1
+                    pair_edges[key] = kbreak.multicolor
+                added_vertices.add(vertex1)
+                added_vertices.add(vertex2)
+
+    def __apply_kbreak(self, kbreak, merge, infinity_vertices):
+        """ Applies a single k-break, that is known to be applicable, to current :class:`BreakpointGraph`
+
+        Infinity vertices, that are targeted by k-break start edges, are recorded into supplied ``infinity_vertices`` dict (used as an ordered set) for further cleanup.
+        """
+        vertices = {}
+        edge_data = {}
         for vertex1, vertex2 in kbreak.start_edges:
+            for vertex in (vertex1, vertex2):
+                if vertex.is_infinity_vertex:
+                    infinity_vertices[vertex] = None
             if vertex1.is_infinity_vertex and vertex2.is_infinity_vertex:
                 continue
             v1 = self.__get_vertex_by_name(vertex_name=vertex1.name)
-            vertices[v1] = v1
             v2 = self.__get_vertex_by_name(vertex_name=vertex2.name)
+            if v1 is None or v2 is None:
+                raise ValueError("Supplied KBreak targets vertices (`{v1}` and `{v2}`) at least one of which "
+                                 "does not exist in current BreakpointGraph"
+                                 "".format(v1=vertex1.name, v2=vertex2.name))
+            vertices[v1] = v1
             vertices[v2] = v2
             bgedge = BGEdge(vertex1=v1, vertex2=v2, multicolor=kbreak.multicolor)
             candidate_data, candidate_id, candidate_score = self.__determine_most_suitable_edge_for_deletion(
                 bgedge=bgedge)
+            if candidate_data is None or not kbreak.multicolor <= candidate_data["attr_dict"]["multicolor"]:
+                raise ValueError("Some targeted by kbreak edge with specified multicolor does not exists")
             data = candidate_data["attr_dict"]["data"]
             edge_data[v1] = data
             edge_data[v2] = data
-            self.__delete_bgedge(bgedge=bgedge, keep_vertices=True)
-        for vertex_set in kbreak.start_edges:
-            for vertex in vertex_set:
-                if vertex.is_infinity_vertex and vertex in self.bg:
-                    ############################################################################################################
-                    #
-                    # after the first portion of a kbreak is performed one must make sure we don't leave any infinity vertices
-                    # that have edges going to them, as infinity vertex is a special artificial vertex
-                    #  and it has meaning only if there are edges going to / from it
-                    #
-                    ############################################################################################################
-                    if len(list(self.get_edges_by_vertex(vertex=vertex))) == 0:
-                        self.bg.remove_node(vertex)
+            self.__delete_bgedge(bgedge=bgedge, key=candidate_id, keep_vertices=True)
         for vertex1, vertex2 in kbreak.result_edges:
             if vertex1.is_infinity_vertex and vertex2.is_infinity_vertex:
                 ############################################################################################################
@@ -855,13 +1857,14 @@ class BreakpointGraph(object):
         return result
 
     @classmethod
-    def from_json(cls, data, genomes_data=None, genomes_deserialization_required=True, merge=False):
+    def from_json(cls, data, genomes_data=None, genomes_deserialization_required=True, merge=False, backend=None):
         """ A JSON deserialization operation, that recovers a breakpoint graph from its JSON representation
 
           as information about genomes, that are encoded in breakpoint graph might be available somewhere else, but not the
           json object, there is an option to provide it and omit encoding information about genomes.
+          Recovered graph is powered by the specified storage ``backend``.
         """
-        result = cls()
+        result = cls(backend=backend)
         merge = merge
         vertices_dict = {}
         genomes_dict = genomes_data if genomes_data is not None and not genomes_deserialization_required else None
@@ -921,6 +1924,7 @@ class BreakpointGraph(object):
                 vertex_class = BGVertex
             vertices_dict[vertex_dict["v_id"]] = vertex_class.from_json(data=vertex_dict,
                                                                         json_schema_class=schema_class)
+        edges = []
         for edge_dict in data["edges"]:
             ############################################################################################################
             #
@@ -957,97 +1961,152 @@ class BreakpointGraph(object):
                 raise ValueError(
                     "Error during breakpoint graph deserialization. Deserialized edge reference non-present "
                     "genome in its multicolor")
-            result.__add_bgedge(edge, merge=merge)
+            edges.append(edge)
+        result.__add_bgedges(bgedges=edges, merge=merge)
+        return result
+
+    def to_sparse(self, color=None):
+        """ Exports current :class:`BreakpointGraph` as sparse adjacency matrices (``scipy.sparse.csr_matrix``) for every genome in it, or for a single supplied genome
+
+        Rows and columns of every matrix correspond to vertices of current :class:`BreakpointGraph` in the order of the returned list of vertices (which is the same for all matrices).
+        An entry ``[i, j]`` holds a total multiplicity of respective color on all edges between ``i``-th and ``j``-th vertices, so matrices are symmetric, and self loops are stored on a diagonal.
+        Edges data is not exported.
+
+        If a single color is requested, only edges of that color are inspected (through the color -> edges index).
+
+        :param color: a genome to export a matrix for, if not supplied, matrices for all genomes are produced
+        :type color: any hashable python object. :class:`bg.genome.BGGenome` is expected
+        :return: a pair of a list of vertices and either a single matrix (if ``color`` is supplied), or a ``color -> matrix`` dict
+        :rtype: ``tuple``
+        """
+        from scipy.sparse import coo_matrix
+        vertices = list(self.bg.nodes())
+        vertex_ids = {vertex: vertex_id for vertex_id, vertex in enumerate(vertices)}
+        entries = {}
+        if color is not None:
+            edges = ((vertex1, vertex2, self.bg[vertex1][vertex2][key]["attr_dict"]["multicolor"])
+                     for vertex1, vertex2, key in self.__get_color_index().get(color, {}))
+        else:
+            edges = ((vertex1, vertex2, multicolor) for vertex1, vertex2, _, multicolor, _ in self.__iter_edges_raw())
+        for vertex1, vertex2, multicolor in edges:
+            for edge_color, multiplicity in multicolor.multicolors.items():
+                if color is not None and edge_color != color:
+                    continue
+                rows, columns, values = entries.setdefault(edge_color, ([], [], []))
+                vertex1_id, vertex2_id = vertex_ids[vertex1], vertex_ids[vertex2]
+                rows.append(vertex1_id)
+                columns.append(vertex2_id)
+                values.append(multiplicity)
+                if vertex1_id != vertex2_id:
+                    rows.append(vertex2_id)
+                    columns.append(vertex1_id)
+                    values.append(multiplicity)
+        ############################################################################################################
+        #
+        # parallel edges produce duplicate coordinates, which are summed up on conversion into CSR format
+        #
+        ############################################################################################################
+        shape = (len(vertices), len(vertices))
+        matrices = {edge_color: coo_matrix((values, (rows, columns)), shape=shape, dtype=int).tocsr()
+                    for edge_color, (rows, columns, values) in entries.items()}
+        if color is not None:
+            return vertices, matrices.get(color, coo_matrix(shape, dtype=int).tocsr())
+        return vertices, matrices
+
+    @classmethod
+    def from_sparse(cls, vertices, matrices, backend=None):
+        """ Creates a new :class:`BreakpointGraph` out of sparse adjacency matrices, produced by :meth:`BreakpointGraph.to_sparse`
+
+        All colors between a pair of vertices are put into a single edge (i.e. parallel edges are merged), and each color gets multiplicity from respective matrix entry.
+        Only upper triangles of matrices (including diagonals) are inspected. All supplied vertices are added to the new graph, even if no edges are incident to them.
+
+        :param vertices: vertices, that correspond to rows and columns of supplied matrices
+        :type vertices: ``list``
+        :param matrices: a ``color -> matrix`` dict
+        :type matrices: ``dict`` with ``scipy.sparse`` matrices as values
+        :param backend: name of storage engine (from :attr:`BreakpointGraph.backends`) to create a graph with
+        :type backend: ``str``
+        :return: a new breakpoint graph
+        :rtype: :class:`BreakpointGraph`
+        :raises: ``ValueError`` if shape of some matrix does not correspond to the number of supplied vertices
+        """
+        from scipy.sparse import triu
+        result = cls(backend=backend)
+        multicolors = {}
+        for color, matrix in matrices.items():
+            if matrix.shape != (len(vertices), len(vertices)):
+                raise ValueError("Matrix for color {color} has shape {shape}, while {number} vertices are supplied"
+                                 "".format(color=color, shape=matrix.shape, number=len(vertices)))
+            matrix = triu(matrix).tocoo()
+            for vertex1_id, vertex2_id, multiplicity in zip(matrix.row, matrix.col, matrix.data):
+                if multiplicity > 0:
+                    multicolors.setdefault((vertex1_id, vertex2_id), []).extend([color] * int(multiplicity))
+        for vertex in vertices:
+            result.__add_vertex(vertex)
+        result.__add_bgedges(bgedges=[BGEdge(vertex1=vertices[vertex1_id], vertex2=vertices[vertex2_id],
+                                             multicolor=Multicolor(*colors))
+                                      for (vertex1_id, vertex2_id), colors in sorted(multicolors.items())],
+                             merge=False)
         return result
 
     def get_overall_set_of_colors(self):
+        """ Provides a set of all colors, that are present on edges of current :class:`BreakpointGraph`
+
+        Colors are obtained from the color -> edges index, which is maintained on every change of current :class:`BreakpointGraph`,
+        so no iteration over graph edges is performed (except for the first call, if the index is not built yet).
+        The result is cached until the next change of current :class:`BreakpointGraph`, and must not be modified.
+
+        :return: a set of colors, present in current :class:`BreakpointGraph`
+        :rtype: ``set``
+        """
         if "overall_set_of_colors" not in self.cache_valid or not self.cache_valid["overall_set_of_colors"]:
-            self.cache["overall_set_of_colors"] = {color for bg_edge in self.edges() for color in
-                                                   bg_edge.multicolor.colors}
+            self.cache["overall_set_of_colors"] = {color for color, edges in self.__get_color_index().items()
+                                                   if len(edges) > 0}
             self.cache_valid["overall_set_of_colors"] = True
         return self.cache["overall_set_of_colors"]
 
-    def get_genome_graph(self, color):
-        result = BreakpointGraph()
-        mc = Multicolor(color)
-        for edge in self.edges():
-            if mc <= edge.multicolor:
-                result.__add_bgedge(bgedge=BGEdge(vertex1=edge.vertex1, vertex2=edge.vertex2,
-                                                  multicolor=mc, data=edge.data))
-        return result
+    def get_number_of_edges_by_color(self, color):
+        """ Provides a number of edges in current :class:`BreakpointGraph`, that have supplied color in their multicolor
 
-    def get_blocks_order(self):
-        genome = self.get_overall_set_of_colors().pop()
-        result = {genome: []}
-        visited_vertices = set()
-        for vertex in self.nodes():
-            if vertex in visited_vertices:
-                continue
-            visited_vertices.add(vertex)
-            chr_type_f, fragment_part_forward = self._traverse_blocks_forward_from_vertex(vertex=vertex,
-                                                                                          visited_vertices=visited_vertices)
-            chr_type_r, fragment_part_reverse = self._traverse_blocks_reverse_from_vertex(vertex=vertex,
-                                                                                          visited_vertices=visited_vertices)
-            if chr_type_f != chr_type_r:
-                raise Exception("During the gene order sequence traversal we got a conflicted situation. "
-                                "Most probably case for this to happen is to have a genome with non-unique gene content")
-            if chr_type_f == "$":
-                fragment = fragment_part_reverse + fragment_part_forward
-            else:
-                fragment = fragment_part_forward if len(fragment_part_forward) > len(
-                    fragment_part_reverse) else fragment_part_reverse
-            result[genome].append((chr_type_f, fragment))
-        return result
+        Value is obtained from the color -> edges index, which is maintained on every change of current :class:`BreakpointGraph`.
 
-    def _traverse_blocks_from_vertex(self, vertex, visited_vertices, direction):
-        result = []
-        current_vertex = vertex
-        visited_vertices.add(current_vertex)
-        if current_vertex.is_irregular_vertex:
-            edge = list(self.get_edges_by_vertex(vertex=current_vertex))[0]
-            current_vertex = edge.vertex1 if edge.vertex1 != current_vertex else edge.vertex2
-            visited_vertices.add(current_vertex)
-        if current_vertex.is_tail_vertex and direction == "forward" or current_vertex.is_head_vertex and direction == "reverse":
-            result.append(("+", current_vertex.block_name))
-            current_vertex = current_vertex.mate_vertex
-            visited_vertices.add(current_vertex)
-        edge = list(self.get_edges_by_vertex(vertex=current_vertex))[0]
-        current_vertex = edge.vertex1 if edge.vertex1 != current_vertex else edge.vertex2
-        while current_vertex not in visited_vertices and current_vertex.is_regular_vertex:
-            visited_vertices.add(current_vertex)
-            if direction == "forward":
-                sign = "+" if current_vertex.is_tail_vertex else "-"
-            elif direction == "reverse":
-                sign = "-" if current_vertex.is_tail_vertex else "+"
-            else:
-                sign = "*"
-            result.append((sign, current_vertex.block_name))
-            current_vertex = current_vertex.mate_vertex
-            visited_vertices.add(current_vertex)
-            edge = list(self.get_edges_by_vertex(vertex=current_vertex))[0]
-            current_vertex = edge.vertex1 if edge.vertex1 != current_vertex else edge.vertex2
-        visited_vertices.add(current_vertex)
-        if current_vertex.is_irregular_vertex:
-            chr_type = "$"
-        else:
-            chr_type = "@"
-        if direction == "reverse":
-            result = result[::-1]
-        return chr_type, result
+        :param color: a color to get number of edges for
+        :type color: any hashable python object. :class:`bg.genome.BGGenome` is expected
+        :return: number of edges with supplied color (``0`` if there are no such edges)
+        :rtype: ``int``
+        """
+        return len(self.__get_color_index().get(color, ()))
 
-    def _traverse_blocks_forward_from_vertex(self, vertex, visited_vertices):
-        return self._traverse_blocks_from_vertex(vertex=vertex, visited_vertices=visited_vertices, direction="forward")
+    def get_genome_view(self, color):
+        """ Provides a read-only view on a single genome breakpoint graph, that is backed by the color -> edges index of current :class:`BreakpointGraph`
 
-    def _traverse_blocks_reverse_from_vertex(self, vertex, visited_vertices):
-        return self._traverse_blocks_from_vertex(vertex=vertex, visited_vertices=visited_vertices, direction="reverse")
+        No information is copied, so obtaining the view is O(1), and all per-genome traversals (:meth:`BGGenomeView.get_blocks_order`, :meth:`BGGenomeView.get_fragments_orders`) cost only the size of the respective genome.
+        The view reflects all changes, that are further performed on current :class:`BreakpointGraph` through its methods.
 
-    def _traverse_fragments_forward_from_vertex(self, vertex, visited_vertices):
-        return self._traverse_fragments_from_vertex(vertex=vertex, visited_vertices=visited_vertices,
-                                                    direction="forward")
+        :param color: a genome the view is to be created for
+        :type color: any hashable python object. :class:`bg.genome.BGGenome` is expected
+        :return: a single genome view on current :class:`BreakpointGraph`
+        :rtype: :class:`BGGenomeView`
+        """
+        return BGGenomeView(breakpoint_graph=self, color=color, color_index=self.__get_color_index())
 
-    def _traverse_fragments_reverse_from_vertex(self, vertex, visited_vertices):
-        return self._traverse_fragments_from_vertex(vertex=vertex, visited_vertices=visited_vertices,
-                                                    direction="reverse")
+    def get_genome_graph(self, color):
+        """ Creates a new :class:`BreakpointGraph` instance out of all edges in current :class:`BreakpointGraph`, that have supplied color
+
+        Edges, that are parallel from the perspective of supplied color, are merged.
+        Only edges of the respective genome are inspected (see :meth:`BreakpointGraph.get_genome_view`).
+        Result is powered by the storage engine (from :attr:`BreakpointGraph.backends`), current graph was created with or derived from (by :meth:`BreakpointGraph.fork` or :meth:`BreakpointGraph.freeze`),
+        and by :attr:`BreakpointGraph.default_backend` one, if it is not known.
+
+        :param color: a genome, the breakpoint graph is to be created for
+        :type color: any hashable python object. :class:`bg.genome.BGGenome` is expected
+        :return: a single genome breakpoint graph
+        :rtype: :class:`BreakpointGraph`
+        """
+        result = BreakpointGraph(backend=self.__backend if self.__backend in self.backends else None)
+        for edge in self.get_genome_view(color=color).edges():
+            result.__add_bgedge(bgedge=edge, merge=False)
+        return result
 
     def has_edge(self, vertex1, vertex2):
         return self.bg.has_edge(u=vertex1, v=vertex2)
@@ -1060,132 +2119,199 @@ class BreakpointGraph(object):
             result.multicolor += edge.multicolor
         return result
 
-    def get_fragments_orders(self):
-        genome = self.get_overall_set_of_colors().pop()
-        result = {genome: []}
+
+def _apply_to_component_payload(func, payload):
+    """ Rebuilds a :class:`BreakpointGraph` from a connected component payload and applies supplied function to it (is used by :meth:`BreakpointGraph.map_components` in worker processes) """
+    return func(BreakpointGraph.from_component_payload(payload))
+
+
+class BGGenomeView(BGGenomeOrdersMixin):
+    """ A read-only view on a single genome portion of a :class:`BreakpointGraph`, that is obtained through :meth:`BreakpointGraph.get_genome_view`
+
+    View does not copy any information, but rather relies on a live color -> edges index, that is maintained by the parent :class:`BreakpointGraph`.
+    Respective index entry is looked up on every access, so the view reflects edges of respective color, that were added after the view creation.
+    From a perspective of a single genome, all edges between same pair of vertices are presented as a single edge (same as in :meth:`BreakpointGraph.get_genome_graph` result).
+
+    Supports genome traversals, provided by :class:`BGGenomeOrdersMixin`.
+    """
+
+    def __init__(self, breakpoint_graph, color, color_index):
+        """ Initialization of :class:`BGGenomeView` object.
+
+        :param breakpoint_graph: a breakpoint graph the view is created for
+        :type breakpoint_graph: :class:`BreakpointGraph`
+        :param color: a genome the view is created for
+        :type color: any hashable python object. :class:`bg.genome.BGGenome` is expected
+        :param color_index: a live index of the parent breakpoint graph, that maps colors to collections of ``(vertex1, vertex2, key)`` handles of edges, that contain respective color
+        :type color_index: ``dict``
+        """
+        self.breakpoint_graph = breakpoint_graph
+        self.color = color
+        self.__color_index = color_index
+
+    @property
+    def __edges(self):
+        """ A collection of ``(vertex1, vertex2, key)`` handles of edges, that contain respective color """
+        return self.__color_index.get(self.color, {})
+
+    def __len__(self):
+        return len(self.__edges)
+
+    def nodes(self):
+        """ Iterates over vertices, that have at least one edge of respective genome incident to them
+
+        :return: generator over vertices in current genome view
+        :rtype: ``generator``
+        """
         visited_vertices = set()
-        ivs = (v for v in self.nodes() if v.is_irregular_vertex)
-        rvs = (v for v in self.nodes() if v.is_regular_vertex)
-        for vertex in itertools.chain(ivs, rvs):
-            if vertex in visited_vertices:
+        for vertex1, vertex2, _ in list(self.__edges):
+            for vertex in (vertex1, vertex2):
+                if vertex not in visited_vertices:
+                    visited_vertices.add(vertex)
+                    yield vertex
+
+    def edges(self):
+        """ Iterates over edges of respective genome
+
+        :return: generator over edges in current genome view
+        :rtype: ``generator``
+        """
+        visited_pairs = set()
+        for vertex1, vertex2, _ in list(self.__edges):
+            if (vertex1, vertex2) in visited_pairs or (vertex2, vertex1) in visited_pairs:
                 continue
-            chr_type_f, fragments_order_part_forward = self._traverse_fragments_forward_from_vertex(vertex=vertex,
-                                                                                                    visited_vertices=visited_vertices)
-            chr_type_r, fragments_order_part_reverse = self._traverse_fragments_reverse_from_vertex(vertex=vertex,
-                                                                                                    visited_vertices=visited_vertices)
-            if chr_type_f != chr_type_r:
-                raise Exception("During the fragment order sequence traversal we got a conflicted situation. "
-                                "Most probably case for this to happen is to have a genome with non-unique gene content")
-            if chr_type_f == "$":
-                if len(fragments_order_part_forward) == 0:
-                    fragment = fragments_order_part_reverse
-                elif len(fragments_order_part_reverse) == 0:
-                    fragment = fragments_order_part_forward
-                else:
-                    coincide = fragments_order_part_reverse[-1][0] == fragments_order_part_forward[0][0]
-                    coincide &= fragments_order_part_reverse[-1][1] == fragments_order_part_forward[0][1]
-                    if coincide:
-                        fragment = fragments_order_part_reverse[:-1] + fragments_order_part_forward
-                    else:
-                        fragment = fragments_order_part_reverse + fragments_order_part_forward
-            else:
-                fragment = fragments_order_part_forward if len(fragments_order_part_forward) > len(
-                    fragments_order_part_reverse) else fragments_order_part_reverse
-                if len(fragment) > 1 and fragment[-1][0] == fragment[0][0] and fragment[-1][1] == fragment[0][1]:
-                    fragment = fragment[:-1]
-            result[genome].append((chr_type_f, fragment))
-        return result
+            visited_pairs.add((vertex1, vertex2))
+            edge = self.__genome_edge_between_two_vertices(vertex1=vertex1, vertex2=vertex2,
+                                                           edges=self.breakpoint_graph.bg[vertex1][vertex2])
+            if edge is not None:
+                yield edge
 
-    def _traverse_fragments_from_vertex(self, vertex, visited_vertices, direction):
-        result = []
-        current_vertex = vertex
-        current_fragment_name = None
-        current_fragment_orientation = None
-        if current_vertex.is_tail_vertex and direction == "forward" or current_vertex.is_head_vertex and direction == "reverse":
-            current_vertex = current_vertex.mate_vertex
-        elif not (current_vertex.is_irregular_vertex and current_vertex in visited_vertices):
-            visited_vertices.add(current_vertex)
-            edge = list(self.get_edges_by_vertex(vertex=current_vertex))[0]
-            fragment_names = get_from_dict_with_path(source_dict=edge.data, key="name", path=["fragment"])
-            if not isinstance(fragment_names, list):
-                fragment_names = [fragment_names]
-            fragment_orientations = self._get_fragment_to_edge_orientation(current_vertex=current_vertex, edge=edge)
-            fragment_orientations = self.update_orientation_with_direction(orientation=fragment_orientations,
-                                                                           direction=direction)
-            for name, orientation in zip(fragment_names, fragment_orientations):
-                new_encounter = current_fragment_name != name or current_fragment_orientation != name
-                if name not in [None, ""] and orientation not in [None, ""] and new_encounter:
-                    current_fragment_name = name
-                    current_fragment_orientation = orientation
-                    result.append((current_fragment_orientation, current_fragment_name))
-            current_vertex = edge.vertex1 if edge.vertex1 != current_vertex else edge.vertex2
-            visited_vertices.add(current_vertex)
-            if not current_vertex.is_irregular_vertex:
-                current_vertex = current_vertex.mate_vertex
-        while current_vertex not in visited_vertices and not current_vertex.is_irregular_vertex:
-            visited_vertices.add(current_vertex)
-            edge = list(self.get_edges_by_vertex(vertex=current_vertex))[0]
-            fragment_names = get_from_dict_with_path(source_dict=edge.data, key="name", path=["fragment"])
-            if not isinstance(fragment_names, list):
-                fragment_names = [fragment_names]
-            fragment_orientations = self._get_fragment_to_edge_orientation(current_vertex=current_vertex, edge=edge)
-            fragment_orientations = self.update_orientation_with_direction(orientation=fragment_orientations,
-                                                                           direction=direction)
-            if current_fragment_name == fragment_names[-1]:
-                fragment_names = fragment_names[::-1]
-                fragment_orientations = fragment_orientations[::-1]
-            for name, orientation in zip(fragment_names, fragment_orientations):
-                initial_state = current_fragment_name is None or current_fragment_orientation is None
-                new_encounter = current_fragment_name != name or current_fragment_orientation != orientation
-                new_encounter &= name not in [None, ""] and orientation not in [None, ""]
-                if initial_state or new_encounter:
-                    current_fragment_name = name
-                    current_fragment_orientation = orientation
-                    if current_fragment_name not in [None, ""] and current_fragment_orientation not in [None, ""]:
-                        result.append((current_fragment_orientation, current_fragment_name))
-            current_vertex = edge.vertex1 if edge.vertex1 != current_vertex else edge.vertex2
-            if current_vertex.is_irregular_vertex:
-                break
-            visited_vertices.add(current_vertex)
-            current_vertex = current_vertex.mate_vertex
+    def get_edges_by_vertex(self, vertex):
+        """ Iterates over edges of respective genome, that are incident to supplied vertex
 
-        visited_vertices.add(current_vertex)
-        if current_vertex.is_irregular_vertex:
-            chr_type = "$"
-        else:
-            chr_type = "@"
-        if direction == "reverse":
-            result = result[::-1]
-        return chr_type, result
+        :param vertex: a vertex object in parent :class:`BreakpointGraph` object
+        :type vertex: any hashable object. :class:`bg.vertex.BGVertex` object is expected.
+        :return: generator over edges in current genome view, that are incident to supplied vertex
+        :rtype: ``generator``
+        """
+        if vertex not in self.breakpoint_graph.bg:
+            return
+        for neighbour, edges in self.breakpoint_graph.bg[vertex].items():
+            edge = self.__genome_edge_between_two_vertices(vertex1=vertex, vertex2=neighbour, edges=edges)
+            if edge is not None:
+                yield edge
 
-    @staticmethod
-    def _get_fragment_to_edge_orientation(current_vertex, edge):
-        v1, v2 = (edge.vertex1, edge.vertex2) if edge.vertex1 == current_vertex else (edge.vertex2, edge.vertex1)
-        forward_orientation = get_from_dict_with_path(source_dict=edge.data, key="forward_orientation",
-                                                      path=["fragment"])
-        if isinstance(forward_orientation, list):
-            return ["+" if BreakpointGraph._forward_orientation(v1, v2, orientation) else "-" for orientation in
-                    forward_orientation]
-        else:
-            return ["+" if BreakpointGraph._forward_orientation(v1, v2, forward_orientation) else "-"]
+    def __genome_edge_between_two_vertices(self, vertex1, vertex2, edges):
+        """ Combines all edges of respective genome out of supplied ``key -> edge attributes`` mapping into a single :class:`bg.edge.BGEdge`
 
-    @staticmethod
-    def _forward_orientation(v1, v2, forward_orientation):
-        if forward_orientation is None:
-            return True
-        left_v = v1 not in forward_orientation or forward_orientation[0] == v1
-        right_v = v2 not in forward_orientation or forward_orientation[1] == v2
-        return left_v and right_v
+        :return: an edge, with multicolor multiplicity corresponding to a number of combined edges, or ``None`` if there are no edges of respective genome
+        :rtype: :class:`bg.edge.BGEdge`
+        """
+        genome_edges_data = [data["attr_dict"]["data"] for data in edges.values()
+                             if self.color in data["attr_dict"]["multicolor"].multicolors]
+        if len(genome_edges_data) == 0:
+            return None
+        data = genome_edges_data[0] if len(genome_edges_data) == 1 else {}
+        return BGEdge(vertex1=vertex1, vertex2=vertex2, multicolor=Multicolor(*([self.color] * len(genome_edges_data))),
+                      data=data)
 
-    @staticmethod
-    def update_orientation_with_direction(orientation, direction):
-        result = []
-        for entry in orientation:
-            if direction == "forward":
-                result.append(entry)
-            else:
-                result.append("-" if entry == "+" else "+")
-        return result
+    def get_overall_set_of_colors(self):
+        return {self.color} if len(self.__edges) > 0 else set()
+
+
+class BGComponentView(object):
+    """ A lightweight read-only view on a single connected component of a :class:`BreakpointGraph`, that is obtained through :meth:`BreakpointGraph.connected_components_views`
+
+    View does not copy any information, but rather references a set of vertices of the component and the parent :class:`BreakpointGraph`.
+    The following summaries are precomputed on view creation:
+
+    *   :attr:`BGComponentView.number_of_vertices`: a number of vertices in the component
+    *   :attr:`BGComponentView.number_of_edges`: a number of edges in the component
+    *   :attr:`BGComponentView.colors`: a set of colors, that are present on edges of the component
+    *   :attr:`BGComponentView.has_irregular_vertices`: a flag indicating if there is at least one irregular vertex in the component
+    """
+
+    def __init__(self, breakpoint_graph, vertices, number_of_edges, colors, has_irregular_vertices):
+        """ Initialization of :class:`BGComponentView` object.
+
+        :param breakpoint_graph: a breakpoint graph the component belongs to
+        :type breakpoint_graph: :class:`BreakpointGraph`
+        :param vertices: vertices of the component
+        :type vertices: ``set``
+        :param number_of_edges: a number of edges in the component
+        :type number_of_edges: ``int``
+        :param colors: colors, that are present on edges of the component
+        :type colors: ``set``
+        :param has_irregular_vertices: a flag indicating if there is at least one irregular vertex in the component
+        :type has_irregular_vertices: ``Boolean``
+        """
+        self.breakpoint_graph = breakpoint_graph
+        self.vertices = vertices
+        self.number_of_vertices = len(vertices)
+        self.number_of_edges = number_of_edges
+        self.colors = colors
+        self.has_irregular_vertices = has_irregular_vertices
+
+    def __len__(self):
+        return self.number_of_vertices
+
+    def __contains__(self, vertex):
+        return vertex in self.vertices
+
+    def nodes(self):
+        """ Iterates over vertices in current component view
+
+        :return: generator over vertices in current component view
+        :rtype: ``generator``
+        """
+        for vertex in self.vertices:
+            yield vertex
+
+    def edges(self):
+        """ Iterates over edges in current component view
+
+        :return: generator over edges in current component view
+        :rtype: ``generator`` over :class:`bg.edge.BGEdge`
+        """
+        for v1, v2, _, multicolor, data in self.breakpoint_graph.iter_edges_raw(nbunch=self.vertices):
+            yield BGEdge(vertex1=v1, vertex2=v2, multicolor=multicolor, data=data)
+
+    def get_edges_by_vertex(self, vertex):
+        """ Iterates over edges in current component view, that are incident to supplied vertex
+
+        :return: generator over edges in current component view
+        :rtype: ``generator`` over :class:`bg.edge.BGEdge`
+        """
+        if vertex not in self.vertices:
+            return
+        for bgedge in self.breakpoint_graph.get_edges_by_vertex(vertex=vertex):
+            yield bgedge
+
+    def get_overall_set_of_colors(self):
+        """ Provides a set of all colors, that are present on edges in current component view """
+        return self.colors
+
+    def to_payload(self):
+        """ Provides a compact picklable representation of current component view, that can be turned into a :class:`BreakpointGraph` with :meth:`BreakpointGraph.from_component_payload`
+
+        :return: a pair of a tuple of vertices and a tuple of ``(vertex1, vertex2, multicolor, data)`` edge tuples
+        :rtype: ``tuple``
+        """
+        edges = tuple((v1, v2, multicolor, data)
+                      for v1, v2, _, multicolor, data in self.breakpoint_graph.iter_edges_raw(nbunch=self.vertices))
+        return tuple(self.vertices), edges
+
+    def to_breakpoint_graph(self, copy=True):
+        """ Creates a :class:`BreakpointGraph` out of current component view, the same way :meth:`BreakpointGraph.connected_components_subgraphs` does
+
+        :param copy: a flag to signal if graph structure has to be copied, or a view on the parent graph has to be utilized
+        :type copy: ``Boolean``
+        :rtype: :class:`BreakpointGraph`
+        """
+        component = self.breakpoint_graph.bg.subgraph(self.vertices)
+        if copy:
+            component = component.copy()
+        return BreakpointGraph(component)
 
 
 class BGConnectedComponentFilter(object):
@@ -1202,6 +2328,10 @@ class CompleteMultiEdgeConnectedComponentFilter(BGConnectedComponentFilter):
         self.name = "Complete ME filter"
 
     def accept_connected_component(self, cc, breakpoint_graph=None):
+        if isinstance(cc, BGComponentView):
+            if cc.number_of_vertices != 2:
+                return True
+            return len(breakpoint_graph.get_overall_set_of_colors()) != len(cc.colors)
         if len(list(cc.nodes())) != 2:
             return True
         genomes_cnt = len(breakpoint_graph.get_overall_set_of_colors())
@@ -1215,4 +2345,6 @@ class TwoNodeConnectedComponentFilter(BGConnectedComponentFilter):
         self.name = "Two node filter"
 
     def accept_connected_component(self, cc, breakpoint_graph=None):
+        if isinstance(cc, BGComponentView):
+            return cc.number_of_vertices != 2
         return len(list(cc.nodes())) != 2
@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+import hashlib
+from collections import deque
+from itertools import count
+
+import networkx as nx
+from networkx.algorithms.isomorphism import categorical_multiedge_match, categorical_node_match
+
+__author__ = "Sergey Aganezov"
+__email__ = "aganezov(at)cs.jhu.edu"
+__status__ = "production"
+
+
+class BGComponentTracker(object):
+    """ Class providing incremental tracking of connected components of a graph, that is used as a storage engine in :class:`bg.breakpoint_graph.BreakpointGraph`
+
+    Every vertex is assigned an integer component id, which is maintained while edges are added to / removed from the graph:
+
+    *   addition of an edge merges components of its vertices (vertices of a smaller component are relabeled)
+    *   removal of a last edge between two vertices triggers a local check, performed by two simultaneous breadth first searches started from both vertices,
+        if one of the searches exhausts before meeting the other one, vertices visited by it form a new component. Thus the cost of the check is bounded by the size of a smaller part.
+
+    Ids of components, that were created or changed (structurally, or by a change of multicolor of some edge in it) since the last :meth:`BGComponentTracker.get_touched_components` call, are recorded.
+
+    Tracker does not observe the graph on its own, it is notified about changes by :class:`bg.breakpoint_graph.BreakpointGraph`, that utilizes it
+    (see :meth:`bg.breakpoint_graph.BreakpointGraph.enable_components_tracking`).
+    """
+
+    def __init__(self, graph):
+        """ Initialization of :class:`BGComponentTracker` object.
+
+        Assigns component ids to all vertices, that are currently present in supplied graph.
+
+        :param graph: a graph, connected components of which are to be tracked
+        :type graph: NetworkX MultiGraph or :class:`bg.storage.CompactMultiGraph`
+        :return: a new instance of :class:`BGComponentTracker`
+        :rtype: :class:`BGComponentTracker`
+        """
+        self.graph = graph
+        self.__ids = count()
+        self.__vertex_components = {}
+        self.__components = {}
+        self.__touched = set()
+        for vertex in graph.nodes():
+            if vertex in self.__vertex_components:
+                continue
+            component_id = self.__new_component()
+            queue = deque([vertex])
+            self.__assign(vertex, component_id)
+            while queue:
+                for neighbour in self.graph[queue.popleft()]:
+                    if neighbour not in self.__vertex_components:
+                        self.__assign(neighbour, component_id)
+                        queue.append(neighbour)
+        self.__touched.clear()
+
+    def __new_component(self):
+        component_id = next(self.__ids)
+        self.__components[component_id] = set()
+        self.__touched.add(component_id)
+        return component_id
+
+    def __assign(self, vertex, component_id):
+        self.__vertex_components[vertex] = component_id
+        self.__components[component_id].add(vertex)
+
+    def __len__(self):
+        return len(self.__components)
+
+    def __contains__(self, vertex):
+        return vertex in self.__vertex_components
+
+    def get_component_id(self, vertex):
+        """ Provides an id of a connected component, supplied vertex belongs to
+
+        :param vertex: a vertex of the tracked graph
+        :type vertex: any hashable python object. :class:`bg.vertex.BGVertex` is expected
+        :return: a component id, or ``None`` if supplied vertex is not present in the tracked graph
+        :rtype: ``int``
+        """
+        return self.__vertex_components.get(vertex, None)
+
+    def get_component_vertices(self, component_id):
+        """ Provides a set of vertices, that form a connected component with supplied id
+
+        :param component_id: an id of a connected component
+        :type component_id: ``int``
+        :return: a set of vertices, that must not be modified (empty, if there is no component with supplied id)
+        :rtype: ``set``
+        """
+        return self.__components.get(component_id, set())
+
+    def get_components(self):
+        """ Iterates over all connected components as pairs of component id and set of vertices in it
+
+        :return: generator over ``(component_id, vertices)`` pairs
+        :rtype: ``generator``
+        """
+        for component_id, vertices in list(self.__components.items()):
+            yield component_id, vertices
+
+    def get_touched_components(self, reset=True):
+        """ Provides connected components, that were created or changed since the previous call (or tracker creation)
+
+        :param reset: a flag to indicate if the record of touched components is to be reset
+        :type reset: ``Boolean``
+        :return: a mapping from component ids to respective sets of vertices
+        :rtype: ``dict``
+        """
+        result = {component_id: self.__components[component_id] for component_id in self.__touched
+                  if component_id in self.__components}
+        if reset:
+            self.__touched.clear()
+        return result
+
+    def add_vertex(self, vertex):
+        """ Records a vertex, that was added to the tracked graph, as a single vertex component (if it is not tracked already) """
+        if vertex not in self.__vertex_components:
+            self.__assign(vertex, self.__new_component())
+
+    def touch(self, vertex):
+        """ Records a change of edges of supplied vertex (such as multicolor change), that does not affect connectivity, marking its component as touched """
+        component_id = self.__vertex_components.get(vertex, None)
+        if component_id is not None:
+            self.__touched.add(component_id)
+
+    def add_edge(self, vertex1, vertex2):
+        """ Records an edge, that was added to the tracked graph, merging components of its vertices """
+        self.add_vertex(vertex1)
+        self.add_vertex(vertex2)
+        component1, component2 = self.__vertex_components[vertex1], self.__vertex_components[vertex2]
+        self.__touched.add(component1)
+        if component1 == component2:
+            return
+        if len(self.__components[component1]) < len(self.__components[component2]):
+            component1, component2 = component2, component1
+        for vertex in self.__components.pop(component2):
+            self.__assign(vertex, component1)
+        self.__touched.discard(component2)
+        self.__touched.add(component1)
+
+    def remove_edge(self, vertex1, vertex2):
+        """ Records a removal of an edge from the tracked graph, splitting a component if it fell apart """
+        if vertex1 in self.graph and vertex2 in self.graph[vertex1]:
+            self.touch(vertex1)
+            return
+        self.__separate(vertex1, vertex2)
+
+    def remove_vertex(self, vertex, neighbours):
+        """ Records a removal of a vertex (and all edges incident to it) from the tracked graph
+
+        :param vertex: a removed vertex
+        :param neighbours: vertices, that were adjacent to the removed one
+        :type neighbours: iterable
+        """
+        component_id = self.__vertex_components.pop(vertex, None)
+        if component_id is None:
+            return
+        self.__components[component_id].discard(vertex)
+        if len(self.__components[component_id]) == 0:
+            del self.__components[component_id]
+            return
+        self.__touched.add(component_id)
+        neighbours = [neighbour for neighbour in neighbours if neighbour != vertex]
+        for neighbour in neighbours[1:]:
+            self.__separate(neighbours[0], neighbour)
+
+    def __separate(self, vertex1, vertex2):
+        """ Checks if two vertices from the same component are still connected, and moves vertices of a smaller part into a new component otherwise """
+        component_id = self.__vertex_components.get(vertex1, None)
+        if component_id is None or component_id != self.__vertex_components.get(vertex2, None):
+            return
+        self.__touched.add(component_id)
+        if vertex1 == vertex2:
+            return
+        visited = ({vertex1}, {vertex2})
+        queues = (deque([vertex1]), deque([vertex2]))
+        while True:
+            for side in (0, 1):
+                queue, own, other = queues[side], visited[side], visited[1 - side]
+                if not queue:
+                    new_component_id = self.__new_component()
+                    self.__components[component_id] -= own
+                    for vertex in own:
+                        self.__assign(vertex, new_component_id)
+                    return
+                for neighbour in self.graph[queue.popleft()]:
+                    if neighbour in other:
+                        return
+                    if neighbour not in own:
+                        own.add(neighbour)
+                        queue.append(neighbour)
+
+
+def _multicolor_label(multicolor):
+    """ Provides a process independent string label of a multicolor, that is used while fingerprints are computed """
+    return ",".join(sorted("{color}:{multiplicity}".format(color=getattr(color, "name", color), multiplicity=multiplicity)
+                           for color, multiplicity in multicolor.multicolors.items()))
+
+
+def _digest(value):
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()
+
+
+def get_component_fingerprint(component):
+    """ Computes a fingerprint of a multicolored structure of supplied connected component, that does not depend on particular vertices in it
+
+    Two components, that are isomorphic (with respect to regular / irregular vertex types and multicolors of edges), always have the same fingerprint.
+    Fingerprint is obtained by Weisfeiler-Lehman color refinement: every vertex is initially labeled by its type,
+    and on every iteration its label is extended with a sorted multiset of ``(multicolor, neighbour label)`` pairs for all edges incident to it, until the partition of vertices stops changing.
+    The converse is not guaranteed (though it holds for all small components, that usually occur in breakpoint graphs), which is why :class:`BGComponentMemo` verifies fingerprint matches.
+
+    :param component: a connected component
+    :type component: :class:`bg.breakpoint_graph.BreakpointGraph` or :class:`bg.breakpoint_graph.BGComponentView`
+    :return: a hex digest string
+    :rtype: ``str``
+    """
+    labels = {vertex: "i" if vertex.is_irregular_vertex else "r" for vertex in component.nodes()}
+    incidence = {vertex: [] for vertex in labels}
+    multicolor_labels = {}
+    number_of_edges = 0
+    for edge in component.edges():
+        number_of_edges += 1
+        multicolor = edge.multicolor
+        if multicolor not in multicolor_labels:
+            multicolor_labels[multicolor] = _multicolor_label(multicolor)
+        label = multicolor_labels[multicolor]
+        incidence[edge.vertex1].append((label, edge.vertex2))
+        if edge.vertex1 != edge.vertex2:
+            incidence[edge.vertex2].append((label, edge.vertex1))
+    number_of_classes = len(set(labels.values()))
+    for _ in range(len(labels)):
+        labels = {vertex: _digest(labels[vertex] + "|" + ";".join(sorted(edge_label + ">" + labels[neighbour]
+                                                                       for edge_label, neighbour in incidence[vertex])))
+                  for vertex in labels}
+        new_number_of_classes = len(set(labels.values()))
+        if new_number_of_classes == number_of_classes:
+            break
+        number_of_classes = new_number_of_classes
+    return _digest("{vertices}|{edges}|{labels}".format(vertices=len(labels), edges=number_of_edges,
+                                                       labels=";".join(sorted(labels.values()))))
+
+
+class BGComponentMemo(object):
+    """ A memoization cache for per-component analyses, that are keyed by a structure of connected components, rather than their particular vertices
+
+    Supplied function is invoked once per distinct (up to isomorphism, see :func:`get_component_fingerprint`) component, and its result is reused for all isomorphic components afterwards.
+    Thus supplied function must produce results, that do not refer to particular vertices of a component (such as scores, distances, or counts).
+
+    As different components may share a fingerprint, a matched component is by default verified to be isomorphic to the one, the stored result was computed for.
+    Verification can be turned off, if fingerprint collisions are known to be impossible for the components at hand.
+    """
+
+    def __init__(self, func, verify=True):
+        """ Initialization of :class:`BGComponentMemo` object.
+
+        :param func: a function to be memoized
+        :type func: callable, that accepts a single connected component
+        :param verify: a flag to indicate if components with equal fingerprints have to be checked for isomorphism
+        :type verify: ``Boolean``
+        """
+        self.func = func
+        self.verify = verify
+        self.hits = 0
+        self.misses = 0
+        self.__entries = {}
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.__entries.values())
+
+    def __call__(self, component):
+        """ Provides a result of memoized function for supplied connected component, computing it only if no isomorphic component was processed before
+
+        :param component: a connected component
+        :type component: :class:`bg.breakpoint_graph.BreakpointGraph` or :class:`bg.breakpoint_graph.BGComponentView`
+        :return: a result of memoized function
+        """
+        entries = self.__entries.setdefault(get_component_fingerprint(component), [])
+        structure = self.__get_structure(component) if self.verify else None
+        for representative, result in entries:
+            if not self.verify or self.__is_isomorphic(structure, representative):
+                self.hits += 1
+                return result
+        self.misses += 1
+        result = self.func(component)
+        entries.append((structure, result))
+        return result
+
+    def clear(self):
+        """ Removes all memoized results and resets hits / misses counters """
+        self.__entries.clear()
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def __get_structure(component):
+        """ Creates a plain NetworkX MultiGraph, that holds vertex types and multicolors of supplied component, to be used in isomorphism checks """
+        result = nx.MultiGraph()
+        for vertex in component.nodes():
+            result.add_node(vertex, irregular=vertex.is_irregular_vertex)
+        for edge in component.edges():
+            result.add_edge(edge.vertex1, edge.vertex2, multicolor=frozenset(edge.multicolor.multicolors.items()))
+        return result
+
+    @staticmethod
+    def __is_isomorphic(structure1, structure2):
+        return nx.is_isomorphic(structure1, structure2,
+                                node_match=categorical_node_match("irregular", None),
+                                edge_match=categorical_multiedge_match("multicolor", None))
@@ -25,8 +25,8 @@ def get_all_cycles(breakpoint_graph):
 
 def get_all_paths(breakpoint_graph):
     ccs = []
-    for cc in breakpoint_graph.connected_components_subgraphs(copy=False):
-        if any(map(lambda vertex: vertex.is_irregular_vertex, cc.nodes())):
+    for cc in breakpoint_graph.connected_components_views():
+        if cc.has_irregular_vertices:
             ccs.append(cc)
             continue
     return ccs
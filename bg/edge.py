@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from marshmallow import Schema, fields, post_load
 
-from bg.utils import dicts_are_equal, recursive_dict_update
+from bg.utils import InstanceOverridableAttribute, SlotsStateMixin, dicts_are_equal, recursive_dict_update
 
 __author__ = "Sergey Aganezov"
 __email__ = "aganezov(at)cs.jhu.edu"
@@ -11,7 +11,7 @@ __status__ = "production"
 BGEdge_JSON_SCHEMA_JSON_KEY = "_py__bg_edge_json_schema"
 
 
-class BGEdge(object):
+class BGEdge(SlotsStateMixin):
     """ A wrapper class for edges in :class:`bg.breakpoint_graph.BreakpointGraph`
 
     Is not stored on its own in the :class:`bg.breakpoint_graph.BreakpointGraph`, but is rather can be supplied to work with and is returned if retrieval is performed.
@@ -28,6 +28,8 @@ class BGEdge(object):
     *   :meth:`BGEdge.merge`: produces a new BGEdge with multi-color information being merged from them
     """
 
+    __slots__ = ("vertex1", "vertex2", "multicolor", "data", "_json_schema")
+
     class BGEdgeJSONSchema(Schema):
         """ Marshmallow powered JSON schema used for serialization / deserialization of edge object """
         _py__bg_edge_json_schema = fields.String(attribute="json_schema_name")
@@ -50,7 +52,7 @@ class BGEdge(object):
 
     # class wide variable for json serialization/deserialization. Created once for a whole class, as thousands of objects
     # undergo serialization / deserialization, and schema instantiation in each case would require additional resources
-    json_schema = BGEdgeJSONSchema()
+    json_schema = InstanceOverridableAttribute(default=BGEdgeJSONSchema(), slot="_json_schema")
 
     @classmethod
     def create_default_data_dict(cls):
@@ -122,15 +124,35 @@ class BGEdge(object):
         else:
             return self.vertex2 == other.vertex1 and multicolor_equality and data_equality
 
+    # a mapping from `is_<something>_edge` requests to respective `is_<something>_vertex` requests, so that no string manipulations are performed on repeated lookups
+    _VERTEX_PREDICATES = {}
+
     def __getattr__(self, item):
-        if item.startswith("is_") and item.endswith("_edge"):
-            lookup = item[3:-5]
-            vertex_lookup = "is_" + lookup + "_vertex"
-            if getattr(self.vertex1, vertex_lookup) or getattr(self.vertex2, vertex_lookup):
-                return True
-            return False
+        # an edge is considered to be "something" edge, if any of its vertices is a "something" vertex
+        # most frequently utilized checks are implemented as properties, the rest of them is handled here
+        vertex_lookup = self._VERTEX_PREDICATES.get(item)
+        if vertex_lookup is None and item.startswith("is_") and item.endswith("_edge"):
+            vertex_lookup = self._VERTEX_PREDICATES.setdefault(item, "is_" + item[3:-5] + "_vertex")
+        if vertex_lookup is not None:
+            return getattr(self.vertex1, vertex_lookup) or getattr(self.vertex2, vertex_lookup)
         return super(BGEdge, self).__getattribute__(item)
 
+    @property
+    def is_regular_edge(self):
+        return self.vertex1.is_regular_vertex or self.vertex2.is_regular_vertex
+
+    @property
+    def is_irregular_edge(self):
+        return self.vertex1.is_irregular_vertex or self.vertex2.is_irregular_vertex
+
+    @property
+    def is_infinity_edge(self):
+        return self.vertex1.is_infinity_vertex or self.vertex2.is_infinity_vertex
+
+    @property
+    def is_repeat_edge(self):
+        return self.vertex1.is_repeat_vertex or self.vertex2.is_repeat_vertex
+
     @property
     def json_schema_name(self):
         """ When genome is serialized information about JSON schema of such serialization can be recorded,
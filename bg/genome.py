@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from marshmallow import Schema, fields, post_load
 
+from bg.utils import InstanceOverridableAttribute, SlotsStateMixin
+
 __author__ = "aganezov"
 __email__ = "aganezov(at)cs.jhu.edu"
 __status__ = "production"
@@ -9,12 +11,15 @@ __status__ = "production"
 BGGenome_JSON_SCHEMA_JSON_KEY = "_py__bg_genome_json_schema"
 
 
-class BGGenome(object):
+class BGGenome(SlotsStateMixin):
     """ A class that represent a genome object for the breakpoint graph
 
      For purposes of breakpoint graph no additional information about genome is needed, except its name, that is used in various
      algorithmic tasks (multicolor splitting, tree traversing, etc)
     """
+
+    __slots__ = ("name", "_json_schema")
+
     class BGGenomeJSONSchema(Schema):
         """ a JSON schema powered by marshmallow library to serialize/deserialize genome object into/from JSON format
         """
@@ -31,7 +36,7 @@ class BGGenome(object):
 
     # class wide variable for json serialization/deserialization. Created once for a whole class, as thousands of objects
     # undergo serialization / deserialization, and schema instantiation in each case would require additional resources
-    json_schema = BGGenomeJSONSchema()
+    json_schema = InstanceOverridableAttribute(default=BGGenomeJSONSchema(), slot="_json_schema")
 
     def __init__(self, name):
         self.name = name
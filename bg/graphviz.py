@@ -496,7 +496,7 @@ class BreakpointGraphProcessor(GraphProcessor):
         vertices_entries = []
         edges_entries = []
         filters_results = defaultdict(int)
-        for cc in graph.connected_components_subgraphs(copy=False):
+        for cc in graph.connected_components_views():
             for cc_filter in self.cc_filters:
                 if not cc_filter.accept_connected_component(cc=cc, breakpoint_graph=graph):
                     filters_results[cc_filter.name] += 1
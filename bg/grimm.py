@@ -8,7 +8,7 @@ from bg.edge import BGEdge
 from bg.genome import BGGenome
 from bg.multicolor import Multicolor
 from bg.utils import add_to_dict_with_path
-from bg.vertices import BlockVertex, TaggedVertex, TaggedBlockVertex, TaggedInfinityVertex, BGVertex
+from bg.vertices import BlockVertex, TaggedVertex, TaggedBlockVertex, TaggedInfinityVertex, BGVertex, BGVertexPool
 
 __author__ = "Sergey Aganezov"
 __email__ = "aganezov(at)cs.jhu.edu"
@@ -159,13 +159,17 @@ class GRIMMReader(object):
         return chr_type, blocks
 
     @staticmethod
-    def __assign_vertex_pair(block):
+    def __assign_vertex_pair(block, vertex_pool=None):
         """ Assigns usual BreakpointGraph type vertices to supplied block.
 
         Vertices are labeled as "block_name" + "h" and "block_name" + "t" according to blocks orientation.
+        If a vertex pool is supplied, canonical vertices from it are returned (and newly created vertices are interned in it),
+        so that all occurrences of the same block share a single pair of vertices, that are mates of each other.
 
         :param block: information about a genomic block to create a pair of vertices for in a format of ( ``+`` | ``-``, block_name)
         :type block: ``(str, str)``
+        :param vertex_pool: an interning registry for created vertices
+        :type vertex_pool: :class:`bg.vertices.BGVertexPool` or ``None``
         :return: a pair of vertices labeled according to supplied blocks name (respecting blocks orientation)
         :rtype: ``(str, str)``
         """
@@ -178,23 +182,38 @@ class GRIMMReader(object):
                 tag_entry.append(None)
             elif len(tag_entry) > 2:
                 tag_entry[1:] = [TaggedVertex.TAG_SEPARATOR.join(tag_entry[1:])]
-        tail, head = root_name + "t", root_name + "h"
-        tail, head = TaggedBlockVertex(tail), TaggedBlockVertex(head)
-        tail.mate_vertex = head
-        head.mate_vertex = tail
+        tail, head = TaggedBlockVertex(root_name + "t"), None
         for tag, value in tags:
-            head.add_tag(tag, value)
             tail.add_tag(tag, value)
+        if vertex_pool is not None:
+            ###############################################################################################
+            #
+            # a canonical tail vertex (if present) already has a canonical head vertex as its mate,
+            # so a head vertex is created only for a block, that is encountered for the first time
+            #
+            ###############################################################################################
+            tail = vertex_pool.intern(tail)
+            head = getattr(tail, "mate_vertex", None)
+        if head is None:
+            head = TaggedBlockVertex(root_name + "h")
+            for tag, value in tags:
+                head.add_tag(tag, value)
+            if vertex_pool is not None:
+                head = vertex_pool.intern(head)
+            tail.mate_vertex = head
+            head.mate_vertex = tail
         return (tail, head) if sign == "+" else (head, tail)
 
     @staticmethod
-    def get_edges_from_parsed_data(parsed_data):
+    def get_edges_from_parsed_data(parsed_data, vertex_pool=None):
         """ Taking into account fragment type (circular|linear) and retrieved gene order information translates adjacencies between blocks into edges for addition to the :class:`bg.breakpoint_graph.BreakpointGraph`
 
         In case supplied fragment is linear (``$``) special artificial vertices (with ``__infinity`` suffix) are introduced to denote fragment extremities
 
         :param parsed_data: (``$`` | ``@``, [(``+`` | ``-``, block_name),...]) formatted data about fragment type and ordered list of oriented blocks
         :type parsed_data: ``tuple(str, list((str, str), ...))``
+        :param vertex_pool: an interning registry, that canonical instances of all produced vertices are taken from
+        :type vertex_pool: :class:`bg.vertices.BGVertexPool` or ``None``
         :return: a list of vertices pairs that would correspond to edges in :class:`bg.breakpoint_graph.BreakpointGraph`
         :rtype: ``list((str, str), ...)``
         """
@@ -206,7 +225,7 @@ class GRIMMReader(object):
             # each block is represented as a pair of vertices (that correspond to block extremities)
             #
             ###############################################################################################
-            v1, v2 = GRIMMReader.__assign_vertex_pair(block)
+            v1, v2 = GRIMMReader.__assign_vertex_pair(block, vertex_pool=vertex_pool)
             vertices.append(v1)
             vertices.append(v2)
         if chr_type == "@":
@@ -248,24 +267,34 @@ class GRIMMReader(object):
             left_iv, right_iv = TaggedInfinityVertex(left_iv_root_name), TaggedInfinityVertex(right_iv_root_name)
             left_iv.tags = left_iv_tags
             right_iv.tags = right_iv_tags
+            if vertex_pool is not None:
+                left_iv, right_iv = vertex_pool.intern(left_iv), vertex_pool.intern(right_iv)
             vertices.insert(0, left_iv)
             vertices.append(right_iv)
         return [(v1, v2) for v1, v2 in zip(vertices[::2], vertices[1::2])]
 
     @staticmethod
-    def get_breakpoint_graph(stream, merge_edges=True):
+    def get_breakpoint_graph(stream, merge_edges=True, vertex_pool=None):
         """ Taking a file-like object transforms supplied gene order data into the language of
 
+        All vertices in produced breakpoint graph are interned, so that every block extremity is represented by a single vertex object
+        (which ``mate_vertex`` is the one stored in the graph as well), no matter how many genomes the block is present in.
+
         :param merge_edges: a flag that indicates if parallel edges in produced breakpoint graph shall be merged or not
         :type merge_edges: ``bool``
+        :param vertex_pool: an interning registry to take canonical vertices from, a new one is created for every graph, if not supplied (share a pool to share vertices between several graphs)
+        :type vertex_pool: :class:`bg.vertices.BGVertexPool` or ``None``
         :param stream: any iterable object where each iteration produces a ``str`` object
         :type stream: ``iterable`` ver ``str``
         :return: an instance of a BreakpointGraph that contains information about adjacencies in genome specified in GRIMM formatted input
         :rtype: :class:`bg.breakpoint_graph.BreakpointGraph`
         """
         result = BreakpointGraph()
+        if vertex_pool is None:
+            vertex_pool = BGVertexPool()
         current_genome = None
         fragment_data = {}
+        bgedges = []
         for line in stream:
             line = line.strip()
             if len(line) == 0:
@@ -299,7 +328,7 @@ class GRIMMReader(object):
                 #
                 ###############################################################################################
                 parsed_data = GRIMMReader.parse_data_string(data_string=line)
-                edges = GRIMMReader.get_edges_from_parsed_data(parsed_data=parsed_data)
+                edges = GRIMMReader.get_edges_from_parsed_data(parsed_data=parsed_data, vertex_pool=vertex_pool)
                 for v1, v2 in edges:
                     edge_specific_data = {
                         "fragment": {
@@ -308,8 +337,8 @@ class GRIMMReader(object):
                     }
                     edge = BGEdge(vertex1=v1, vertex2=v2, multicolor=Multicolor(current_genome), data=deepcopy(fragment_data))
                     edge.update_data(source=edge_specific_data)
-                    result.add_bgedge(bgedge=edge,
-                                      merge=merge_edges)
+                    bgedges.append(edge)
+        result.add_bgedges(bgedges=bgedges, merge=merge_edges)
         return result
 
     @classmethod
@@ -348,7 +377,7 @@ class GRIMMWriter(object):
         result = []
         genomes = bg.get_overall_set_of_colors()
         for genome in genomes:
-            genome_graph = bg.get_genome_graph(color=genome)
+            genome_graph = bg.get_genome_view(color=genome)
             genome_blocks_orders = genome_graph.get_blocks_order()
             blocks_orders = genome_blocks_orders[genome]
             if len(blocks_orders) > 0:
@@ -370,7 +399,7 @@ class GRIMMWriter(object):
         result = []
         genomes = bg.get_overall_set_of_colors()
         for genome in genomes:
-            genome_graph = bg.get_genome_graph(color=genome)
+            genome_graph = bg.get_genome_view(color=genome)
             fragments_orders = genome_graph.get_fragments_orders()
             fragments_orders = fragments_orders[genome]
             if len(fragments_orders) > 0 and any(map(lambda entry: len(entry[1]) > 0, fragments_orders)):
@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 from collections import Counter
-from copy import deepcopy
+from weakref import WeakValueDictionary
+
+from bg.utils import SlotsStateMixin
 
 __author__ = "Sergey Aganezov"
 __email__ = "aganezov(at)cs.jhu.edu"
 __status__ = "production"
 
 
-class Multicolor(object):
+class Multicolor(SlotsStateMixin):
     """ Class providing implementation of multi-color notion for edges in :class:`bg.breakpoint_graph.BreakpointGraph`.
 
     Multi-color is a specific property of edges in Breakpoint Graph combinatorial object which represents similar adjacencies between genomic material in multiple genomes.
@@ -28,6 +30,8 @@ class Multicolor(object):
     *    :meth:`Multicolor.split_colors` produces several new instances of :class:`Multicolor` object by splitting information about colors by using provided guidance iterable set-like object
     """
 
+    __slots__ = ("multicolors",)
+
     def __init__(self, *args):
         """ Initialization of :class:`Multicolor` object.
 
@@ -178,16 +182,26 @@ class Multicolor(object):
 
         Multiplicity of all separated colors in respective chunks is preserved.
 
+        Splitting itself is performed by a :class:`SplitGuidance` object, that is prepared from supplied guidance. If a :class:`SplitGuidance` instance is supplied as guidance, it is utilized as is
+        (and sorting / colors multiplicity flags, that it was prepared with, take precedence), which is beneficial when many multicolors are to be split with the same guidance.
+
         Accounts for subclassing.
 
         :param multicolor: an instance information about colors in which is to be split
         :type multicolor: :class:`Multicolor`
         :param guidance: information how colors have to be split in current :class:`Multicolor` object
-        :type guidance: iterable where each entry is iterable with colors entries
+        :type guidance: iterable where each entry is iterable with colors entries, or :class:`SplitGuidance`
         :param sorted_guidance: a flag, that indicates is sorting of provided guidance is in order
         :return: a list of new :class:`Multicolor` object colors information in which complies with guidance information
         :rtype: ``list`` of :class:`Multicolor` objects
         """
+        if isinstance(guidance, SplitGuidance):
+            ###############################################################################################
+            #
+            # a precompiled guidance already carries information about its sorting and colors multiplicity treatment
+            #
+            ###############################################################################################
+            return guidance.split(multicolor)
         if guidance is None:
             ###############################################################################################
             #
@@ -203,104 +217,9 @@ class Multicolor(object):
             #
             ###############################################################################################
             sorted_guidance = True
-        ###############################################################################################
-        #
-        # a reference to the targeted multicolor.
-        # such reference is created only for the future requirement to access information about original multicolor
-        # Is done for the sake of code clarity and consistency.
-        #
-        ###############################################################################################
-        splitting_multicolor = deepcopy(multicolor)
-        if not account_for_color_multiplicity_in_guidance:
-            ###############################################################################################
-            #
-            # we need to create a new guidance (even if original is perfect)
-            # a new one shall preserve the order of the original, but all multicolors in it
-            #   while keeping information about the actual colors itself, shall have multiplicity equal to 1
-            #
-            ###############################################################################################
-            splitting_multicolor = Multicolor(*multicolor.colors)
-            colors_guidance = [Multicolor(*tmp_multicolor.colors) for tmp_multicolor in guidance]
-            ###############################################################################################
-            #
-            # since there might be different multicolors, with the same colors content
-            # and they will be changed to same multicolors object, after colors multiplicity adjustment
-            # we need, while preserving the order, leave only unique ones in (the first appearance)
-            #
-            ###############################################################################################
-            unique = set()
-            guidance = []
-            for c_multicolor in colors_guidance:
-                if c_multicolor.hashable_representation not in unique:
-                    unique.add(c_multicolor.hashable_representation)
-                    guidance.append(c_multicolor)
-        if not sorted_guidance:
-            ###############################################################################################
-            #
-            # if arguments in function call do not specify explicitly, that the guidance shall be used "as is"
-            # it is sorted to put "bigger" multicolors in front, and smaller at the back
-            # as bigger multicolor might contain several smaller multicolors from the guidance, but the correct splitting
-            # always assumes that the smaller is the splitted result, the better it is
-            # and such minimization can be obtained only if the biggest chunk of targeted multicolor are ripped off of it first
-            #
-            ###############################################################################################
-            guidance = sorted({g_multicolor.hashable_representation for g_multicolor in guidance},
-                              key=lambda g_multicolor: len(g_multicolor),
-                              reverse=True)
-            guidance = [Multicolor(*hashed) for hashed in guidance]
-        first_run_result = []
-        second_run_result = []
-        for g_multicolor in guidance:
-            ###############################################################################################
-            #
-            # first we determine which multicolors in guidance are fully present in the multicolor to split
-            #   "<=" operator can be read as "is_multi_subset_of"
-            # and retrieve as many copies of it from the multicolor, as we can
-            # Example:
-            #   multicolor has only one color "blue" with multiplicity "4"
-            #   in guidance we have multicolor with color "blue" with multiplicity "2"
-            #   we must retrieve it fully twice
-            #
-            ###############################################################################################
-            ###############################################################################################
-            #
-            # empty guidance multicolors shall be ignored, as they have no impact on the splitting algorithm
-            #
-            ###############################################################################################
-            if len(g_multicolor.colors) == 0:
-                continue
-            while g_multicolor <= splitting_multicolor:
-                first_run_result.append(g_multicolor)
-                splitting_multicolor -= g_multicolor
-        for g_multicolor in guidance:
-            ###############################################################################################
-            #
-            # secondly we determine which multicolors in guidance are partially present in the multicolor
-            # NOTE that this is not possible for the case of tree consistent multicolor
-            #   as every partially present
-            #
-            ###############################################################################################
-            while len(g_multicolor.intersect(splitting_multicolor).multicolors) > 0:
-                second_run_result.append(g_multicolor.intersect(splitting_multicolor))
-                splitting_multicolor -= g_multicolor.intersect(splitting_multicolor)
-        appendix = splitting_multicolor
-        result = deepcopy(first_run_result) + deepcopy(second_run_result) + deepcopy([appendix] if len(appendix.multicolors) > 0 else [])
-        if not account_for_color_multiplicity_in_guidance:
-            ###############################################################################################
-            #
-            # if we didn't care for guidance multicolors colors multiplicity, we we splitting a specially created Multicolor
-            # based only on the colors content.
-            # After this is done, we need to restore the original multiplicity of each color in result multicolors to the
-            # count they had in the targeted for splitting multicolor.
-            # This is possible since in the case when we do not account for colors multiplicity in guidance, we have
-            # splitting_color variable referencing not the supplied multicolor, and thus internal changes are not made to
-            # supplied multicolor.
-            #
-            ###############################################################################################
-            for r_multicolor in result:
-                for color in r_multicolor.colors:
-                    r_multicolor.multicolors[color] = multicolor.multicolors[color]
-        return result
+        return SplitGuidance(guidance=guidance, sorted_guidance=sorted_guidance,
+                             account_for_color_multiplicity_in_guidance=account_for_color_multiplicity_in_guidance
+                             ).split(multicolor)
 
     def __sub__(self, other):
         """ Implementation of ``-`` operation for :class:`Multicolor`
@@ -387,7 +306,8 @@ class Multicolor(object):
 
         One :class:`Multicolor` instance is said to be "less than" the other :class:`Multicolor` instance, if it contains less or equal number of colors colors,
         as the other :class:`Multicolor` object does, and multiplicity of all of them is less or equal than in the other multicolor,
-        and at least one color has multiplicity less, than in the other multicolor.
+        and at least one color has multiplicity less, than in the other multicolor (colors, that are missing in current multicolor, have multiplicity 0).
+        Thus ``a < b`` is the same as ``b > a``, which is required for multicolors of different classes (see :class:`BitsetMulticolor`), as python evaluates both expressions with the same method.
         :class:`Multicolor` instance is never less, than non-:class:`Multicolor` object.
 
         :param other: an object to compare to
@@ -401,7 +321,7 @@ class Multicolor(object):
         other_keys = other.colors
         return all(self.multicolors[key] <= other.multicolors[key] for key in self_keys) and \
                self_keys <= other_keys and \
-               any(self.multicolors[key] < other.multicolors[key] for key in self_keys)
+               any(self.multicolors[key] < other.multicolors[key] for key in other_keys)
 
     def __le__(self, other):
         """ Implementation of "<=" operation for :class:`Multicolor`
@@ -486,9 +406,8 @@ class Multicolor(object):
             raise TypeError("Multicolor can be multiplied only by integer values")
         if other == 0:
             return Multicolor()
-        result = deepcopy(self)
-        for value in result.multicolors:
-            result.multicolors[value] *= other
+        result = Multicolor()
+        result.multicolors = Counter({color: count * other for color, count in self.multicolors.items()})
         return result
 
     def intersect(self, other):
@@ -503,3 +422,546 @@ class Multicolor(object):
         intersection_colors_core = self.colors.intersection(other.colors)
         colors_count = {color: min(self.multicolors[color], other.multicolors[color]) for color in intersection_colors_core}
         return Multicolor(*(color for color in colors_count for _ in range(colors_count[color])))
+
+
+class FrozenCounter(Counter):
+    """ An immutable python Counter, that is utilized as :attr:`Multicolor.multicolors` attribute of :class:`FrozenMulticolor` objects
+
+    All arithmetic operations (``+``, ``-``, ``&``, ``|``) produce new (mutable) python Counter objects, while all inplace changes raise ``TypeError``.
+    """
+
+    def __init__(self, counts=None):
+        dict.__init__(self, {color: count for color, count in (counts or {}).items() if count > 0})
+
+    def __immutable(self, *args, **kwargs):
+        raise TypeError("FrozenCounter object does not support inplace changes")
+
+    __setitem__ = __delitem__ = update = subtract = clear = pop = popitem = setdefault = __immutable
+    __iadd__ = __isub__ = __iand__ = __ior__ = __immutable
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+class FrozenMulticolor(Multicolor):
+    """ An immutable :class:`Multicolor`, that :class:`bg.breakpoint_graph.BreakpointGraph` stores on its edges
+
+    Since no inplace change is possible (:meth:`Multicolor.update`, :meth:`Multicolor.delete` and :meth:`Multicolor.left_merge` raise an error, while ``+=`` and ``-=`` produce new objects and thus just rebind the name),
+    :class:`FrozenMulticolor` objects are safely shared among edges, graphs (including forks, see :meth:`bg.breakpoint_graph.BreakpointGraph.fork`) and copies: both ``copy`` and ``deepcopy`` return the object itself.
+
+    :meth:`FrozenMulticolor.freeze` hash-conses multicolors: all live frozen multicolors with the same colors content, that were obtained through it, are the same object.
+    """
+
+    # frozen multicolors are referenced from the hash consing pool weakly
+    __slots__ = ("__hash", "__weakref__")
+
+    # content -> frozen multicolor pool, utilized for hash consing
+    __pool = WeakValueDictionary()
+
+    def __init__(self, *args):
+        """ Initialization of :class:`FrozenMulticolor` object.
+
+        :param args: variable number of colors to contain information about
+        :type args: any hashable python object
+        :return: a new instance of :class:`FrozenMulticolor`
+        :rtype: :class:`FrozenMulticolor`
+        """
+        object.__setattr__(self, "multicolors", FrozenCounter(Counter(args)))
+        object.__setattr__(self, "_FrozenMulticolor__hash", None)
+
+    @classmethod
+    def freeze(cls, multicolor):
+        """ Provides a frozen multicolor with the same colors content, as supplied one has
+
+        Does not copy frozen multicolors, and returns the same object for all multicolors with the same colors content, as long as it is referenced somewhere.
+
+        :param multicolor: a multicolor to be frozen
+        :type multicolor: :class:`Multicolor`
+        :return: a frozen multicolor with the same colors content
+        :rtype: :class:`FrozenMulticolor`
+        """
+        if isinstance(multicolor, FrozenMulticolor):
+            return multicolor
+        content = frozenset((color, count) for color, count in multicolor.multicolors.items() if count > 0)
+        result = cls.__pool.get(content, None)
+        if result is None:
+            result = cls()
+            object.__setattr__(result, "multicolors", FrozenCounter(dict(content)))
+            cls.__pool[content] = result
+        return result
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenMulticolor object does not support inplace changes")
+
+    def __hash__(self):
+        if self.__hash is None:
+            object.__setattr__(self, "_FrozenMulticolor__hash", hash(frozenset(self.multicolors.items())))
+        return self.__hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        return super(FrozenMulticolor, self).__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def update(self, *args):
+        raise TypeError("FrozenMulticolor object does not support inplace changes")
+
+    def delete(self, multicolor):
+        raise TypeError("FrozenMulticolor object does not support inplace changes")
+
+    @classmethod
+    def merge(cls, *multicolors):
+        """ Produces a frozen multicolor resulting from gathering information from all supplied :class:`Multicolor` instances. """
+        return cls.freeze(Multicolor.merge(*multicolors))
+
+    def __iadd__(self, other):
+        """ Implementation of ``+=`` operation for :class:`FrozenMulticolor`
+
+        No inplace change is performed, a new frozen multicolor is produced instead, so the name is just rebound to it.
+        """
+        if not isinstance(other, Multicolor):
+            raise TypeError
+        return self.freeze(self + other)
+
+    def __isub__(self, other):
+        """ Implementation of ``-=`` operation for :class:`FrozenMulticolor`
+
+        No inplace change is performed, a new frozen multicolor is produced instead, so the name is just rebound to it.
+        """
+        if not isinstance(other, Multicolor):
+            raise TypeError
+        return self.freeze(self - other)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenMulticolor.freeze, (Multicolor(*self.multicolors.elements()),)
+
+
+def _iter_bits(mask):
+    """ Yields positions of all set bits in supplied integer bitmask (from the lowest to the highest one) """
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+class ColorRegistry(object):
+    """ A registry, that assigns a bit position to every color, and is shared by :class:`BitsetMulticolor` objects
+
+    Positions are assigned in order of colors registration and are never reassigned, so that bitmasks, obtained with a help of the same registry, are always comparable.
+    """
+
+    def __init__(self):
+        self.__bits = {}
+        self.__colors = []
+
+    def __len__(self):
+        return len(self.__colors)
+
+    def __contains__(self, color):
+        return color in self.__bits
+
+    def get_bit(self, color):
+        """ Returns a bit position of supplied color, registering it, if it is encountered for the first time """
+        bit = self.__bits.get(color)
+        if bit is None:
+            bit = len(self.__colors)
+            self.__bits[color] = bit
+            self.__colors.append(color)
+        return bit
+
+    def get_color(self, bit):
+        """ Returns a color, that is registered on supplied bit position """
+        return self.__colors[bit]
+
+    def get_mask(self, colors):
+        """ Returns a bitmask, in which bits of all supplied colors are set """
+        mask = 0
+        for color in colors:
+            mask |= 1 << self.get_bit(color)
+        return mask
+
+    def get_colors(self, mask):
+        """ Returns a list of colors, bits of which are set in supplied bitmask """
+        return [self.__colors[bit] for bit in _iter_bits(mask)]
+
+
+# a registry, that is utilized by all bitset based multicolors, unless some other one is explicitly specified
+DEFAULT_COLOR_REGISTRY = ColorRegistry()
+
+
+class BitsetMulticolor(Multicolor):
+    """ An alternative implementation of :class:`Multicolor`, that keeps information about colors in an integer bitmask
+
+    Every color corresponds to a bit position in a :class:`ColorRegistry`, that is shared among multicolors.
+    Colors with multiplicity 1 are represented only by a set bit in :attr:`BitsetMulticolor.mask`,
+    while for colors with greater multiplicity respective counts are recorded in a small side dict :attr:`BitsetMulticolor.counts`.
+    Thus subset tests, merges, subtractions and intersections of multicolors (with the same registry) become integer operations, that produce no intermediate Counter / set objects.
+
+    :attr:`Multicolor.multicolors` is still available (as a freshly computed python Counter object, that shall not be changed inplace), so :class:`BitsetMulticolor` can be used (and mixed) wherever :class:`Multicolor` is expected.
+    """
+
+    __slots__ = ("registry", "mask", "counts")
+
+    def __init__(self, *args, **kwargs):
+        """ Initialization of :class:`BitsetMulticolor` object.
+
+        :param args: variable number of colors to contain information about
+        :type args: any hashable python object
+        :param registry: a keyword only argument with a registry, that colors bits are taken from (:data:`DEFAULT_COLOR_REGISTRY` is used by default)
+        :type registry: :class:`ColorRegistry`
+        :return: a new instance of :class:`BitsetMulticolor`
+        :rtype: :class:`BitsetMulticolor`
+        """
+        registry = kwargs.pop("registry", None)
+        if len(kwargs) > 0:
+            raise TypeError("Unexpected keyword arguments: {arguments}".format(arguments=", ".join(sorted(kwargs))))
+        self.registry = DEFAULT_COLOR_REGISTRY if registry is None else registry
+        self.mask = 0
+        self.counts = {}
+        self.__add_colors(args)
+
+    def __new_instance(self, mask, counts):
+        """ Creates a new multicolor of the same class and with the same registry, as the current one, directly from a bitmask and multiplicities """
+        result = self.__class__.__new__(self.__class__)
+        result.registry = self.registry
+        result.mask = mask
+        result.counts = counts
+        return result
+
+    def __coerce(self, other):
+        """ Returns supplied multicolor, if it shares registry with the current one, or its bitset based copy in the current multicolor registry otherwise """
+        if isinstance(other, BitsetMulticolor) and other.registry is self.registry:
+            return other
+        if not isinstance(other, Multicolor):
+            raise TypeError
+        result = self.__new_instance(0, {})
+        result.__set_counts(other.multicolors)
+        return result
+
+    def __add_colors(self, colors):
+        for color in colors:
+            bit = self.registry.get_bit(color)
+            flag = 1 << bit
+            if self.mask & flag:
+                self.counts[bit] = self.counts.get(bit, 1) + 1
+            else:
+                self.mask |= flag
+
+    def __set_counts(self, counts):
+        mask, extra = 0, {}
+        for color, count in counts.items():
+            if count <= 0:
+                continue
+            bit = self.registry.get_bit(color)
+            mask |= 1 << bit
+            if count > 1:
+                extra[bit] = count
+        self.mask = mask
+        self.counts = extra
+
+    def multiplicity(self, bit):
+        """ Returns multiplicity of a color, registered on supplied bit position, in the current multicolor """
+        if not (self.mask >> bit) & 1:
+            return 0
+        return self.counts.get(bit, 1)
+
+    @property
+    def multicolors(self):
+        """ A python Counter object with colors and their multiplicity, computed from the bitmask (and multiplicities side dict) """
+        return Counter({self.registry.get_color(bit): self.counts.get(bit, 1) for bit in _iter_bits(self.mask)})
+
+    @multicolors.setter
+    def multicolors(self, value):
+        self.__set_counts(value)
+
+    @property
+    def colors(self):
+        return set(self.registry.get_colors(self.mask))
+
+    def update(self, *args):
+        self.__add_colors(args)
+
+    def delete(self, multicolor):
+        if not isinstance(multicolor, Multicolor):
+            colors, multicolor = multicolor, self.__new_instance(0, {})
+            multicolor.__add_colors(colors)
+        self -= multicolor
+
+    @classmethod
+    def merge(cls, *multicolors):
+        registry = None
+        for multicolor in multicolors:
+            if isinstance(multicolor, BitsetMulticolor):
+                registry = multicolor.registry
+                break
+        result = cls(registry=registry)
+        for multicolor in multicolors:
+            result += multicolor
+        return result
+
+    @classmethod
+    def left_merge(cls, multicolor1, multicolor2):
+        if isinstance(multicolor1, BitsetMulticolor):
+            multicolor1 += multicolor2
+            return multicolor1
+        return super(BitsetMulticolor, cls).left_merge(multicolor1, multicolor2)
+
+    @staticmethod
+    def similarity_score(multicolor1, multicolor2):
+        if not isinstance(multicolor1, BitsetMulticolor):
+            return Multicolor.similarity_score(multicolor1, multicolor2)
+        multicolor2 = multicolor1.__coerce(multicolor2)
+        shared = multicolor1.mask & multicolor2.mask
+        result = bin(shared).count("1")
+        for bit in set(multicolor1.counts).intersection(multicolor2.counts):
+            result += min(multicolor1.counts[bit], multicolor2.counts[bit]) - 1
+        return result
+
+    def __add__(self, other):
+        other = self.__coerce(other)
+        shared = self.mask & other.mask
+        counts = dict(self.counts)
+        if shared or other.counts:
+            for bit in set(_iter_bits(shared)).union(other.counts):
+                counts[bit] = self.multiplicity(bit) + other.multiplicity(bit)
+        return self.__new_instance(self.mask | other.mask, counts)
+
+    def __sub__(self, other):
+        other = self.__coerce(other)
+        mask = self.mask & ~other.mask
+        counts = {}
+        if self.counts:
+            for bit in set(_iter_bits(self.mask & other.mask)).union(self.counts):
+                remainder = self.counts.get(bit, 1) - other.multiplicity(bit)
+                if remainder > 0:
+                    mask |= 1 << bit
+                    if remainder > 1:
+                        counts[bit] = remainder
+        return self.__new_instance(mask, counts)
+
+    def __iadd__(self, other):
+        result = self + other
+        self.mask, self.counts = result.mask, result.counts
+        return self
+
+    def __isub__(self, other):
+        result = self - other
+        self.mask, self.counts = result.mask, result.counts
+        return self
+
+    def __eq__(self, other):
+        if not isinstance(other, Multicolor):
+            return False
+        if isinstance(other, BitsetMulticolor) and other.registry is self.registry:
+            return self.mask == other.mask and self.counts == other.counts
+        return self.multicolors == other.multicolors
+
+    @staticmethod
+    def __is_contained(multicolor1, multicolor2):
+        """ Checks if every color of the first multicolor is present in the second one with at least the same multiplicity (both multicolors must share a registry) """
+        if multicolor1.mask & ~multicolor2.mask:
+            return False
+        return all(count <= multicolor2.multiplicity(bit) for bit, count in multicolor1.counts.items())
+
+    def __le__(self, other):
+        if not isinstance(other, Multicolor):
+            return False
+        return self.__is_contained(self, self.__coerce(other))
+
+    def __lt__(self, other):
+        # same as for Counter based multicolors, at least one color of the other multicolor has to have greater multiplicity in it
+        if not isinstance(other, Multicolor):
+            return False
+        other = self.__coerce(other)
+        if not self.__is_contained(self, other):
+            return False
+        if other.mask & ~self.mask:
+            return True
+        return any(count > self.multiplicity(bit) for bit, count in other.counts.items())
+
+    def __ge__(self, other):
+        if not isinstance(other, Multicolor):
+            return False
+        return self.__is_contained(self.__coerce(other), self)
+
+    def __gt__(self, other):
+        # same as for Counter based multicolors, at least one color of the current multicolor has to have greater multiplicity in it
+        if not isinstance(other, Multicolor):
+            return False
+        other = self.__coerce(other)
+        if not self.__is_contained(other, self):
+            return False
+        if self.mask & ~other.mask:
+            return True
+        return any(count > other.multiplicity(bit) for bit, count in self.counts.items())
+
+    def __mul__(self, other):
+        if not isinstance(other, int) or other < 0:
+            raise TypeError("Multicolor can be multiplied only by integer values")
+        if other == 0:
+            return self.__new_instance(0, {})
+        if other == 1:
+            return self.__new_instance(self.mask, dict(self.counts))
+        return self.__new_instance(self.mask, {bit: self.counts.get(bit, 1) * other for bit in _iter_bits(self.mask)})
+
+    def intersect(self, other):
+        if not isinstance(other, Multicolor):
+            raise TypeError("Multicolor can be intersected only with another Multicolor object")
+        other = self.__coerce(other)
+        mask = self.mask & other.mask
+        counts = {}
+        for bit in set(self.counts).union(other.counts):
+            if (mask >> bit) & 1:
+                count = min(self.counts.get(bit, 1), other.counts.get(bit, 1))
+                if count > 1:
+                    counts[bit] = count
+        return self.__new_instance(mask, counts)
+
+    def __copy__(self):
+        return self.__new_instance(self.mask, dict(self.counts))
+
+    def __deepcopy__(self, memo):
+        # registry is shared, rather than copied, as it is what makes bitmasks of different multicolors comparable
+        return self.__new_instance(self.mask, dict(self.counts))
+
+    def __reduce__(self):
+        registry = None if self.registry is DEFAULT_COLOR_REGISTRY else self.registry
+        return _make_bitset_multicolor, (self.__class__, dict(self.multicolors), registry)
+
+
+def _make_bitset_multicolor(cls, counts, registry):
+    """ Restores a pickled :class:`BitsetMulticolor` (multicolors with a default registry are restored in the default registry of the unpickling process) """
+    result = cls(registry=registry)
+    result.multicolors = counts
+    return result
+
+
+class SplitGuidance(object):
+    """ A guidance for splitting of :class:`Multicolor` objects (see :meth:`Multicolor.split_colors`), that is prepared once and then is utilized for splitting of any number of multicolors
+
+    On creation, supplied guidance entries are deduplicated and sorted (from largest to smallest, unless they are said to be sorted already) once,
+    and for every color a list of (positions of) guidance entries, that contain it, is recorded.
+    Thus splitting of a multicolor only visits guidance entries, that share at least one color with it, rather than the whole guidance,
+    and neither sorting, nor :attr:`Multicolor.hashable_representation` based deduplication, nor deep copying is performed on every split.
+
+    Result of :meth:`SplitGuidance.split` is the same, as the result of :meth:`Multicolor.split_colors` invoked with the same guidance and flags.
+    """
+
+    def __init__(self, guidance, sorted_guidance=False, account_for_color_multiplicity_in_guidance=True):
+        """ Initialization of :class:`SplitGuidance` object.
+
+        :param guidance: information how colors have to be split
+        :type guidance: iterable where each entry is a :class:`Multicolor` or an iterable with colors entries
+        :param sorted_guidance: a flag, that indicates that supplied guidance is already sorted and deduplicated, and shall be used "as is"
+        :type sorted_guidance: ``Boolean``
+        :param account_for_color_multiplicity_in_guidance: a flag, that indicates if multiplicity of colors in guidance entries is to be taken into account
+        :type account_for_color_multiplicity_in_guidance: ``Boolean``
+        :return: a new instance of :class:`SplitGuidance`
+        :rtype: :class:`SplitGuidance`
+        """
+        self.account_for_color_multiplicity_in_guidance = account_for_color_multiplicity_in_guidance
+        entries = []
+        for g_multicolor in guidance:
+            counts = g_multicolor.multicolors if isinstance(g_multicolor, Multicolor) else Counter(g_multicolor)
+            if not account_for_color_multiplicity_in_guidance:
+                counts = {color: 1 for color in counts}
+            entries.append({color: count for color, count in counts.items() if count > 0})
+        if not account_for_color_multiplicity_in_guidance or not sorted_guidance:
+            ###############################################################################################
+            #
+            # same entries (possibly, after colors multiplicity adjustment) are left only once (first appearance)
+            #
+            ###############################################################################################
+            unique = {}
+            for entry in entries:
+                unique.setdefault(frozenset(entry.items()), entry)
+            entries = list(unique.values())
+        if not sorted_guidance:
+            ###############################################################################################
+            #
+            # "bigger" entries are put in front, and smaller at the back,
+            # so that the biggest chunks of targeted multicolor are ripped off of it first
+            #
+            ###############################################################################################
+            entries = sorted(entries, key=lambda entry: sum(entry.values()), reverse=True)
+        self.entries = tuple(entry for entry in entries if len(entry) > 0)
+        self.color_index = {}
+        for position, entry in enumerate(self.entries):
+            for color in entry:
+                self.color_index.setdefault(color, []).append(position)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def split(self, multicolor):
+        """ Produces several new instances of :class:`Multicolor` object by splitting information about colors in supplied multicolor with respect to current guidance
+
+        :param multicolor: an instance information about colors in which is to be split
+        :type multicolor: :class:`Multicolor`
+        :return: a list of new :class:`Multicolor` object colors information in which complies with guidance information
+        :rtype: ``list`` of :class:`Multicolor` objects
+        """
+        if self.account_for_color_multiplicity_in_guidance:
+            remainder = {color: count for color, count in multicolor.multicolors.items() if count > 0}
+        else:
+            remainder = {color: 1 for color, count in multicolor.multicolors.items() if count > 0}
+        positions = sorted({position for color in remainder for position in self.color_index.get(color, ())})
+        result = []
+        for position in positions:
+            ###############################################################################################
+            #
+            # first we determine which guidance entries are fully present in the multicolor to split
+            # and retrieve as many copies of each of them from the multicolor, as we can
+            #
+            ###############################################################################################
+            entry = self.entries[position]
+            times = min(remainder.get(color, 0) // count for color, count in entry.items())
+            for _ in range(times):
+                result.append(dict(entry))
+            if times > 0:
+                for color, count in entry.items():
+                    remainder[color] -= count * times
+                    if remainder[color] == 0:
+                        del remainder[color]
+        for position in positions:
+            ###############################################################################################
+            #
+            # secondly we determine which guidance entries are partially present in the multicolor
+            #
+            ###############################################################################################
+            entry = self.entries[position]
+            while True:
+                intersection = {color: min(count, remainder[color]) for color, count in entry.items()
+                                if color in remainder}
+                if len(intersection) == 0:
+                    break
+                result.append(intersection)
+                for color, count in intersection.items():
+                    remainder[color] -= count
+                    if remainder[color] == 0:
+                        del remainder[color]
+        if len(remainder) > 0:
+            result.append(remainder)
+        if not self.account_for_color_multiplicity_in_guidance:
+            ###############################################################################################
+            #
+            # original multiplicity of each color in result multicolors is restored
+            #
+            ###############################################################################################
+            result = [{color: multicolor.multicolors[color] for color in entry} for entry in result]
+        return [self.__make_multicolor(entry) for entry in result]
+
+    @staticmethod
+    def __make_multicolor(counts):
+        result = Multicolor()
+        result.multicolors = Counter(counts)
+        return result
@@ -0,0 +1,1050 @@
+# -*- coding: utf-8 -*-
+from array import array
+from bisect import bisect_left, bisect_right
+
+import networkx as nx
+
+try:
+    from collections.abc import Mapping, MutableMapping
+except ImportError:  # pragma: no cover
+    from collections import Mapping, MutableMapping
+
+__author__ = "Sergey Aganezov"
+__email__ = "aganezov(at)cs.jhu.edu"
+__status__ = "production"
+
+
+class CompactMultiGraph(object):
+    """ An integer-indexed storage engine for :class:`bg.breakpoint_graph.BreakpointGraph`
+
+    Every vertex is mapped to a dense integer id, and edges are kept as records in parallel arrays (first vertex id, second vertex id, key, multicolor, data).
+    Each vertex keeps an array of ids of edges incident to it, so no nested per-edge dictionaries are allocated, as it happens in NetworkX MultiGraph.
+
+    The class implements the subset of NetworkX MultiGraph interface, that :class:`bg.breakpoint_graph.BreakpointGraph` (and NetworkX algorithms it invokes) rely on.
+    Nested ``graph[vertex1][vertex2][key]["attr_dict"]`` access is supported through lightweight views, that read from and write into respective arrays.
+
+    Only ``attr_dict`` edge attribute (with ``multicolor`` and ``data`` entries in it) is supported, as it is the only one, that :class:`bg.breakpoint_graph.BreakpointGraph` utilizes.
+
+    Edges between any pair of vertices are additionally indexed by the pair of respective vertex ids, so that lookup of all edges between two vertices costs O(number of parallel edges), rather than O(degree).
+    Since most pairs of vertices are connected by a single edge, such edge id is stored in the index as is, and only parallel edges are kept in a list.
+    """
+
+    # the only edge attribute name, that is supported by current storage
+    EDGE_ATTRIBUTE_NAME = "attr_dict"
+
+    def __init__(self):
+        self._vertex_ids = {}
+        self._vertices = []
+        self._incidence = []
+        self._free_vertex_ids = []
+        self._edge_u = array("l")
+        self._edge_v = array("l")
+        self._edge_key = array("l")
+        self._edge_multicolor = []
+        self._edge_data = []
+        self._free_edge_ids = []
+        self._number_of_edges = 0
+        self._pair_edge_ids = {}
+
+    ################################################################################################################
+    #
+    # vertex level operations
+    #
+    ################################################################################################################
+
+    def __contains__(self, vertex):
+        try:
+            return vertex in self._vertex_ids
+        except TypeError:
+            return False
+
+    def __len__(self):
+        return len(self._vertex_ids)
+
+    def __iter__(self):
+        return iter(self._vertex_ids)
+
+    def __getitem__(self, vertex):
+        return CompactAdjacencyView(graph=self, vertex_id=self._vertex_ids[vertex])
+
+    @property
+    def adj(self):
+        return CompactAdjacency(graph=self)
+
+    # NetworkX algorithms access adjacency either through public or through "protected" attribute depending on the version
+    _adj = adj
+
+    def is_directed(self):
+        return False
+
+    def is_multigraph(self):
+        return True
+
+    def nodes(self):
+        return CompactNodeView(graph=self)
+
+    def number_of_nodes(self):
+        return len(self._vertex_ids)
+
+    def nbunch_iter(self, nbunch=None):
+        """ Iterates over vertices, that are present in current graph, following NetworkX ``nbunch`` conventions """
+        if nbunch is None:
+            return iter(self._vertex_ids)
+        if nbunch in self:
+            return iter([nbunch])
+        try:
+            return (vertex for vertex in list(nbunch) if vertex in self)
+        except TypeError:
+            raise nx.NetworkXError("nbunch is not a node or a sequence of nodes.")
+
+    def neighbors(self, vertex):
+        try:
+            return iter(self[vertex])
+        except KeyError:
+            raise nx.NetworkXError("The node {vertex} is not in the graph.".format(vertex=vertex))
+
+    def add_node(self, vertex):
+        self._get_vertex_id(vertex, create=True)
+
+    def remove_node(self, vertex):
+        try:
+            vertex_id = self._vertex_ids[vertex]
+        except KeyError:
+            raise nx.NetworkXError("The node {vertex} is not in the graph.".format(vertex=vertex))
+        for edge_id in list(self._incidence[vertex_id]):
+            self._release_edge(edge_id)
+        del self._vertex_ids[vertex]
+        self._vertices[vertex_id] = None
+        self._incidence[vertex_id] = None
+        self._free_vertex_ids.append(vertex_id)
+
+    def _get_vertex_id(self, vertex, create=False):
+        try:
+            return self._vertex_ids[vertex]
+        except KeyError:
+            if not create:
+                raise
+        if self._free_vertex_ids:
+            vertex_id = self._free_vertex_ids.pop()
+            self._vertices[vertex_id] = vertex
+            self._incidence[vertex_id] = array("l")
+        else:
+            vertex_id = len(self._vertices)
+            self._vertices.append(vertex)
+            self._incidence.append(array("l"))
+        self._vertex_ids[vertex] = vertex_id
+        return vertex_id
+
+    ################################################################################################################
+    #
+    # edge level operations
+    #
+    ################################################################################################################
+
+    def _other_end(self, edge_id, vertex_id):
+        u = self._edge_u[edge_id]
+        return self._edge_v[edge_id] if u == vertex_id else u
+
+    @staticmethod
+    def _pair_id(vertex1_id, vertex2_id):
+        """ An order independent integer identifier of a pair of vertex ids, that is used as a key in the pair index """
+        if vertex1_id > vertex2_id:
+            vertex1_id, vertex2_id = vertex2_id, vertex1_id
+        return (vertex1_id << 32) | vertex2_id
+
+    def _edge_ids_between(self, vertex1_id, vertex2_id):
+        entry = self._pair_edge_ids.get(self._pair_id(vertex1_id, vertex2_id), None)
+        if entry is None:
+            return []
+        if isinstance(entry, list):
+            return entry
+        return [entry]
+
+    def _grouped_incidence(self, vertex_id):
+        """ Groups edges incident to the vertex by their other end, respecting the order in which neighbours were encountered """
+        result = {}
+        order = []
+        other_end = self._other_end
+        for edge_id in self._incidence[vertex_id]:
+            neighbour_id = other_end(edge_id, vertex_id)
+            if neighbour_id not in result:
+                result[neighbour_id] = []
+                order.append(neighbour_id)
+            result[neighbour_id].append(edge_id)
+        return [(neighbour_id, result[neighbour_id]) for neighbour_id in order]
+
+    def _allocate_edge(self, vertex1_id, vertex2_id, key, multicolor, data):
+        if self._free_edge_ids:
+            edge_id = self._free_edge_ids.pop()
+            self._edge_u[edge_id] = vertex1_id
+            self._edge_v[edge_id] = vertex2_id
+            self._edge_key[edge_id] = key
+            self._edge_multicolor[edge_id] = multicolor
+            self._edge_data[edge_id] = data
+        else:
+            edge_id = len(self._edge_u)
+            self._edge_u.append(vertex1_id)
+            self._edge_v.append(vertex2_id)
+            self._edge_key.append(key)
+            self._edge_multicolor.append(multicolor)
+            self._edge_data.append(data)
+        self._incidence[vertex1_id].append(edge_id)
+        if vertex1_id != vertex2_id:
+            self._incidence[vertex2_id].append(edge_id)
+        pair_id = self._pair_id(vertex1_id, vertex2_id)
+        entry = self._pair_edge_ids.get(pair_id, None)
+        if entry is None:
+            self._pair_edge_ids[pair_id] = edge_id
+        elif isinstance(entry, list):
+            entry.append(edge_id)
+        else:
+            self._pair_edge_ids[pair_id] = [entry, edge_id]
+        self._number_of_edges += 1
+        return edge_id
+
+    def _release_edge(self, edge_id):
+        vertex1_id, vertex2_id = self._edge_u[edge_id], self._edge_v[edge_id]
+        self._incidence[vertex1_id].remove(edge_id)
+        if vertex1_id != vertex2_id:
+            self._incidence[vertex2_id].remove(edge_id)
+        pair_id = self._pair_id(vertex1_id, vertex2_id)
+        entry = self._pair_edge_ids[pair_id]
+        if isinstance(entry, list):
+            entry.remove(edge_id)
+            if len(entry) == 1:
+                self._pair_edge_ids[pair_id] = entry[0]
+        else:
+            del self._pair_edge_ids[pair_id]
+        self._edge_u[edge_id] = -1
+        self._edge_v[edge_id] = -1
+        self._edge_multicolor[edge_id] = None
+        self._edge_data[edge_id] = None
+        self._free_edge_ids.append(edge_id)
+        self._number_of_edges -= 1
+
+    def _has_edges_between(self, vertex1_id, vertex2_id):
+        return self._pair_id(vertex1_id, vertex2_id) in self._pair_edge_ids
+
+    def _set_edge_field(self, edge_id, field, value):
+        """ Replaces either ``multicolor``, or ``data`` field of an edge record """
+        if field == "multicolor":
+            self._edge_multicolor[edge_id] = value
+        else:
+            self._edge_data[edge_id] = value
+
+    def _find_edge_id(self, vertex1, vertex2, key=None):
+        """ Finds an id of an edge between two vertices (the latest added one, if key is not supplied), ``None`` if there is no such edge """
+        if vertex1 not in self._vertex_ids or vertex2 not in self._vertex_ids:
+            return None
+        edge_ids = self._edge_ids_between(self._vertex_ids[vertex1], self._vertex_ids[vertex2])
+        if len(edge_ids) == 0:
+            return None
+        if key is None:
+            return edge_ids[-1]
+        for edge_id in edge_ids:
+            if self._edge_key[edge_id] == key:
+                return edge_id
+        return None
+
+    def new_edge_key(self, vertex1, vertex2):
+        """ Produces a new unique edge key between two vertices, the same way NetworkX MultiGraph does it """
+        if vertex1 not in self._vertex_ids or vertex2 not in self._vertex_ids:
+            return 0
+        keys = {self._edge_key[edge_id] for edge_id in
+                self._edge_ids_between(self._vertex_ids[vertex1], self._vertex_ids[vertex2])}
+        key = len(keys)
+        while key in keys:
+            key += 1
+        return key
+
+    def add_edge(self, u, v, key=None, **attr):
+        """ Adds an edge between two supplied vertices, creating those vertices if needed
+
+        If an edge with supplied key already exists, its record is updated with supplied attributes.
+
+        :return: key of added edge
+        :raises: ``ValueError`` if edge attributes, other then ``attr_dict``, are supplied
+        """
+        unsupported = set(attr.keys()) - {self.EDGE_ATTRIBUTE_NAME}
+        if len(unsupported) > 0:
+            raise ValueError("CompactMultiGraph supports only `{name}` edge attribute, while {unsupported} were supplied"
+                             "".format(name=self.EDGE_ATTRIBUTE_NAME, unsupported=sorted(unsupported)))
+        record = attr.get(self.EDGE_ATTRIBUTE_NAME, {})
+        if key is None:
+            key = self.new_edge_key(u, v)
+        else:
+            edge_id = self._find_edge_id(u, v, key=key)
+            if edge_id is not None:
+                if "multicolor" in record:
+                    self._edge_multicolor[edge_id] = record["multicolor"]
+                if "data" in record:
+                    self._edge_data[edge_id] = record["data"]
+                return key
+        vertex1_id = self._get_vertex_id(u, create=True)
+        vertex2_id = self._get_vertex_id(v, create=True)
+        self._allocate_edge(vertex1_id, vertex2_id, key, record.get("multicolor", None), record.get("data", None))
+        return key
+
+    def remove_edge(self, u, v, key=None):
+        edge_id = self._find_edge_id(u, v, key=key)
+        if edge_id is None:
+            if key is None:
+                raise nx.NetworkXError("The edge {u}-{v} is not in the graph.".format(u=u, v=v))
+            raise nx.NetworkXError("The edge {u}-{v} with key {key} is not in the graph.".format(u=u, v=v, key=key))
+        self._release_edge(edge_id)
+
+    def has_edge(self, u, v, key=None):
+        return self._find_edge_id(u, v, key=key) is not None
+
+    def edges(self, nbunch=None, data=False, keys=False, default=None):
+        return CompactEdgeView(graph=self, nbunch=nbunch, data=data, keys=keys, default=default)
+
+    def _iter_edge_ids(self, nbunch=None):
+        """ Iterates over ``(vertex, neighbour, edge id)`` triples in the same order and orientation as NetworkX MultiGraph ``edges(nbunch)`` does """
+        seen = set()
+        for vertex in self.nbunch_iter(nbunch):
+            vertex_id = self._vertex_ids[vertex]
+            for neighbour_id, edge_ids in self._grouped_incidence(vertex_id):
+                if neighbour_id in seen:
+                    continue
+                neighbour = self._vertices[neighbour_id]
+                for edge_id in edge_ids:
+                    yield vertex, neighbour, edge_id
+            seen.add(vertex_id)
+
+    def edge_records(self, nbunch=None):
+        """ Iterates over plain ``(vertex1, vertex2, key, multicolor, data)`` edge records, without creating any per-edge attribute views
+
+        Order and orientation of edges is the same as in :meth:`CompactMultiGraph.edges`.
+        """
+        edge_key, edge_multicolor, edge_data = self._edge_key, self._edge_multicolor, self._edge_data
+        for vertex, neighbour, edge_id in self._iter_edge_ids(nbunch=nbunch):
+            yield vertex, neighbour, edge_key[edge_id], edge_multicolor[edge_id], edge_data[edge_id]
+
+    def number_of_edges(self, u=None, v=None):
+        if u is None:
+            return self._number_of_edges
+        if u not in self._vertex_ids or v not in self._vertex_ids:
+            return 0
+        return len(self._edge_ids_between(self._vertex_ids[u], self._vertex_ids[v]))
+
+    ################################################################################################################
+    #
+    # whole graph operations
+    #
+    ################################################################################################################
+
+    def subgraph(self, nodes):
+        """ Creates a new :class:`CompactMultiGraph` induced by supplied vertices.
+
+        Unlike NetworkX views, result does not reflect further structural changes in current graph, but it references the same multicolor and data objects
+        """
+        result = self.__class__()
+        vertices = [vertex for vertex in self.nbunch_iter(nodes)]
+        for vertex in vertices:
+            result.add_node(vertex)
+        selected_ids = {self._vertex_ids[vertex] for vertex in vertices}
+        for vertex in vertices:
+            vertex_id = self._vertex_ids[vertex]
+            for edge_id in self._incidence[vertex_id]:
+                if self._edge_u[edge_id] != vertex_id or self._edge_v[edge_id] not in selected_ids:
+                    continue
+                result._allocate_edge(result._vertex_ids[vertex],
+                                      result._vertex_ids[self._vertices[self._edge_v[edge_id]]],
+                                      self._edge_key[edge_id],
+                                      self._edge_multicolor[edge_id],
+                                      self._edge_data[edge_id])
+        return result
+
+    def copy(self):
+        return self.subgraph(self._vertex_ids)
+
+
+class FrozenMultiGraph(CompactMultiGraph):
+    """ An immutable storage engine for :class:`bg.breakpoint_graph.BreakpointGraph`, that is produced by :meth:`bg.breakpoint_graph.BreakpointGraph.freeze`
+
+    Vertices are mapped to dense integer ids (in the order they are iterated over in the source graph) and edges are kept as records in the same parallel arrays, as in :class:`CompactMultiGraph`.
+    Adjacency is stored in a compressed sparse row layout: edges incident to a vertex with id ``i`` occupy the ``[offsets[i], offsets[i + 1])`` slice of
+    ``adjacent_vertices`` / ``adjacent_edges`` arrays, sorted by neighbour id (and edge key), so that edges between any two vertices are located with a binary search,
+    and iteration over edges, incident to a vertex, is a plain array scan.
+
+    Any attempt to change the graph raises ``NetworkXError``, the same way it happens with NetworkX frozen graphs.
+    Thus a single instance can be shared among threads without any locking.
+    Multicolor and data objects of edges are shared with the source graph (:class:`bg.breakpoint_graph.BreakpointGraph` never changes them inplace).
+    """
+
+    def __init__(self, graph=None, nodes=None):
+        """ Initialization of :class:`FrozenMultiGraph` object.
+
+        :param graph: a graph to take a snapshot of
+        :type graph: NetworkX MultiGraph, :class:`CompactMultiGraph`, or :class:`ForkedMultiGraph`
+        :param nodes: if supplied, only a subgraph induced by these vertices is kept
+        :type nodes: iterable
+        """
+        super(FrozenMultiGraph, self).__init__()
+        self._offsets = array("l", [0])
+        self._adjacent_vertices = array("l")
+        self._adjacent_edges = array("l")
+        if graph is None:
+            self._edge_multicolor, self._edge_data = (), ()
+            return
+        vertices = list(graph.nodes()) if nodes is None else list(graph.nbunch_iter(nodes))
+        for vertex_id, vertex in enumerate(vertices):
+            self._vertex_ids[vertex] = vertex_id
+        self._vertices = vertices
+        adjacency = [[] for _ in vertices]
+        vertex_ids = self._vertex_ids
+        for vertex1, vertex2, key, multicolor, data in self._iter_source_records(graph=graph, nbunch=vertices):
+            if vertex1 not in vertex_ids or vertex2 not in vertex_ids:
+                continue
+            vertex1_id, vertex2_id, edge_id = vertex_ids[vertex1], vertex_ids[vertex2], len(self._edge_u)
+            self._edge_u.append(vertex1_id)
+            self._edge_v.append(vertex2_id)
+            self._edge_key.append(key)
+            self._edge_multicolor.append(multicolor)
+            self._edge_data.append(data)
+            adjacency[vertex1_id].append((vertex2_id, key, edge_id))
+            if vertex1_id != vertex2_id:
+                adjacency[vertex2_id].append((vertex1_id, key, edge_id))
+        for entries in adjacency:
+            entries.sort()
+            self._adjacent_vertices.extend(neighbour_id for neighbour_id, _, _ in entries)
+            self._adjacent_edges.extend(edge_id for _, _, edge_id in entries)
+            self._offsets.append(len(self._adjacent_vertices))
+        self._edge_multicolor = tuple(self._edge_multicolor)
+        self._edge_data = tuple(self._edge_data)
+        self._number_of_edges = len(self._edge_u)
+
+    @staticmethod
+    def _iter_source_records(graph, nbunch):
+        edge_records = getattr(graph, "edge_records", None)
+        if edge_records is not None:
+            return edge_records(nbunch=nbunch)
+        return ((vertex1, vertex2, key, attributes["multicolor"], attributes["data"])
+                for vertex1, vertex2, key, attributes in graph.edges(nbunch=nbunch, data="attr_dict", keys=True))
+
+    def _frozen(self, *args, **kwargs):
+        raise nx.NetworkXError("Frozen graph can't be modified")
+
+    add_node = remove_node = add_edge = remove_edge = _set_edge_field = _frozen
+
+    def _grouped_incidence(self, vertex_id):
+        """ Groups edges incident to the vertex by their other end, in the order of neighbour ids """
+        result = []
+        adjacent_vertices, adjacent_edges = self._adjacent_vertices, self._adjacent_edges
+        for position in range(self._offsets[vertex_id], self._offsets[vertex_id + 1]):
+            neighbour_id = adjacent_vertices[position]
+            if len(result) == 0 or result[-1][0] != neighbour_id:
+                result.append((neighbour_id, []))
+            result[-1][1].append(adjacent_edges[position])
+        return result
+
+    def _edge_ids_between(self, vertex1_id, vertex2_id):
+        start, end = self._offsets[vertex1_id], self._offsets[vertex1_id + 1]
+        start = bisect_left(self._adjacent_vertices, vertex2_id, start, end)
+        end = bisect_right(self._adjacent_vertices, vertex2_id, start, end)
+        return self._adjacent_edges[start:end].tolist()
+
+    def _has_edges_between(self, vertex1_id, vertex2_id):
+        end = self._offsets[vertex1_id + 1]
+        position = bisect_left(self._adjacent_vertices, vertex2_id, self._offsets[vertex1_id], end)
+        return position < end and self._adjacent_vertices[position] == vertex2_id
+
+    def subgraph(self, nodes):
+        """ Creates a new :class:`FrozenMultiGraph` induced by supplied vertices """
+        return self.__class__(graph=self, nodes=nodes)
+
+    def copy(self):
+        """ Creates a mutable :class:`CompactMultiGraph` copy of current graph, that references the same multicolor and data objects """
+        result = CompactMultiGraph()
+        for vertex in self._vertices:
+            result.add_node(vertex)
+        for vertex1, vertex2, key, multicolor, data in self.edge_records():
+            result._allocate_edge(result._vertex_ids[vertex1], result._vertex_ids[vertex2], key, multicolor, data)
+        return result
+
+
+class CompactNodeView(object):
+    """ A live read-only view over vertices in :class:`CompactMultiGraph` """
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __iter__(self):
+        return iter(self._graph._vertex_ids)
+
+    def __len__(self):
+        return len(self._graph._vertex_ids)
+
+    def __contains__(self, vertex):
+        return vertex in self._graph
+
+
+class CompactEdgeView(object):
+    """ A read-only view over edges in :class:`CompactMultiGraph`, that complies with NetworkX ``edges(nbunch, data, keys)`` iteration protocol """
+    __slots__ = ("_graph", "_nbunch", "_data", "_keys", "_default")
+
+    def __init__(self, graph, nbunch=None, data=False, keys=False, default=None):
+        self._graph = graph
+        self._nbunch = nbunch
+        self._data = data
+        self._keys = keys
+        self._default = default
+
+    def __iter__(self):
+        graph = self._graph
+        for vertex, neighbour, edge_id in graph._iter_edge_ids(nbunch=self._nbunch):
+            entry = (vertex, neighbour)
+            if self._keys:
+                entry += (graph._edge_key[edge_id],)
+            if self._data is True:
+                entry += (CompactEdgeAttributes(graph=graph, edge_id=edge_id),)
+            elif self._data is not False:
+                entry += (CompactEdgeAttributes(graph=graph, edge_id=edge_id).get(self._data, self._default),)
+            yield entry
+
+    def __len__(self):
+        if self._nbunch is None:
+            return self._graph.number_of_edges()
+        return sum(1 for _ in self)
+
+
+class CompactAdjacency(Mapping):
+    """ A read-only ``vertex -> neighbours`` mapping view over :class:`CompactMultiGraph` """
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, vertex):
+        return self._graph[vertex]
+
+    def __iter__(self):
+        return iter(self._graph)
+
+    def __len__(self):
+        return len(self._graph)
+
+    def __contains__(self, vertex):
+        return vertex in self._graph
+
+
+class CompactAdjacencyView(Mapping):
+    """ A read-only ``neighbour -> {key: edge attributes}`` mapping view for a single vertex in :class:`CompactMultiGraph` """
+    __slots__ = ("_graph", "_vertex_id")
+
+    def __init__(self, graph, vertex_id):
+        self._graph = graph
+        self._vertex_id = vertex_id
+
+    def __getitem__(self, vertex):
+        neighbour_id = self._graph._vertex_ids[vertex]
+        if len(self._graph._edge_ids_between(self._vertex_id, neighbour_id)) == 0:
+            raise KeyError(vertex)
+        return CompactEdgeKeysView(graph=self._graph, vertex1_id=self._vertex_id, vertex2_id=neighbour_id)
+
+    def __contains__(self, vertex):
+        try:
+            neighbour_id = self._graph._vertex_ids[vertex]
+        except (KeyError, TypeError):
+            return False
+        return self._graph._has_edges_between(self._vertex_id, neighbour_id)
+
+    def __iter__(self):
+        vertices = self._graph._vertices
+        return (vertices[neighbour_id] for neighbour_id, _ in self._graph._grouped_incidence(self._vertex_id))
+
+    def __len__(self):
+        return len(self._graph._grouped_incidence(self._vertex_id))
+
+
+class CompactEdgeKeysView(Mapping):
+    """ A read-only ``key -> edge attributes`` mapping view for all edges between two vertices in :class:`CompactMultiGraph` """
+    __slots__ = ("_graph", "_vertex1_id", "_vertex2_id")
+
+    def __init__(self, graph, vertex1_id, vertex2_id):
+        self._graph = graph
+        self._vertex1_id = vertex1_id
+        self._vertex2_id = vertex2_id
+
+    def _edge_ids(self):
+        return self._graph._edge_ids_between(self._vertex1_id, self._vertex2_id)
+
+    def __getitem__(self, key):
+        for edge_id in self._edge_ids():
+            if self._graph._edge_key[edge_id] == key:
+                return CompactEdgeAttributes(graph=self._graph, edge_id=edge_id)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter([self._graph._edge_key[edge_id] for edge_id in self._edge_ids()])
+
+    def __len__(self):
+        return len(self._edge_ids())
+
+
+class CompactEdgeAttributes(Mapping):
+    """ A read-only edge attributes mapping view, that has a single ``attr_dict`` entry, that corresponds to edge record """
+    __slots__ = ("_graph", "_edge_id")
+
+    def __init__(self, graph, edge_id):
+        self._graph = graph
+        self._edge_id = edge_id
+
+    def __getitem__(self, item):
+        if item != CompactMultiGraph.EDGE_ATTRIBUTE_NAME:
+            raise KeyError(item)
+        return CompactEdgeRecord(graph=self._graph, edge_id=self._edge_id)
+
+    def __iter__(self):
+        return iter([CompactMultiGraph.EDGE_ATTRIBUTE_NAME])
+
+    def __len__(self):
+        return 1
+
+
+class CompactEdgeRecord(MutableMapping):
+    """ A ``multicolor`` / ``data`` mapping view over edge record, writes into which go directly into respective :class:`CompactMultiGraph` arrays """
+    __slots__ = ("_graph", "_edge_id")
+
+    FIELDS = ("multicolor", "data")
+
+    def __init__(self, graph, edge_id):
+        self._graph = graph
+        self._edge_id = edge_id
+
+    def __getitem__(self, item):
+        if item == "multicolor":
+            return self._graph._edge_multicolor[self._edge_id]
+        elif item == "data":
+            return self._graph._edge_data[self._edge_id]
+        raise KeyError(item)
+
+    def __setitem__(self, item, value):
+        if item not in self.FIELDS:
+            raise KeyError("CompactMultiGraph edge record supports only {fields} entries".format(fields=self.FIELDS))
+        self._graph._set_edge_field(self._edge_id, item, value)
+
+    def __delitem__(self, item):
+        raise TypeError("CompactMultiGraph edge record entries can not be deleted")
+
+    def __iter__(self):
+        return iter(self.FIELDS)
+
+    def __len__(self):
+        return len(self.FIELDS)
+
+
+class ForkedMultiGraph(object):
+    """ A copy-on-write storage engine for :class:`bg.breakpoint_graph.BreakpointGraph`, that is utilized by :meth:`bg.breakpoint_graph.BreakpointGraph.fork`
+
+    Graph is layered on top of a base graph (NetworkX MultiGraph, :class:`CompactMultiGraph` or another :class:`ForkedMultiGraph`), which is considered frozen and is never changed.
+    Adjacency of a vertex is copied from the base graph into current graph only when an edge incident to it is changed (edge records are copied, while multicolor and data objects in them are shared).
+    Thus creation of a new layer is O(1), and each change costs O(degree) of vertices it affects.
+
+    For every vertex, adjacency of which was not copied, the base graph adjacency is exact, as every change of an edge leads to a copy of adjacencies of both its vertices,
+    and a removal of a vertex leads to a copy of adjacencies of all its neighbours.
+
+    Edge records, that are obtained from the base graph, must not be changed inplace. Edges attributes shall be updated through :meth:`ForkedMultiGraph.add_edge` with an existing key.
+
+    Layers are traversed iteratively on lookups, and their number is bounded: once a base graph is :attr:`ForkedMultiGraph.MAX_DEPTH` layers deep, it is replaced with its
+    :meth:`ForkedMultiGraph.compacted` equivalent, that holds all of its changes in a single layer on top of the bottommost (non forked) graph.
+
+    The class implements the same subset of NetworkX MultiGraph interface, as :class:`CompactMultiGraph` does.
+    """
+
+    # the only edge attribute name, that is supported by current storage
+    EDGE_ATTRIBUTE_NAME = "attr_dict"
+
+    # the largest number of layers, that a base graph may be built of, before it is compacted into a single one
+    MAX_DEPTH = 16
+
+    def __init__(self, base=None):
+        base = nx.MultiGraph() if base is None else base
+        if isinstance(base, ForkedMultiGraph) and base.depth >= self.MAX_DEPTH:
+            base = base.compacted()
+        self._base = base
+        # the bottommost (non forked) graph and the number of layers (including current one) on top of it
+        self._root = base._root if isinstance(base, ForkedMultiGraph) else base
+        self._depth = base.depth + 1 if isinstance(base, ForkedMultiGraph) else 1
+        # vertex -> neighbour -> key -> edge attributes, for vertices, which adjacency was copied into current graph
+        self._own_adj = {}
+        # vertices, that are present in current graph, but are not visible through the base graph (insertion ordered)
+        self._new_vertices = {}
+        # base graph vertices, that are hidden in current graph
+        self._removed_vertices = set()
+        self._base_number_of_edges = None
+        self._number_of_edges_difference = 0
+
+    @property
+    def base(self):
+        return self._base
+
+    @property
+    def depth(self):
+        """ A number of :class:`ForkedMultiGraph` layers, current graph is built of (including itself) """
+        return self._depth
+
+    def _layers(self):
+        """ Lists :class:`ForkedMultiGraph` layers of current graph from the topmost (current graph itself) to the bottommost one """
+        result = []
+        graph = self
+        while isinstance(graph, ForkedMultiGraph):
+            result.append(graph)
+            graph = graph._base
+        return result
+
+    def compacted(self):
+        """ Creates a single layer :class:`ForkedMultiGraph` on top of the bottommost (non forked) graph, that holds the same vertices and edges as current graph
+
+        Only adjacencies of vertices, that were changed in any of the layers, are copied, so that the cost is proportional to the overall size of those changes, rather than to the size of the graph.
+        Multicolor and data objects are shared with current graph.
+        """
+        result = ForkedMultiGraph(base=self._root)
+        layers = self._layers()
+        changed_vertices = set()
+        for layer in layers:
+            changed_vertices.update(layer._own_adj)
+            changed_vertices.update(layer._removed_vertices)
+        own_adj = result._own_adj
+        for vertex in changed_vertices:
+            if vertex not in self:
+                if vertex in self._root:
+                    result._removed_vertices.add(vertex)
+                continue
+            adjacency = {}
+            for neighbour, edges in self[vertex].items():
+                neighbour_adjacency = own_adj.get(neighbour, None)
+                if neighbour_adjacency is not None and vertex in neighbour_adjacency:
+                    adjacency[neighbour] = neighbour_adjacency[vertex]
+                else:
+                    adjacency[neighbour] = {key: self._copy_edge_attributes(attributes) for key, attributes in edges.items()}
+            own_adj[vertex] = adjacency
+        for vertex in self._iter_new_vertices(layers=layers):
+            if vertex not in self._root:
+                result._new_vertices[vertex] = None
+        result._number_of_edges_difference = self.number_of_edges() - result.number_of_edges()
+        return result
+
+    def is_pristine(self):
+        """ Checks if current graph has no changes with respect to the base one """
+        return len(self._own_adj) == 0 and len(self._removed_vertices) == 0
+
+    ################################################################################################################
+    #
+    # vertex level operations
+    #
+    ################################################################################################################
+
+    def __contains__(self, vertex):
+        graph = self
+        while isinstance(graph, ForkedMultiGraph):
+            try:
+                if vertex in graph._own_adj:
+                    return True
+                if vertex in graph._removed_vertices:
+                    return False
+            except TypeError:
+                return False
+            graph = graph._base
+        return vertex in graph
+
+    def __len__(self):
+        result = len(self._root)
+        for layer in self._layers():
+            result += len(layer._new_vertices) - len(layer._removed_vertices)
+        return result
+
+    def __iter__(self):
+        layers = self._layers()
+        removed_sets = [layer._removed_vertices for layer in layers if len(layer._removed_vertices) > 0]
+        for vertex in self._root:
+            if not any(vertex in removed_vertices for removed_vertices in removed_sets):
+                yield vertex
+        for vertex in self._iter_new_vertices(layers=layers):
+            yield vertex
+
+    @staticmethod
+    def _iter_new_vertices(layers):
+        """ Iterates over vertices, that were added in supplied layers (listed from the topmost to the bottommost one) and were not removed in layers above """
+        for index in range(len(layers) - 1, -1, -1):
+            removed_sets = [layer._removed_vertices for layer in layers[:index] if len(layer._removed_vertices) > 0]
+            for vertex in list(layers[index]._new_vertices):
+                if not any(vertex in removed_vertices for removed_vertices in removed_sets):
+                    yield vertex
+
+    def __getitem__(self, vertex):
+        graph = self
+        while isinstance(graph, ForkedMultiGraph):
+            try:
+                return graph._own_adj[vertex]
+            except KeyError:
+                if vertex in graph._removed_vertices:
+                    raise
+            graph = graph._base
+        return graph[vertex]
+
+    @property
+    def adj(self):
+        return ForkedAdjacency(graph=self)
+
+    # NetworkX algorithms access adjacency either through public or through "protected" attribute depending on the version
+    _adj = adj
+
+    def is_directed(self):
+        return False
+
+    def is_multigraph(self):
+        return True
+
+    def nodes(self):
+        return ForkedNodeView(graph=self)
+
+    def number_of_nodes(self):
+        return len(self)
+
+    def nbunch_iter(self, nbunch=None):
+        """ Iterates over vertices, that are present in current graph, following NetworkX ``nbunch`` conventions """
+        if nbunch is None:
+            return iter(self)
+        if nbunch in self:
+            return iter([nbunch])
+        try:
+            return (vertex for vertex in list(nbunch) if vertex in self)
+        except TypeError:
+            raise nx.NetworkXError("nbunch is not a node or a sequence of nodes.")
+
+    def neighbors(self, vertex):
+        try:
+            return iter(self[vertex])
+        except KeyError:
+            raise nx.NetworkXError("The node {vertex} is not in the graph.".format(vertex=vertex))
+
+    def add_node(self, vertex):
+        self._get_own_adjacency(vertex)
+
+    def remove_node(self, vertex):
+        if vertex not in self:
+            raise nx.NetworkXError("The node {vertex} is not in the graph.".format(vertex=vertex))
+        for neighbour, edges in list(self[vertex].items()):
+            self._number_of_edges_difference -= len(edges)
+            if neighbour != vertex:
+                del self._get_own_adjacency(neighbour)[vertex]
+        self._own_adj.pop(vertex, None)
+        self._new_vertices.pop(vertex, None)
+        if vertex in self._base:
+            self._removed_vertices.add(vertex)
+
+    def _get_own_adjacency(self, vertex):
+        """ Provides a writable adjacency of a vertex, copying it from the base graph (or creating a new vertex) if needed """
+        adjacency = self._own_adj.get(vertex, None)
+        if adjacency is not None:
+            return adjacency
+        adjacency = {}
+        if vertex in self:
+            for neighbour, edges in self._base[vertex].items():
+                if neighbour in self._own_adj:
+                    adjacency[neighbour] = self._own_adj[neighbour][vertex]
+                else:
+                    adjacency[neighbour] = {key: self._copy_edge_attributes(attributes)
+                                            for key, attributes in edges.items()}
+        else:
+            self._new_vertices[vertex] = None
+        self._own_adj[vertex] = adjacency
+        return adjacency
+
+    @classmethod
+    def _copy_edge_attributes(cls, attributes):
+        return {name: (dict(value) if name == cls.EDGE_ATTRIBUTE_NAME else value)
+                for name, value in attributes.items()}
+
+    ################################################################################################################
+    #
+    # edge level operations
+    #
+    ################################################################################################################
+
+    def new_edge_key(self, vertex1, vertex2):
+        """ Produces a new unique edge key between two vertices, the same way NetworkX MultiGraph does it """
+        try:
+            keys = self[vertex1][vertex2]
+        except KeyError:
+            return 0
+        key = len(keys)
+        while key in keys:
+            key += 1
+        return key
+
+    def add_edge(self, u, v, key=None, **attr):
+        """ Adds an edge between two supplied vertices, creating those vertices if needed
+
+        If an edge with supplied key already exists, its attributes are updated with supplied ones.
+
+        :return: key of added edge
+        """
+        if key is None:
+            key = self.new_edge_key(u, v)
+        u_adjacency = self._get_own_adjacency(u)
+        v_adjacency = self._get_own_adjacency(v)
+        edges = u_adjacency.get(v, None)
+        if edges is None:
+            edges = {}
+            u_adjacency[v] = edges
+            v_adjacency[u] = edges
+        attributes = edges.get(key, None)
+        if attributes is None:
+            attributes = {}
+            edges[key] = attributes
+            self._number_of_edges_difference += 1
+        attributes.update(attr)
+        return key
+
+    def remove_edge(self, u, v, key=None):
+        if not self.has_edge(u, v, key=key):
+            if key is None:
+                raise nx.NetworkXError("The edge {u}-{v} is not in the graph.".format(u=u, v=v))
+            raise nx.NetworkXError("The edge {u}-{v} with key {key} is not in the graph.".format(u=u, v=v, key=key))
+        u_adjacency = self._get_own_adjacency(u)
+        v_adjacency = self._get_own_adjacency(v)
+        edges = u_adjacency[v]
+        if key is None:
+            edges.popitem()
+        else:
+            del edges[key]
+        if len(edges) == 0:
+            del u_adjacency[v]
+            if u != v:
+                del v_adjacency[u]
+        self._number_of_edges_difference -= 1
+
+    def has_edge(self, u, v, key=None):
+        try:
+            edges = self[u][v]
+        except KeyError:
+            return False
+        return key is None or key in edges
+
+    def edges(self, nbunch=None, data=False, keys=False, default=None):
+        return ForkedEdgeView(graph=self, nbunch=nbunch, data=data, keys=keys, default=default)
+
+    def _iter_edges(self, nbunch=None):
+        """ Iterates over ``(vertex, neighbour, key, edge attributes)`` tuples in the same order and orientation as NetworkX MultiGraph ``edges(nbunch)`` does """
+        seen = set()
+        for vertex in self.nbunch_iter(nbunch):
+            for neighbour, edges in self[vertex].items():
+                if neighbour in seen:
+                    continue
+                for key, attributes in edges.items():
+                    yield vertex, neighbour, key, attributes
+            seen.add(vertex)
+
+    def edge_records(self, nbunch=None):
+        """ Iterates over plain ``(vertex1, vertex2, key, multicolor, data)`` edge records
+
+        Order and orientation of edges is the same as in :meth:`ForkedMultiGraph.edges`.
+        """
+        for vertex, neighbour, key, attributes in self._iter_edges(nbunch=nbunch):
+            record = attributes[self.EDGE_ATTRIBUTE_NAME]
+            yield vertex, neighbour, key, record["multicolor"], record["data"]
+
+    def number_of_edges(self, u=None, v=None):
+        if u is None:
+            if self._base_number_of_edges is None:
+                base_number_of_edges = self._root.number_of_edges()
+                for layer in self._layers()[1:]:
+                    base_number_of_edges += layer._number_of_edges_difference
+                self._base_number_of_edges = base_number_of_edges
+            return self._base_number_of_edges + self._number_of_edges_difference
+        try:
+            return len(self[u][v])
+        except KeyError:
+            return 0
+
+    ################################################################################################################
+    #
+    # whole graph operations
+    #
+    ################################################################################################################
+
+    def subgraph(self, nodes):
+        """ Creates a new NetworkX MultiGraph induced by supplied vertices.
+
+        Result does not reflect further structural changes in current graph, but it references the same multicolor and data objects
+        """
+        result = nx.MultiGraph()
+        vertices = set(self.nbunch_iter(nodes))
+        for vertex in vertices:
+            result.add_node(vertex)
+        for vertex, neighbour, key, attributes in self._iter_edges(nbunch=vertices):
+            if neighbour in vertices:
+                result.add_edge(vertex, neighbour, key=key, **self._copy_edge_attributes(attributes))
+        return result
+
+    def copy(self):
+        return self.subgraph(self)
+
+
+class ForkedNodeView(object):
+    """ A live read-only view over vertices in :class:`ForkedMultiGraph` """
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __iter__(self):
+        return iter(self._graph)
+
+    def __len__(self):
+        return len(self._graph)
+
+    def __contains__(self, vertex):
+        return vertex in self._graph
+
+
+class ForkedEdgeView(object):
+    """ A read-only view over edges in :class:`ForkedMultiGraph`, that complies with NetworkX ``edges(nbunch, data, keys)`` iteration protocol """
+    __slots__ = ("_graph", "_nbunch", "_data", "_keys", "_default")
+
+    def __init__(self, graph, nbunch=None, data=False, keys=False, default=None):
+        self._graph = graph
+        self._nbunch = nbunch
+        self._data = data
+        self._keys = keys
+        self._default = default
+
+    def __iter__(self):
+        for vertex, neighbour, key, attributes in self._graph._iter_edges(nbunch=self._nbunch):
+            entry = (vertex, neighbour)
+            if self._keys:
+                entry += (key,)
+            if self._data is True:
+                entry += (attributes,)
+            elif self._data is not False:
+                entry += (attributes.get(self._data, self._default),)
+            yield entry
+
+    def __len__(self):
+        if self._nbunch is None:
+            return self._graph.number_of_edges()
+        return sum(1 for _ in self)
+
+
+class ForkedAdjacency(Mapping):
+    """ A read-only ``vertex -> neighbours`` mapping view over :class:`ForkedMultiGraph` """
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph):
+        self._graph = graph
+
+    def __getitem__(self, vertex):
+        return self._graph[vertex]
+
+    def __iter__(self):
+        return iter(self._graph)
+
+    def __len__(self):
+        return len(self._graph)
+
+    def __contains__(self, vertex):
+        return vertex in self._graph
@@ -5,7 +5,7 @@ from copy import deepcopy
 from ete3 import Tree
 
 from bg.genome import BGGenome
-from bg.multicolor import Multicolor
+from bg.multicolor import BitsetMulticolor, Multicolor
 
 __author__ = "Sergey Aganezov"
 __email__ = "aganezov(at)cs.jhu.edu"
@@ -36,6 +36,7 @@ class BGTree(object):
         self.__tree_consistent_multicolors = [Multicolor()]
         self.__vtree_consistent_multicolors_set = {Multicolor().hashable_representation}
         self.__vtree_consistent_multicolors = [Multicolor()]
+        self.__consistent_masks = {}
 
     def nodes(self):
         """ Proxies iteration to the underlying Tree.iter_descendants iterator, but first yielding a root element
@@ -198,8 +199,23 @@ class BGTree(object):
         self.tree_consistent_multicolors_set = hashed_tree_consistent_leaves_multicolors
         self.tree_consistent_multicolors = [Multicolor(*hashed_multicolor) for hashed_multicolor in
                                             hashed_tree_consistent_leaves_multicolors]
+        self.__consistent_masks = {}
         self.multicolors_are_up_to_date = True
 
+    def __get_consistent_masks(self, registry):
+        """ Internally used method, that provides sets of bitmasks (with respect to supplied color registry) of T-consistent and VT-consistent multicolors
+
+        Bitmasks are computed once per registry and are recomputed only after tree topology has changed
+        """
+        if not self.multicolors_are_up_to_date:
+            self.__update_consistent_multicolors()
+        result = self.__consistent_masks.get(registry, None)
+        if result is None:
+            result = ({registry.get_mask(multicolor.colors) for multicolor in self.tree_consistent_multicolors},
+                      {registry.get_mask(multicolor.colors) for multicolor in self.vtree_consistent_multicolors})
+            self.__consistent_masks[registry] = result
+        return result
+
     @property
     def tree_consistent_multicolors(self):
         """ Property based getter, that checks for consistency in terms of precomputed T-consistent multicolors,
@@ -260,11 +276,16 @@ class BGTree(object):
         self.__vtree_consistent_multicolors_set = value
 
     def multicolor_is_tree_consistent(self, multicolor):
-        """ Checks is supplied multicolor is T-consistent """
+        """ Checks is supplied multicolor is T-consistent (for :class:`bg.multicolor.BitsetMulticolor` objects the check is a bitmask lookup) """
+        if isinstance(multicolor, BitsetMulticolor):
+            # consistent multicolors are sets of leaves, so no color in them has multiplicity greater than 1
+            return len(multicolor.counts) == 0 and multicolor.mask in self.__get_consistent_masks(multicolor.registry)[0]
         return multicolor.hashable_representation in self.tree_consistent_multicolors_set
 
     def multicolor_is_vtree_consistent(self, multicolor):
-        """ Checks is supplied multicolor is VT-consistent """
+        """ Checks is supplied multicolor is VT-consistent (for :class:`bg.multicolor.BitsetMulticolor` objects the check is a bitmask lookup) """
+        if isinstance(multicolor, BitsetMulticolor):
+            return len(multicolor.counts) == 0 and multicolor.mask in self.__get_consistent_masks(multicolor.registry)[1]
         return multicolor.hashable_representation in self.vtree_consistent_multicolors_set
 
     def bgedge_is_vtree_consistent(self, bgedge):
@@ -2,6 +2,62 @@
 import collections
 
 
+def get_slots_state(instance):
+    """ Collects values of all assigned slots (throughout the whole class hierarchy) and ``__dict__`` entries of supplied object into a single dict, that can be used for pickling and copying """
+    state = dict(getattr(instance, "__dict__", {}))
+    for cls in type(instance).__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot in ("__dict__", "__weakref__"):
+                continue
+            if slot.startswith("__") and not slot.endswith("__"):
+                slot = "_{cls}{slot}".format(cls=cls.__name__.lstrip("_"), slot=slot)
+            try:
+                state[slot] = object.__getattribute__(instance, slot)
+            except AttributeError:
+                pass
+    return state
+
+
+def set_slots_state(instance, state):
+    """ Restores slots and ``__dict__`` entries of supplied object from a dict, produced by :func:`get_slots_state` """
+    for name, value in state.items():
+        object.__setattr__(instance, name, value)
+
+
+class SlotsStateMixin(object):
+    """ Pickling and copying support for classes, that keep their attributes in slots (rather than in a per-instance dict) to reduce memory footprint of numerous objects """
+    __slots__ = ()
+
+    def __getstate__(self):
+        return get_slots_state(self)
+
+    def __setstate__(self, state):
+        set_slots_state(self, state)
+
+
+class InstanceOverridableAttribute(object):
+    """ A class wide attribute value, that can be overwritten for a single instance of a slotted class
+
+    An overwritten value is kept in supplied slot (which the owner class must declare), while the class wide value is returned both for class level lookups and for instances, that were not changed.
+    """
+
+    def __init__(self, default, slot):
+        self.default = default
+        self.slot = slot
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.default
+        try:
+            return object.__getattribute__(instance, self.slot)
+        except AttributeError:
+            return self.default
+
+    def __set__(self, instance, value):
+        object.__setattr__(instance, self.slot, value)
+
+
 def dicts_are_equal(dict1, dict2):
     if len(set(dict1.keys()).symmetric_difference(set(dict2.keys()))) > 0:
         return False
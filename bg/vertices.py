@@ -3,6 +3,8 @@ from bisect import bisect_left
 
 from marshmallow import Schema, fields, post_load
 
+from bg.utils import InstanceOverridableAttribute, SlotsStateMixin
+
 __author__ = "Sergey Aganezov"
 __email__ = "aganezov(at)cs.jhu.edu"
 __status__ = "production"
@@ -11,7 +13,7 @@ INFINITY_VERTEX_IDENTIFIER = "__infinity"
 BGVertex_JSON_SCHEMA_JSON_KEY = "_py__bg_vertex_json_schema"
 
 
-class BGVertex(object):
+class BGVertex(SlotsStateMixin):
     """ An base class that represents a vertex (node) with all associated information in a breakpoint graph data structure
 
     While class represents a base inheritance point for specific vertex implementations, it does implement most of
@@ -21,6 +23,19 @@ class BGVertex(object):
     which mainly relies one the `name` attribute.
     """
 
+    # `_tags` and `_tag_predicates` slots are used by TaggedVertex only, but are kept here, so that TaggedVertex can be combined with other vertex classes (that have slots of their own) without a layout conflict
+    __slots__ = ("_name", "_cached_name", "_hash", "_tags", "_tag_predicates", "_json_schema")
+
+    # combinatorial properties of a vertex are checked in tight loops all over the breakpoint graph traversal code,
+    # so they are plain class based attributes (rather than properties, or `__getattr__` lookups), that heirs overwrite
+    is_regular_vertex = False
+    is_irregular_vertex = False
+    is_block_vertex = False
+    is_infinity_vertex = False
+    is_tagged_vertex = False
+    is_head_vertex = False
+    is_tail_vertex = False
+
     # this class based variable is utilized to the purpose if separating vertex root name from any additions that would specify some special properties of the vertex
     # (like vertex classes, special properties, etc)
     NAME_SEPARATOR = "__"
@@ -40,7 +55,7 @@ class BGVertex(object):
 
     # a schema class based variable with json deserialization schema
     # must be updated in all heirs, as schema specific method `make_object` specifies the type of deserialized object
-    json_schema = BGVertexJSONSchema()
+    json_schema = InstanceOverridableAttribute(default=BGVertexJSONSchema(), slot="_json_schema")
 
     def __init__(self, name):
         self._name = None
@@ -48,15 +63,38 @@ class BGVertex(object):
 
     @property
     def name(self):
-        return str(self._name)
+        # full name of a vertex (as well as its hash value) is computed only once, and is recomputed only after a change of some part of it (see `_invalidate_name` method),
+        # as it is accessed on every lookup of a vertex in a graph
+        if self._cached_name is None:
+            self._cached_name = self._build_name()
+        return self._cached_name
 
     @name.setter
     def name(self, value):
         self._name = value
+        self._invalidate_name()
+
+    def _build_name(self):
+        # heirs extend the root name with class specific parts (tags, suffixes, etc.) by overwriting this method
+        return str(self._name)
+
+    def _invalidate_name(self):
+        # must be called every time some part of the vertex name is changed
+        self._cached_name = None
+        self._hash = None
 
     def __hash__(self):
         # all vertex are hashable objects and are uniquely defined by their name, thus a has value of vertex is just a hash value of its name
-        return hash(self.name)
+        if self._hash is None:
+            self._hash = hash(self.name)
+        return self._hash
+
+    def __getstate__(self):
+        # string hash values are not guaranteed to be the same in different python processes, so cached values are never pickled
+        state = super(BGVertex, self).__getstate__()
+        state["_cached_name"] = None
+        state["_hash"] = None
+        return state
 
     def __eq__(self, other):
         # vertices are equal only if their class is equal as well as their names
@@ -125,6 +163,12 @@ class BGVertex(object):
 
 class BlockVertex(BGVertex):
     """ This class represents a special type of breakpoint graph vertex that correspond to a generic block extremity (gene/ synteny block/ etc.) """
+    # head / tail properties depend on the vertex name and are recomputed every time it changes (see `_invalidate_name` method)
+    __slots__ = ("mate_vertex", "is_head_vertex", "is_tail_vertex")
+
+    # vertex belongs to a class of regular vertices, as well as to a class of vertices, that correspond to extremities of genomic blocks
+    is_regular_vertex = True
+    is_block_vertex = True
 
     class BlockVertexJSONSchema(BGVertex.BGVertexJSONSchema):
         """ JSON schema for this class is redefined to tune the `make_object` method, that shall return `BlockVertex` instance, rather than `BGVertex` one """
@@ -137,16 +181,17 @@ class BlockVertex(BGVertex):
                 raise ValueError("No `name` key in supplied json data for vertex deserialization")
 
     # a new JSON schema is initialized and set of be used for all instance of `VertexClass`
-    json_schema = BlockVertexJSONSchema()
+    json_schema = InstanceOverridableAttribute(default=BlockVertexJSONSchema(), slot="_json_schema")
 
     def __init__(self, name, mate_vertex=None):
         super(BlockVertex, self).__init__(name=name)
         self.mate_vertex = mate_vertex
 
-    @property
-    def is_regular_vertex(self):
-        """ This class implements a property check for vertex to belong to class of regular vertices """
-        return True
+    def _invalidate_name(self):
+        super(BlockVertex, self)._invalidate_name()
+        root_name = str(self._name)
+        self.is_head_vertex = root_name.endswith("h")
+        self.is_tail_vertex = root_name.endswith("t")
 
     @property
     def block_name(self):
@@ -156,19 +201,6 @@ class BlockVertex(BGVertex):
             else:
                 return self._name
 
-    @property
-    def is_block_vertex(self):
-        """ This class implements a property check for vertex to belong to a class of vertices, that correspond to extremities of genomic blocks"""
-        return True
-
-    @property
-    def is_head_vertex(self):
-        return self.is_block_vertex and self._name.endswith("h")
-
-    @property
-    def is_tail_vertex(self):
-        return self.is_block_vertex and self._name.endswith("t")
-
     @classmethod
     def from_json(cls, data, json_schema_class=None):
         """ This class overwrites the from_json method thus, making sure, that if `from_json` is called from this class instance, it will provide its JSON schema as a default one """
@@ -178,6 +210,7 @@ class BlockVertex(BGVertex):
 
 class InfinityVertex(BGVertex):
     """ This class represents a special type of breakpoint graph vertex that correspond to a generic extremity of genomic fragment (chromosome, scaffold, contig, etc.)"""
+    __slots__ = ()
 
     class InfinityVertexJSONSchema(BGVertex.BGVertexJSONSchema):
         """ JSON Schema for this class is redefined to tune the `make_object` method, that shall return `InfinityVertex` instance, rather than a `BGVertex` one """
@@ -191,36 +224,24 @@ class InfinityVertex(BGVertex):
             except KeyError:
                 raise ValueError("No `name` key in supplied json data for vertex deserialization")
 
+    # vertex belongs to a class of vertices, that correspond to extremities of genomic fragments (standard ones in particular)
+    is_irregular_vertex = True
+    is_infinity_vertex = True
+
     # InfinityVertex instances have a special suffix in their name that is determined by a class variable `NAME_SUFFIX`
     NAME_SUFFIX = "infinity"
 
     # a setup for a new JSON schema is performed class-wise to be utilized by all instance of InfinityVertex
-    json_schema = InfinityVertexJSONSchema()
+    json_schema = InstanceOverridableAttribute(default=InfinityVertexJSONSchema(), slot="_json_schema")
 
     def __init__(self, name):
         # current class allows for a standard access to the `name` attribute, but performs transparent computation behind the scenes
         # so the name is stored in a private variable __name, and property `name` is implemented
         super(InfinityVertex, self).__init__(name=name)
 
-    @property
-    def name(self):
-        """ access to classic name attribute is hidden by this property """
-        return self.NAME_SEPARATOR.join([super(InfinityVertex, self).name, self.NAME_SUFFIX])
-
-    @name.setter
-    def name(self, value):
-        """When someone wants to set a new name for the `InfinityVertex` instance, it is transparently store into the `__name` attribute """
-        self._name = value
-
-    @property
-    def is_irregular_vertex(self):
-        """ This class implements a property check for vertex to belong to a class of vertices, that correspond to extremities of genomic fragments """
-        return True
-
-    @property
-    def is_infinity_vertex(self):
-        """ This class implements a property check for vertex to belong to a class of vertices, that correspond to standard extremities of genomic fragments """
-        return True
+    def _build_name(self):
+        """ access to classic name attribute is hidden by the `name` property, that appends a special suffix to the stored name """
+        return self.NAME_SEPARATOR.join([super(InfinityVertex, self)._build_name(), self.NAME_SUFFIX])
 
     @classmethod
     def from_json(cls, data, json_schema_class=None):
@@ -230,6 +251,8 @@ class InfinityVertex(BGVertex):
 
 
 class TaggedVertex(BGVertex):
+    __slots__ = ()
+
     class TaggedVertexJSONSchema(BGVertex.BGVertexJSONSchema):
 
         @post_load
@@ -250,29 +273,44 @@ class TaggedVertex(BGVertex):
 
     TAG_SEPARATOR = ":"
 
-    json_schema = TaggedVertexJSONSchema()
+    json_schema = InstanceOverridableAttribute(default=TaggedVertexJSONSchema(), slot="_json_schema")
+
+    is_tagged_vertex = True
+
+    # tag based `is_<tag>_vertex` answers depend only on names of tags, so they are kept in a dict, that is shared between all vertices with the same tag names
+    # all positive answers are put there beforehand, negative ones are added upon the first request
+    _TAG_PREDICATES_CACHE = {}
 
     def __init__(self, name):
-        self.tags = []
+        self._tags = []
         super(TaggedVertex, self).__init__(name=name)
 
     @property
-    def is_tagged_vertex(self):
-        return True
-
-    @property
-    def name(self):
-        """ access to classic name attribute is hidden by this property """
-        return self.NAME_SEPARATOR.join([super(TaggedVertex, self).name] + self.get_tags_as_list_of_strings())
+    def tags(self):
+        """ a sorted list of ``(tag, value)`` pairs, that must be changed only through `add_tag` / `remove_tag` methods, or by an assignment of a new list, as tags are a part of vertex name """
+        return self._tags
+
+    @tags.setter
+    def tags(self, value):
+        self._tags = value
+        self._invalidate_name()
+
+    def _build_name(self):
+        """ access to classic name attribute is hidden by the `name` property, that appends string representations of tags to the stored name """
+        return self.NAME_SEPARATOR.join([super(TaggedVertex, self)._build_name()] + self.get_tags_as_list_of_strings())
+
+    def _invalidate_name(self):
+        super(TaggedVertex, self)._invalidate_name()
+        tag_names = tuple(tag for tag, _ in self._tags)
+        predicates = self._TAG_PREDICATES_CACHE.get(tag_names)
+        if predicates is None:
+            predicates = {"is_{tag}_vertex".format(tag=tag): True for tag in tag_names}
+            self._TAG_PREDICATES_CACHE[tag_names] = predicates
+        self._tag_predicates = predicates
 
     def get_tags_as_list_of_strings(self):
         return [self.TAG_SEPARATOR.join([str(tag), str(value)]) for tag, value in self.tags]
 
-    @name.setter
-    def name(self, value):
-        """ shared "protected" variable for the name storing attribute """
-        self._name = value
-
     def add_tag(self, tag, value):
         """ as tags are kept in a sorted order, a bisection is a fastest way to identify a correct position
         of or a new tag to be added. An additional check is required to make sure w don't add duplicates
@@ -283,20 +321,24 @@ class TaggedVertex(BGVertex):
             contains = self.tags[index] == (tag, value)
         if not contains:
             self.tags.insert(index, (tag, value))
+            self._invalidate_name()
 
     def __getattr__(self, item):
-        """  """
-        if item.startswith("is_") and item.endswith("_vertex"):
-            tag = item[3:-7]
-            index = bisect_left([tag_name for tag_name, _ in self.tags], tag)
-            if index < len(self.tags):
-                return self.tags[index][0] == tag
+        """ ``is_<tag>_vertex`` requests are answered with a help of a precomputed (per tag names set) dict, the rest is proxied forward """
+        if item != "_tag_predicates":
+            predicates = self._tag_predicates
+            if item in predicates:
+                return predicates[item]
+            if item.startswith("is_") and item.endswith("_vertex"):
+                predicates[item] = False
+                return False
         return super(TaggedVertex, self).__getattr__(item)
 
     def remove_tag(self, tag, value, silent_fail=False):
         """ we try to remove supplied pair tag -- value, and if does not exist outcome depends on the silent_fail flag """
         try:
             self.tags.remove((tag, value))
+            self._invalidate_name()
         except ValueError as err:
             if not silent_fail:
                 raise err
@@ -309,20 +351,67 @@ class TaggedVertex(BGVertex):
 
 
 class TaggedBlockVertex(BlockVertex, TaggedVertex):
+    __slots__ = ()
+
     class TaggedBlockVertexJSONSchema(TaggedVertex.TaggedVertexJSONSchema, BlockVertex.BlockVertexJSONSchema):
         @post_load
         def make_object(self, data):
-            setattr(self, "object_class", TaggedBlockVertex)
+            if getattr(self, "object_class", None) is None:
+                # heirs of the schema may predefine a vertex class (for example, a slotted heir of TaggedBlockVertex with additional attributes)
+                setattr(self, "object_class", TaggedBlockVertex)
             return super(TaggedBlockVertex.TaggedBlockVertexJSONSchema, self).make_object(data)
 
-    json_schema = TaggedBlockVertexJSONSchema()
+    json_schema = InstanceOverridableAttribute(default=TaggedBlockVertexJSONSchema(), slot="_json_schema")
 
 
 class TaggedInfinityVertex(InfinityVertex, TaggedVertex):
+    __slots__ = ()
+
     class TaggedInfinityVertexJSONSchema(TaggedVertex.TaggedVertexJSONSchema, InfinityVertex.InfinityVertexJSONSchema):
         @post_load
         def make_object(self, data):
-            setattr(self, "object_class", TaggedInfinityVertex)
+            if getattr(self, "object_class", None) is None:
+                setattr(self, "object_class", TaggedInfinityVertex)
             return super(TaggedInfinityVertex.TaggedInfinityVertexJSONSchema, self).make_object(data)
 
-    json_schema = TaggedInfinityVertexJSONSchema()
+    json_schema = InstanceOverridableAttribute(default=TaggedInfinityVertexJSONSchema(), slot="_json_schema")
+
+
+class BGVertexPool(object):
+    """ An interning registry, that keeps a single (canonical) instance for every vertex name
+
+    Same genomic blocks are encountered in many genomes, and without interning an equal vertex object is created for every such occurrence.
+    A pool returns the first interned instance for every subsequent equal vertex, thus keeping only canonical vertices alive.
+    As vertices are equal if their names (that include tags) are equal, a pool is keyed on full vertex names,
+    and interned vertices must not be renamed / retagged afterwards.
+    """
+
+    def __init__(self):
+        self.__vertices = {}
+
+    def __len__(self):
+        return len(self.__vertices)
+
+    def __iter__(self):
+        return iter(self.__vertices.values())
+
+    def __contains__(self, item):
+        name = item.name if isinstance(item, BGVertex) else item
+        return name in self.__vertices
+
+    def get(self, name, default=None):
+        """ Returns a canonical vertex with supplied full name (root name + class specific suffixes and tags), or a ``default`` value, if there is no such vertex in the pool """
+        return self.__vertices.get(name, default)
+
+    def intern(self, vertex):
+        """ Returns a canonical instance of supplied vertex, supplied vertex becomes canonical if there is no equal vertex in the pool yet
+
+        :param vertex: a vertex to get a canonical instance for
+        :type vertex: any subclass of :class:`BGVertex`
+        :return: a canonical vertex, equal to the supplied one
+        :rtype: any subclass of :class:`BGVertex`
+        """
+        return self.__vertices.setdefault(vertex.name, vertex)
+
+    def clear(self):
+        self.__vertices.clear()
@@ -5,6 +5,7 @@ import io
 import unittest
 from collections import Counter
 
+import networkx as nx
 from marshmallow import ValidationError, post_load
 
 try:
@@ -12,13 +13,14 @@ try:
 except ImportError:
     from mock import Mock
 
-from bg.breakpoint_graph import BreakpointGraph, BGConnectedComponentFilter, CompleteMultiEdgeConnectedComponentFilter, \
+from bg.breakpoint_graph import BreakpointGraph, BGGraphEvent, BGConnectedComponentFilter, CompleteMultiEdgeConnectedComponentFilter, \
     TwoNodeConnectedComponentFilter
 from bg.edge import BGEdge
 from bg.genome import BGGenome
 from bg.grimm import GRIMMReader
 from bg.kbreak import KBreak
-from bg.multicolor import Multicolor
+from bg.multicolor import FrozenMulticolor, Multicolor, SplitGuidance
+from bg.storage import CompactMultiGraph, ForkedMultiGraph
 from bg.vertices import BlockVertex, TaggedBlockVertex, TaggedInfinityVertex
 
 __author__ = "Sergey Aganezov"
@@ -92,6 +94,33 @@ class BreakpointGraphTestCase(unittest.TestCase):
         self.assertEqual(graph.get_vertex_by_name("1h__repeat:ALCt__infinity"), v1)
         self.assertEqual(graph.get_vertex_by_name("1h__repeat:ALCh__infinity"), v2)
 
+    def test_get_vertex_by_name_index_maintenance(self):
+        # name -> vertex index returns instances stored in the graph and is kept up to date on vertex removal
+        graph = BreakpointGraph()
+        multicolor = Multicolor(self.genome1)
+        graph.add_edge(vertex1=self.v1, vertex2=self.inf_v1, multicolor=multicolor)
+        graph.add_edge(vertex1=self.v2, vertex2=self.inf_v2, multicolor=multicolor)
+        self.assertIs(graph.get_vertex_by_name("v1"), self.v1)
+        graph.add_edge(vertex1=TaggedBlockVertex("v1"), vertex2=self.v3, multicolor=multicolor)
+        self.assertIs(graph.get_vertex_by_name("v1"), self.v1)
+        self.assertIs(graph.get_vertex_by_name("v3"), self.v3)
+        kbreak = KBreak(start_edges=[(self.v1, self.inf_v1), (self.v2, self.inf_v2)],
+                        result_edges=[(self.v1, self.v2), (self.inf_v1, self.inf_v2)],
+                        multicolor=multicolor)
+        graph.apply_kbreak(kbreak=kbreak)
+        self.assertIsNone(graph.get_vertex_by_name(self.inf_v1.name))
+        self.assertIsNone(graph.get_vertex_by_name(self.inf_v2.name))
+        self.assertIs(graph.get_vertex_by_name("v2"), self.v2)
+
+    def test_get_vertex_by_name_non_canonical_tags_order(self):
+        graph = BreakpointGraph()
+        vertex = TaggedBlockVertex("v1")
+        vertex.add_tag("a", 1)
+        vertex.add_tag("b", 2)
+        graph.add_edge(vertex1=vertex, vertex2=self.v2, multicolor=Multicolor(self.genome1))
+        self.assertIs(graph.get_vertex_by_name("v1__a:1__b:2"), vertex)
+        self.assertEqual(graph.get_vertex_by_name("v1__b:2__a:1"), vertex)
+
     def test_add_edge(self):
         # breakpoint graph support addition of an edge without BGEdge wrapper
         graph = BreakpointGraph()
@@ -210,6 +239,33 @@ class BreakpointGraphTestCase(unittest.TestCase):
             else:
                 self.assertEqual(edge_2_key, res_key)
 
+    def test_iter_edges_raw(self):
+        # breakpoint graph supports iteration over edges as plain tuples, without creating BGEdge instances
+        graph = BreakpointGraph()
+        multicolor1 = Multicolor(self.genome1)
+        multicolor2 = Multicolor(self.genome4)
+        graph.add_edge(vertex1=self.v1, vertex2=self.v2, multicolor=multicolor1, data={"fragment": {"name": 1}})
+        graph.add_edge(vertex1=self.v1, vertex2=self.v3, multicolor=multicolor2)
+        raw_edges = list(graph.iter_edges_raw())
+        self.assertEqual(len(raw_edges), 2)
+        for (v1, v2, key, multicolor, data), (bgedge, bgedge_key) in zip(raw_edges, graph.edges(keys=True)):
+            self.assertEqual((v1, v2, key), (bgedge.vertex1, bgedge.vertex2, bgedge_key))
+            self.assertIs(multicolor, graph.bg[v1][v2][key]["attr_dict"]["multicolor"])
+            self.assertIs(data, bgedge.data)
+        self.assertEqual(len(list(graph.iter_edges_raw(nbunch=self.v3))), 1)
+
+    def test_iter_incident_raw(self):
+        graph = BreakpointGraph()
+        multicolor1 = Multicolor(self.genome1)
+        multicolor2 = Multicolor(self.genome4)
+        graph.add_edge(vertex1=self.v2, vertex2=self.v1, multicolor=multicolor1)
+        graph.add_edge(vertex1=self.v1, vertex2=self.v3, multicolor=multicolor2)
+        result = {v2: multicolor for v1, v2, _, multicolor, _ in graph.iter_incident_raw(vertex=self.v1)}
+        self.assertDictEqual(result, {self.v2: multicolor1, self.v3: multicolor2})
+        for v1, _, _, _, _ in graph.iter_incident_raw(vertex=self.v1):
+            self.assertEqual(v1, self.v1)
+        self.assertListEqual(list(graph.iter_incident_raw(vertex=self.v4)), [])
+
     def test_add_edge_with_already_existing_merge(self):
         # an edge can be added to the graph and merged to the first edge between two vertices, that current edge is attached to
         # mergin with first existing (if any) is a default behaviour
@@ -314,6 +370,40 @@ class BreakpointGraphTestCase(unittest.TestCase):
         for bgedge in edges:
             self.assertTrue(bgedge.multicolor in [Multicolor(self.genome4), Multicolor(self.genome2)])
 
+    def test_add_bgedges(self):
+        # bulk addition of edges shall produce the same graph, as one by one addition does
+        v1, v2, v3 = self.v1, self.v2, self.v3
+        bgedges = [BGEdge(vertex1=v1, vertex2=v2, multicolor=Multicolor(self.genome1), data={"origin": "a"}),
+                   BGEdge(vertex1=v2, vertex2=v3, multicolor=Multicolor(self.genome1), data={"origin": "b"}),
+                   BGEdge(vertex1=v2, vertex2=v1, multicolor=Multicolor(self.genome2, self.genome2)),
+                   BGEdge(vertex1=v1, vertex2=v3, multicolor=Multicolor(self.genome3))]
+        for merge in (True, False):
+            graph1, graph2 = BreakpointGraph(), BreakpointGraph()
+            for graph in (graph1, graph2):
+                graph.add_edge(v1, v3, multicolor=Multicolor(self.genome4))
+            for bgedge in bgedges:
+                graph1.add_bgedge(bgedge, merge=merge)
+            graph2.add_bgedges(iter(bgedges), merge=merge)
+            self.assertListEqual([(edge.vertex1, edge.vertex2, edge.multicolor, edge.data) for edge in graph1.edges()],
+                                 [(edge.vertex1, edge.vertex2, edge.multicolor, edge.data) for edge in graph2.edges()])
+            self.assertSetEqual(graph1.get_overall_set_of_colors(), graph2.get_overall_set_of_colors())
+        self.assertEqual(graph2.get_edge_by_two_vertices(v2, v3).data, {"origin": "b"})
+        self.assertIsNot(graph2.get_edge_by_two_vertices(v2, v3).multicolor, bgedges[1].multicolor)
+
+    def test_stored_multicolors_are_frozen(self):
+        graph = BreakpointGraph()
+        multicolor = Multicolor(self.genome1)
+        graph.add_edge(self.v1, self.v2, multicolor=multicolor)
+        graph.add_edge(self.v2, self.v3, multicolor=Multicolor(self.genome1))
+        edge = graph.get_edge_by_two_vertices(self.v1, self.v2)
+        self.assertIsInstance(edge.multicolor, FrozenMulticolor)
+        self.assertIs(edge.multicolor, graph.get_edge_by_two_vertices(self.v2, self.v3).multicolor)
+        multicolor.update(self.genome2)
+        edge.multicolor += Multicolor(self.genome3)
+        self.assertEqual(graph.get_edge_by_two_vertices(self.v1, self.v2).multicolor, Multicolor(self.genome1))
+        graph.add_edge(self.v1, self.v2, multicolor=Multicolor(self.genome2))
+        self.assertIsInstance(graph.get_edge_by_two_vertices(self.v1, self.v2).multicolor, FrozenMulticolor)
+
     def test_connected_components_iteration(self):
         # breakpoint graph supports iteration over distinct connected components
         # procedure is proxies to the underlying networkx.MultiGraph
@@ -1316,6 +1406,22 @@ class BreakpointGraphTestCase(unittest.TestCase):
         for bgedge in edges:
             self.assertTrue(bgedge.multicolor in multicolors)
 
+    def test_split_all_edges_with_prepared_guidance(self):
+        graph = BreakpointGraph()
+        v1, v2, v3 = self.v1, self.v2, self.v3
+        graph.add_edge(v1, v2, multicolor=Multicolor(self.genome1, self.genome2, self.genome3))
+        graph.add_edge(v1, v2, multicolor=Multicolor(self.genome1, self.genome2), merge=False)
+        graph.add_edge(v2, v3, multicolor=Multicolor(self.genome1, self.genome3))
+        guidance = SplitGuidance([Multicolor(self.genome1, self.genome2)])
+        graph.split_all_edges(guidance=guidance)
+        self.assertCountEqual([edge.multicolor for edge in graph.edges_between_two_vertices(v1, v2)],
+                              [Multicolor(self.genome1, self.genome2), Multicolor(self.genome3),
+                               Multicolor(self.genome1, self.genome2)])
+        self.assertEqual(len(list(graph.edges_between_two_vertices(v2, v3))), 2)
+        graph.split_bgedge(BGEdge(vertex1=v1, vertex2=v2, multicolor=Multicolor(self.genome1, self.genome2)),
+                           guidance=SplitGuidance([Multicolor(self.genome1)]))
+        self.assertEqual(len(list(graph.edges_between_two_vertices(v1, v2))), 4)
+
     def test_split_all_edges(self):
         # test with a four one-colored edges (all will stay as is)
         # two edges between vertices v1 and v2
@@ -1919,7 +2025,7 @@ class BreakpointGraphTestCase(unittest.TestCase):
         graph.delete_bgedge(bgedge=edge5)
         self.assertEqual(len(list(graph.nodes())), 8)
         self.assertEqual(len(list(graph.edges())), 8)
-        graph.merge_all_edges()
+        self.assertEqual(graph.merge_all_edges(), 3)
         self.assertEqual(len(list(graph.nodes())), 8)
         self.assertEqual(len(list(graph.get_edges_by_vertex(vertex=v1))), 3)
         self.assertEqual(len(list(graph.get_edges_by_vertex(vertex=v2))), 1)
@@ -1929,6 +2035,8 @@ class BreakpointGraphTestCase(unittest.TestCase):
         self.assertEqual(len(list(graph.get_edges_by_vertex(vertex=v5))), 1)
         self.assertEqual(len(list(graph.get_edges_by_vertex(vertex=v7))), 0)
         self.assertEqual(len(list(graph.get_edges_by_vertex(vertex=v8))), 0)
+        self.assertEqual(graph.merge_all_edges(), 0)
+        self.assertDictEqual(graph.get_edge_by_two_vertices(v1, v6).data, edge4.data)
         bgedges = list(graph.edges())
         multicolors = [multicolor1 + multicolor2 + multicolor1,
                        multicolor2 + multicolor2,
@@ -1938,6 +2046,22 @@ class BreakpointGraphTestCase(unittest.TestCase):
         for bgedge in bgedges:
             self.assertTrue(bgedge.multicolor in multicolors)
 
+    def test_merge_all_edges_then_fusion_kbreak(self):
+        # merged edges keep the default data, so that a fusion k-break can be applied to them afterwards
+        graph = BreakpointGraph()
+        multicolor = Multicolor(self.genome1)
+        for _ in range(2):
+            graph.add_bgedge(BGEdge(vertex1=self.v1, vertex2=self.inf_v1, multicolor=multicolor), merge=False)
+            graph.add_bgedge(BGEdge(vertex1=self.v2, vertex2=self.inf_v2, multicolor=multicolor), merge=False)
+        self.assertEqual(graph.merge_all_edges(), 2)
+        self.assertDictEqual(graph.get_edge_by_two_vertices(self.v1, self.inf_v1).data, BGEdge.create_default_data_dict())
+        kbreak = KBreak(start_edges=[(self.v1, self.inf_v1), (self.v2, self.inf_v2)],
+                        result_edges=[(self.v1, self.v2), (self.inf_v1, self.inf_v2)],
+                        multicolor=multicolor)
+        graph.apply_kbreak(kbreak)
+        self.assertEqual(graph.get_edge_by_two_vertices(self.v1, self.v2).multicolor, multicolor)
+        self.assertEqual(graph.get_edge_by_two_vertices(self.v1, self.inf_v1).multicolor, multicolor)
+
     def test_edges_between_two_vertices(self):
         bg = BreakpointGraph()
         v1 = self.v1
@@ -2302,6 +2426,99 @@ class BreakpointGraphTestCase(unittest.TestCase):
         self.assertEqual(bg.get_edge_by_two_vertices(v3, v4).multicolor, Multicolor(self.genome1))
         self.assertEqual(bg.get_edge_by_two_vertices(v2, v4).multicolor, multicolor)
 
+    def test_apply_kbreaks_sequential(self):
+        # a later k-break in a batch can target edges, that are created by earlier k-breaks in it
+        # result shall be the same as if k-breaks were applied one by one
+        v1, v2, v3, v4 = self.v1, self.v2, self.v3, self.v4
+        multicolor = Multicolor(self.genome1)
+        kbreaks = [KBreak(start_edges=[(v1, v2), (v3, v4)], result_edges=[(v1, v3), (v2, v4)], multicolor=multicolor),
+                   KBreak(start_edges=[(v1, v3), (v2, v4)], result_edges=[(v1, v4), (v2, v3)], multicolor=multicolor)]
+        graphs = []
+        for _ in range(2):
+            bg = BreakpointGraph()
+            bg.add_edge(v1, v2, multicolor=Multicolor(self.genome1, self.genome2))
+            bg.add_edge(v3, v4, multicolor=Multicolor(self.genome1))
+            graphs.append(bg)
+        for kbreak in kbreaks:
+            graphs[0].apply_kbreak(kbreak)
+        graphs[1].apply_kbreaks(kbreaks)
+        for bg in graphs:
+            self.assertEqual(len(list(bg.edges())), 3)
+            self.assertEqual(bg.get_edge_by_two_vertices(v1, v2).multicolor, Multicolor(self.genome2))
+            self.assertEqual(bg.get_edge_by_two_vertices(v1, v4).multicolor, multicolor)
+            self.assertEqual(bg.get_edge_by_two_vertices(v2, v3).multicolor, multicolor)
+            self.assertIsNone(bg.get_edge_by_two_vertices(v3, v4))
+
+    def test_apply_kbreaks_conflict(self):
+        # k-breaks in a batch can not target the same edge, whole batch is rejected before any change is performed
+        bg = BreakpointGraph()
+        v1, v2, v3, v4 = self.v1, self.v2, self.v3, self.v4
+        multicolor = Multicolor(self.genome1)
+        bg.add_edge(v1, v2, multicolor=multicolor)
+        bg.add_edge(v3, v4, multicolor=multicolor)
+        kbreak = KBreak(start_edges=[(v1, v2), (v3, v4)], result_edges=[(v1, v3), (v2, v4)], multicolor=multicolor)
+        kbreak2 = KBreak(start_edges=[(v1, v2), (v3, v4)], result_edges=[(v1, v4), (v2, v3)], multicolor=multicolor)
+        with self.assertRaises(ValueError):
+            bg.apply_kbreaks([kbreak, kbreak2])
+        with self.assertRaises(TypeError):
+            bg.apply_kbreaks([kbreak, "kbreak"])
+        self.assertEqual(len(list(bg.edges())), 2)
+        self.assertEqual(bg.get_edge_by_two_vertices(v1, v2).multicolor, multicolor)
+        self.assertEqual(bg.get_edge_by_two_vertices(v3, v4).multicolor, multicolor)
+
+    def test_apply_kbreaks_infinity_vertices_cleanup(self):
+        # infinity vertices, that are left without edges after the whole batch is applied, are deleted
+        bg = BreakpointGraph()
+        v1, v2 = self.v1, self.v2
+        i_v1, i_v2 = self.inf_v1, self.inf_v2
+        multicolor = Multicolor(self.genome1)
+        bg.add_edge(v1, v2, multicolor=multicolor)
+        kbreaks = [KBreak(start_edges=[(v1, v2), (i_v1, i_v2)], result_edges=[(v1, i_v1), (v2, i_v2)],
+                          multicolor=multicolor),
+                   KBreak(start_edges=[(v1, i_v1), (v2, i_v2)], result_edges=[(v1, v2), (i_v1, i_v2)],
+                          multicolor=multicolor)]
+        bg.apply_kbreaks(kbreaks, validate=False)
+        self.assertSetEqual(set(bg.nodes()), {v1, v2})
+        self.assertEqual(bg.get_edge_by_two_vertices(v1, v2).multicolor, multicolor)
+
+    def test_apply_kbreaks_without_validation_missing_start_edges(self):
+        # k-breaks, start edges of which are not present, are not applied even if validation is turned off
+        bg = BreakpointGraph()
+        v1, v2, v3, v4 = self.v1, self.v2, self.v3, self.v4
+        bg.add_edge(v1, v2, multicolor=Multicolor(self.genome1))
+        bg.add_edge(v3, v4, multicolor=Multicolor(self.genome1))
+        multicolor = Multicolor(self.genome2)
+        kbreak = KBreak(start_edges=[(v1, v2), (v3, v4)], result_edges=[(v1, v3), (v2, v4)], multicolor=multicolor)
+        with self.assertRaises(ValueError):
+            bg.apply_kbreaks([kbreak], validate=False)
+        self.assertNotIn(self.genome2, bg.get_overall_set_of_colors())
+        fusion = KBreak(start_edges=[(v1, v3), (self.inf_v1, self.inf_v2)], result_edges=[(v1, self.inf_v1), (v3, self.inf_v2)],
+                        multicolor=Multicolor(self.genome1))
+        with self.assertRaises(ValueError):
+            bg.apply_kbreaks([fusion], validate=False)
+
+    def test_apply_kbreaks_without_validation_failure_in_the_middle(self):
+        # if some k-break in the batch fails, changes performed by preceding k-breaks of the batch are rolled back
+        bg = BreakpointGraph()
+        v1, v2, v3, v4 = self.v1, self.v2, self.v3, self.v4
+        bg.add_edge(v1, v2, multicolor=Multicolor(self.genome1))
+        bg.add_edge(v3, v4, multicolor=Multicolor(self.genome1))
+        bg.add_edge(v1, v4, multicolor=Multicolor(self.genome2))
+        multicolor = Multicolor(self.genome1)
+        kbreak1 = KBreak(start_edges=[(v1, v2), (v3, v4)], result_edges=[(v1, v3), (v2, v4)], multicolor=multicolor)
+        kbreak2 = KBreak(start_edges=[(v1, v2), (v3, self.inf_v1)], result_edges=[(v1, v3), (v2, self.inf_v1)], multicolor=multicolor)
+        ref_edges = sorted((edge.vertex1.name, edge.vertex2.name, tuple(sorted((genome.name, count) for genome, count in edge.multicolor.multicolors.items()))) for edge in bg.edges())
+        ref_vertices = sorted(vertex.name for vertex in bg.nodes())
+        with self.assertRaises(ValueError):
+            bg.apply_kbreaks([kbreak1, kbreak2], validate=False)
+        edges = sorted((edge.vertex1.name, edge.vertex2.name, tuple(sorted((genome.name, count) for genome, count in edge.multicolor.multicolors.items()))) for edge in bg.edges())
+        self.assertListEqual(edges, ref_edges)
+        self.assertListEqual(sorted(vertex.name for vertex in bg.nodes()), ref_vertices)
+        self.assertEqual(len(list(bg.get_genome_view(self.genome1).edges())), 2)
+        # graph stays usable after the failed batch
+        bg.apply_kbreaks([kbreak1])
+        self.assertIsNotNone(bg.get_edge_by_two_vertices(v1, v3))
+
     def test_json_serialization_no_subclassing(self):
         # breakpoint graph shall be serialized into json format, by utilizing to_json methods of its edges and vertices
         # BreakpointGraph does not utilize a simple json schema, but rather a more complex workflow
@@ -2382,7 +2599,13 @@ class BreakpointGraphTestCase(unittest.TestCase):
         # case with BreakpointGraph with a single edge and only two multicolors in it
         # multiplicity of colors is set to 1 and 2
 
+        class TaggedBlockVertexWithSpecialAttribute(TaggedBlockVertex):
+            # vertices keep their attributes in slots, so an additional attribute requires a slot of its own
+            __slots__ = ("special_attribute",)
+
         class BlockVertexJSONShcemaWithSpecialAttribute(TaggedBlockVertex.TaggedBlockVertexJSONSchema):
+            object_class = TaggedBlockVertexWithSpecialAttribute
+
             @post_load
             def make_object(self, data):
                 new_vertex = super(BlockVertexJSONShcemaWithSpecialAttribute, self).make_object(data=data)
@@ -2542,6 +2765,34 @@ class BreakpointGraphTestCase(unittest.TestCase):
         self.assertSetEqual(overall_colors, bg.get_overall_set_of_colors())
         self.assertIsNot(overall_colors, bg.get_overall_set_of_colors())
 
+    def test_get_overall_set_of_colors_interleaved_with_changes(self):
+        graph = BreakpointGraph()
+        genome1, genome2 = BGGenome("red"), BGGenome("green")
+        v1, v2, v3, v4 = [TaggedBlockVertex(name) for name in ("1t", "1h", "2t", "2h")]
+        graph.add_edge(v1, v2, multicolor=Multicolor(genome1))
+        self.assertSetEqual(graph.get_overall_set_of_colors(), {genome1})
+        graph.add_edge(v1, v2, multicolor=Multicolor(genome2))
+        graph.add_edge(v3, v4, multicolor=Multicolor(genome2))
+        self.assertSetEqual(graph.get_overall_set_of_colors(), {genome1, genome2})
+        self.assertEqual(graph.get_number_of_edges_by_color(genome2), 2)
+        graph.delete_edge(v1, v2, multicolor=Multicolor(genome1))
+        self.assertSetEqual(graph.get_overall_set_of_colors(), {genome2})
+        self.assertEqual(graph.get_number_of_edges_by_color(genome1), 0)
+        graph.split_all_edges()
+        graph.delete_all_edges_between_two_vertices(v3, v4)
+        self.assertEqual(graph.get_number_of_edges_by_color(genome2), 1)
+        graph.delete_edge(v2, v1, multicolor=Multicolor(genome2))
+        self.assertSetEqual(graph.get_overall_set_of_colors(), set())
+
+    def test_get_blocks_order_keeps_overall_set_of_colors(self):
+        data = [">genome_1",
+                "1 2 3 $"]
+        bg = GRIMMReader.get_breakpoint_graph(stream=data)
+        overall_colors = bg.get_overall_set_of_colors()
+        bg.get_blocks_order()
+        bg.get_fragments_orders()
+        self.assertSetEqual(overall_colors, {BGGenome("genome_1")})
+
     def _populate_bg_in_genome_graph_test(self):
         data = [
             ">genome_1",
@@ -2589,6 +2840,57 @@ class BreakpointGraphTestCase(unittest.TestCase):
         self.assertEqual(len(list(genome_graph.edges())), 0)
         self.assertSetEqual(set(), genome_graph.get_overall_set_of_colors())
 
+    def test_get_genome_view_existing_color(self):
+        file_like = self._populate_bg_in_genome_graph_test()
+        bg = GRIMMReader.get_breakpoint_graph(file_like, merge_edges=False)
+        genome_view = bg.get_genome_view(color=BGGenome("genome_1"))
+        genome_graph = bg.get_genome_graph(color=BGGenome("genome_1"))
+        self.assertSetEqual(set(genome_view.nodes()), set(genome_graph.nodes()))
+        self.assertEqual(len(list(genome_view.edges())), 4)
+        for edge in genome_view.edges():
+            self.assertEqual(edge.multicolor, genome_graph.get_edge_by_two_vertices(edge.vertex1, edge.vertex2).multicolor)
+        self.assertSetEqual({BGGenome("genome_1")}, genome_view.get_overall_set_of_colors())
+        self.assertDictEqual(genome_view.get_blocks_order(), genome_graph.get_blocks_order())
+
+    def test_get_genome_view_non_existing_color(self):
+        file_like = self._populate_bg_in_genome_graph_test()
+        bg = GRIMMReader.get_breakpoint_graph(file_like, merge_edges=False)
+        genome_view = bg.get_genome_view(color=BGGenome("non_existing"))
+        self.assertEqual(len(list(genome_view.nodes())), 0)
+        self.assertEqual(len(list(genome_view.edges())), 0)
+        self.assertSetEqual(set(), genome_view.get_overall_set_of_colors())
+        self.assertSetEqual(set(), bg.get_overall_set_of_colors() & {BGGenome("non_existing")})
+        # obtaining a view is a read and does not create an index entry for the respective color
+        self.assertNotIn(BGGenome("non_existing"), bg._BreakpointGraph__color_index)
+
+    def test_get_genome_view_reflects_graph_changes(self):
+        graph = BreakpointGraph()
+        genome1, genome2 = BGGenome("red"), BGGenome("green")
+        v1, v2, v3, v4 = [TaggedBlockVertex(name) for name in ("1t", "1h", "2t", "2h")]
+        graph.add_edge(v1, v2, multicolor=Multicolor(genome1, genome2))
+        graph.add_edge(v3, v4, multicolor=Multicolor(genome1))
+        genome_view = graph.get_genome_view(color=genome2)
+        self.assertEqual(len(list(genome_view.edges())), 1)
+        graph.add_edge(v3, v4, multicolor=Multicolor(genome2))
+        self.assertSetEqual(set(genome_view.nodes()), {v1, v2, v3, v4})
+        graph.delete_edge(v1, v2, multicolor=Multicolor(genome2))
+        self.assertSetEqual(set(genome_view.nodes()), {v3, v4})
+        graph.split_all_edges()
+        self.assertEqual(len(list(genome_view.edges())), 1)
+        self.assertEqual(list(genome_view.get_edges_by_vertex(v3))[0].multicolor, Multicolor(genome2))
+        graph.apply_kbreak(KBreak(start_edges=[(v1, v2), (v3, v4)], result_edges=[(v1, v3), (v2, v4)],
+                                  multicolor=Multicolor(genome1)))
+        self.assertSetEqual(set(graph.get_genome_view(color=genome1).nodes()), {v1, v2, v3, v4})
+        self.assertSetEqual({frozenset((edge.vertex1, edge.vertex2)) for edge in genome_view.edges()},
+                            {frozenset((v3, v4))})
+        # view, obtained for a color, that is not present in the graph yet, reflects further additions of that color
+        genome3 = BGGenome("blue")
+        genome_view = graph.get_genome_view(color=genome3)
+        self.assertEqual(len(genome_view), 0)
+        graph.add_edge(v1, v2, multicolor=Multicolor(genome3))
+        self.assertSetEqual(set(genome_view.nodes()), {v1, v2})
+        self.assertSetEqual({genome3}, genome_view.get_overall_set_of_colors())
+
     def test_get_blocks_order_for_grimm_from_genome_graph(self):
         data = [
             ">genome_1",
@@ -2954,6 +3256,375 @@ class BreakpointGraphTestCase(unittest.TestCase):
         self.assertEqual(bg.get_condensed_edge(vertex1=v1, vertex2=v2), reference)
 
 
+class BreakpointGraphTransactionTestCase(unittest.TestCase):
+    def setUp(self):
+        self.genome1 = BGGenome("red")
+        self.genome2 = BGGenome("green")
+        self.data = [">red", "1 2 3 $", "4 -5 @",
+                     ">green", "1 -2 3 $", "4 5 @"]
+
+    @staticmethod
+    def state(graph):
+        edges = sorted((tuple(sorted(str(vertex) for vertex in (edge.vertex1, edge.vertex2))),
+                        tuple(sorted((str(color), cnt) for color, cnt in edge.multicolor.multicolors.items())),
+                        str(sorted(edge.data.items()) if isinstance(edge.data, dict) else edge.data))
+                       for edge in graph.edges())
+        return edges, sorted(str(vertex) for vertex in graph.nodes())
+
+    def test_rollback_apply_kbreak(self):
+        graph = GRIMMReader.get_breakpoint_graph(self.data)
+        state = self.state(graph)
+        colors = set(graph.get_overall_set_of_colors())
+        v1t, v2t = graph.get_vertex_by_name("1t"), graph.get_vertex_by_name("2t")
+        v1h, v2h = graph.get_vertex_by_name("1h"), graph.get_vertex_by_name("2h")
+        checkpoint = graph.checkpoint()
+        graph.apply_kbreak(KBreak(start_edges=[(v1h, v2t), (v2h, graph.get_vertex_by_name("3t"))],
+                                  result_edges=[(v1h, v2h), (v2t, graph.get_vertex_by_name("3t"))],
+                                  multicolor=Multicolor(self.genome1)))
+        graph.delete_all_edges_between_two_vertices(v1t, graph.get_vertex_by_name("1t__infinity"))
+        self.assertNotEqual(self.state(graph), state)
+        graph.rollback(checkpoint)
+        self.assertEqual(self.state(graph), state)
+        self.assertSetEqual(graph.get_overall_set_of_colors(), colors)
+        self.assertIs(graph.get_vertex_by_name("1t__infinity"), graph.get_vertex_by_name("1t__infinity"))
+        self.assertIsNotNone(graph.get_vertex_by_name("1t__infinity"))
+        with self.assertRaises(ValueError):
+            graph.rollback(checkpoint)
+
+    def test_rollback_split_merge_and_new_vertices(self):
+        graph = GRIMMReader.get_breakpoint_graph(self.data, merge_edges=True)
+        graph.get_genome_view(self.genome1)
+        state = self.state(graph)
+        checkpoint = graph.checkpoint()
+        graph.split_all_edges()
+        graph.add_edge(TaggedBlockVertex("10t"), TaggedBlockVertex("10h"), multicolor=Multicolor(BGGenome("blue")))
+        graph.merge_all_edges()
+        graph.rollback(checkpoint)
+        self.assertEqual(self.state(graph), state)
+        self.assertSetEqual(graph.get_overall_set_of_colors(), {self.genome1, self.genome2})
+        self.assertIsNone(graph.get_vertex_by_name("10t"))
+        self.assertEqual(len(list(graph.get_genome_view(self.genome1).edges())),
+                         len(list(graph.get_genome_graph(self.genome1).edges())))
+
+    def test_rollback_subtraction_beyond_multiplicity(self):
+        graph = BreakpointGraph()
+        v1, v2 = TaggedBlockVertex("1t"), TaggedBlockVertex("1h")
+        graph.add_edge(v1, v2, multicolor=Multicolor(self.genome1, self.genome2))
+        checkpoint = graph.checkpoint()
+        graph.delete_edge(v1, v2, multicolor=Multicolor(self.genome1, self.genome1), key=0)
+        self.assertEqual(graph.get_edge_by_two_vertices(v1, v2).multicolor, Multicolor(self.genome2))
+        graph.rollback(checkpoint)
+        self.assertEqual(graph.get_edge_by_two_vertices(v1, v2).multicolor, Multicolor(self.genome1, self.genome2))
+
+    def test_nested_checkpoints_and_commit(self):
+        graph = BreakpointGraph()
+        v1, v2, v3 = TaggedBlockVertex("1t"), TaggedBlockVertex("1h"), TaggedBlockVertex("2t")
+        outer = graph.checkpoint()
+        graph.add_edge(v1, v2, multicolor=Multicolor(self.genome1))
+        inner = graph.checkpoint()
+        graph.add_edge(v2, v3, multicolor=Multicolor(self.genome1))
+        graph.commit(inner)
+        graph.add_edge(v1, v3, multicolor=Multicolor(self.genome1))
+        graph.rollback()
+        self.assertEqual(len(list(graph.nodes())), 0)
+        self.assertEqual(len(list(graph.edges())), 0)
+        with self.assertRaises(ValueError):
+            graph.commit(outer)
+        with self.assertRaises(ValueError):
+            graph.rollback()
+
+    def test_transaction(self):
+        graph = GRIMMReader.get_breakpoint_graph(self.data)
+        state = self.state(graph)
+        with self.assertRaises(KeyError):
+            with graph.transaction():
+                graph.split_all_edges()
+                graph.merge_all_edges()
+                raise KeyError
+        self.assertEqual(self.state(graph), state)
+        with graph.transaction() as checkpoint:
+            graph.add_edge(TaggedBlockVertex("10t"), TaggedBlockVertex("10h"), multicolor=Multicolor(self.genome1))
+            graph.rollback(checkpoint)
+        self.assertEqual(self.state(graph), state)
+        with graph.transaction():
+            graph.add_edge(TaggedBlockVertex("10t"), TaggedBlockVertex("10h"), multicolor=Multicolor(self.genome1))
+        self.assertIsNotNone(graph.get_vertex_by_name("10t"))
+
+    def test_fork(self):
+        for backend in ("networkx", "compact"):
+            graph = BreakpointGraph(backend=backend)
+            for edge in GRIMMReader.get_breakpoint_graph(self.data).edges():
+                graph.add_bgedge(edge, merge=False)
+            base = graph.bg
+            state = self.state(graph)
+            fork = graph.fork()
+            self.assertIs(fork.bg.base, base)
+            self.assertIs(graph.bg.base, base)
+            self.assertEqual(self.state(fork), state)
+            v1h, v2t = fork.get_vertex_by_name("1h"), fork.get_vertex_by_name("2t")
+            v2h, v3t = fork.get_vertex_by_name("2h"), fork.get_vertex_by_name("3t")
+            fork.apply_kbreak(KBreak(start_edges=[(v1h, v2t), (v2h, v3t)], result_edges=[(v1h, v2h), (v2t, v3t)],
+                                     multicolor=Multicolor(self.genome1)))
+            fork_state = self.state(fork)
+            self.assertNotEqual(fork_state, state)
+            self.assertEqual(self.state(graph), state)
+            graph.delete_all_edges_between_two_vertices(graph.get_vertex_by_name("1t"),
+                                                        graph.get_vertex_by_name("1t__infinity"))
+            self.assertEqual(self.state(fork), fork_state)
+            self.assertEqual(len(list(fork.get_edges_by_vertex(fork.get_vertex_by_name("1t__infinity")))), 1)
+            self.assertEqual(len(list(graph.get_edges_by_vertex(graph.get_vertex_by_name("1t__infinity")))), 0)
+            fork2 = graph.fork()
+            self.assertIs(fork2.bg.base, graph.bg.base)
+            self.assertEqual(self.state(fork2), self.state(graph))
+
+    def test_genome_graph_backend_of_derived_graphs(self):
+        for backend, graph_class in (("networkx", nx.MultiGraph), ("compact", CompactMultiGraph)):
+            graph = BreakpointGraph(backend=backend)
+            for edge in GRIMMReader.get_breakpoint_graph(self.data).edges():
+                graph.add_bgedge(edge, merge=False)
+            fork = graph.fork()
+            fork.delete_all_edges_between_two_vertices(fork.get_vertex_by_name("1h"), fork.get_vertex_by_name("2t"))
+            for source in (graph, fork, fork.fork(), graph.freeze(), graph.freeze().fork()):
+                genome_graph = source.get_genome_graph(self.genome1)
+                self.assertIs(type(genome_graph.bg), graph_class)
+        genome_graph = BreakpointGraph(graph=ForkedMultiGraph()).get_genome_graph(self.genome1)
+        self.assertIs(type(genome_graph.bg), BreakpointGraph.backends[BreakpointGraph.default_backend])
+
+    def test_fork_chain_depth_is_bounded(self):
+        def structure(graph):
+            edges, vertices = self.state(graph)
+            return vertices, sorted(edge[:2] for edge in edges)
+
+        for backend in ("networkx", "compact"):
+            graph = BreakpointGraph(backend=backend)
+            for edge in GRIMMReader.get_breakpoint_graph(self.data).edges():
+                graph.add_bgedge(edge, merge=False)
+            state = structure(graph)
+            forks = [graph]
+            current = graph
+            for index in range(1000):
+                current = current.fork()
+                v1h, v2t = current.get_vertex_by_name("1h"), current.get_vertex_by_name("2t")
+                v2h, v3t = current.get_vertex_by_name("2h"), current.get_vertex_by_name("3t")
+                if index % 2 == 0:
+                    kbreak = KBreak(start_edges=[(v1h, v2t), (v2h, v3t)], result_edges=[(v1h, v2h), (v2t, v3t)],
+                                    multicolor=Multicolor(self.genome1))
+                else:
+                    kbreak = KBreak(start_edges=[(v1h, v2h), (v2t, v3t)], result_edges=[(v1h, v2t), (v2h, v3t)],
+                                    multicolor=Multicolor(self.genome1))
+                current.apply_kbreak(kbreak)
+                forks.append(current)
+                self.assertLessEqual(current.bg.depth, ForkedMultiGraph.MAX_DEPTH)
+            self.assertEqual(structure(current), state)
+            self.assertEqual(structure(forks[0]), state)
+            self.assertEqual(structure(forks[501]), structure(forks[1]))
+            self.assertNotEqual(structure(forks[1]), state)
+            self.assertEqual(len(list(current.edges())), len(list(graph.edges())))
+
+    def test_fork_keeps_tracking_and_checkpoints(self):
+        graph = GRIMMReader.get_breakpoint_graph(self.data)
+        graph.enable_components_tracking()
+        checkpoint = graph.checkpoint()
+        fork = graph.fork()
+        self.assertIsNone(fork.components_tracker)
+        self.assertIs(graph.components_tracker.graph, graph.bg)
+        graph.delete_all_edges_between_two_vertices(graph.get_vertex_by_name("1h"), graph.get_vertex_by_name("2t"))
+        graph.delete_all_edges_between_two_vertices(graph.get_vertex_by_name("1h"), graph.get_vertex_by_name("2h"))
+        self.assertNotEqual(graph.get_component_id(graph.get_vertex_by_name("1h")),
+                            graph.get_component_id(graph.get_vertex_by_name("2t")))
+        graph.rollback(checkpoint)
+        self.assertEqual(self.state(graph), self.state(fork))
+        with self.assertRaises(ValueError):
+            fork.rollback()
+
+    def test_freeze(self):
+        for backend in ("networkx", "compact"):
+            graph = BreakpointGraph(backend=backend)
+            for edge in GRIMMReader.get_breakpoint_graph(self.data).edges():
+                graph.add_bgedge(edge, merge=False)
+            state = self.state(graph)
+            frozen = graph.freeze()
+            self.assertTrue(frozen.is_frozen)
+            self.assertFalse(graph.is_frozen)
+            self.assertIs(frozen.freeze(), frozen)
+            self.assertEqual(self.state(frozen), state)
+            self.assertSetEqual(frozen.get_overall_set_of_colors(), {self.genome1, self.genome2})
+            self.assertIsNotNone(frozen.components_tracker)
+            self.assertEqual(frozen.get_genome_view(self.genome1).get_blocks_order(),
+                             graph.get_genome_view(self.genome1).get_blocks_order())
+            self.assertEqual(self.state(frozen.get_genome_graph(self.genome2)),
+                             self.state(graph.get_genome_graph(self.genome2)))
+            v1h, v2t = frozen.get_vertex_by_name("1h"), frozen.get_vertex_by_name("2t")
+            with self.assertRaises(nx.NetworkXError):
+                frozen.delete_all_edges_between_two_vertices(v1h, v2t)
+            with self.assertRaises(nx.NetworkXError):
+                frozen.add_edge(v1h, v2t, multicolor=Multicolor(self.genome1))
+            self.assertEqual(self.state(frozen), state)
+            graph.delete_all_edges_between_two_vertices(graph.get_vertex_by_name("1h"), graph.get_vertex_by_name("2t"))
+            self.assertEqual(self.state(frozen), state)
+
+    def test_frozen_read_only_calls_keep_indices(self):
+        frozen = GRIMMReader.get_breakpoint_graph(self.data).freeze()
+        vertex_index = dict(frozen._BreakpointGraph__vertex_index)
+        color_index = {color: dict(edges) for color, edges in frozen._BreakpointGraph__color_index.items()}
+        self.assertIsNotNone(frozen.get_vertex_by_name("1h"))
+        self.assertIsNone(frozen.get_vertex_by_name("10t"))
+        self.assertIsNone(frozen.get_vertex_by_name("10t__infinity"))
+        self.assertListEqual(list(frozen.get_genome_view(BGGenome("blue")).edges()), [])
+        self.assertEqual(len(list(frozen.get_genome_view(self.genome1).edges())), 6)
+        self.assertEqual(len(list(frozen.get_genome_graph(BGGenome("blue")).edges())), 0)
+        self.assertDictEqual(frozen._BreakpointGraph__vertex_index, vertex_index)
+        self.assertDictEqual(frozen._BreakpointGraph__color_index, color_index)
+
+    def test_fork_of_frozen_graph(self):
+        frozen = GRIMMReader.get_breakpoint_graph(self.data).freeze()
+        state = self.state(frozen)
+        fork = frozen.fork()
+        self.assertIs(fork.bg.base, frozen.bg)
+        self.assertTrue(frozen.is_frozen)
+        self.assertFalse(fork.is_frozen)
+        fork.delete_all_edges_between_two_vertices(fork.get_vertex_by_name("1h"), fork.get_vertex_by_name("2t"))
+        self.assertNotEqual(self.state(fork), state)
+        self.assertEqual(self.state(frozen), state)
+
+
+class BreakpointGraphSparseTestCase(unittest.TestCase):
+    def setUp(self):
+        self.genome1 = BGGenome("red")
+        self.genome2 = BGGenome("green")
+        self.data = [">red", "1 2 3 $", "4 -5 @",
+                     ">green", "1 -2 3 $", "4 5 @"]
+
+    @staticmethod
+    def state(graph):
+        return sorted((tuple(sorted(str(vertex) for vertex in (edge.vertex1, edge.vertex2))),
+                       tuple(sorted((str(color.name), cnt) for color, cnt in edge.multicolor.multicolors.items())))
+                      for edge in graph.edges())
+
+    def test_to_sparse(self):
+        graph = GRIMMReader.get_breakpoint_graph(self.data)
+        vertices, matrices = graph.to_sparse()
+        self.assertSetEqual(set(vertices), set(graph.nodes()))
+        self.assertSetEqual(set(matrices), {self.genome1, self.genome2})
+        for color, matrix in matrices.items():
+            self.assertEqual(matrix.shape, (len(vertices), len(vertices)))
+            self.assertEqual((matrix != matrix.T).nnz, 0)
+            self.assertEqual(matrix.sum(), 2 * graph.get_number_of_edges_by_color(color))
+            self.assertListEqual(list(matrix.sum(axis=1).A1), [1] * len(vertices))
+        single_vertices, matrix = graph.to_sparse(color=self.genome2)
+        self.assertListEqual(single_vertices, vertices)
+        self.assertEqual((matrix != matrices[self.genome2]).nnz, 0)
+        self.assertEqual(graph.to_sparse(color=BGGenome("blue"))[1].nnz, 0)
+
+    def test_to_sparse_multiplicities_and_loops(self):
+        graph = BreakpointGraph()
+        v1, v2 = TaggedBlockVertex("v1"), TaggedBlockVertex("v2")
+        graph.add_edge(v1, v2, multicolor=Multicolor(self.genome1, self.genome1))
+        graph.add_edge(v1, v2, multicolor=Multicolor(self.genome1, self.genome2), merge=False)
+        graph.add_edge(v1, v1, multicolor=Multicolor(self.genome2))
+        vertices, matrix = graph.to_sparse(color=self.genome1)
+        index = {vertex: vertex_id for vertex_id, vertex in enumerate(vertices)}
+        self.assertEqual(matrix[index[v1], index[v2]], 3)
+        self.assertEqual(matrix[index[v2], index[v1]], 3)
+        vertices, matrix = graph.to_sparse(color=self.genome2)
+        self.assertEqual(matrix[index[v1], index[v1]], 1)
+        self.assertEqual(matrix[index[v1], index[v2]], 1)
+
+    def test_from_sparse(self):
+        for merge_edges in (True, False):
+            graph = GRIMMReader.get_breakpoint_graph(self.data, merge_edges=merge_edges)
+            if not merge_edges:
+                graph.merge_all_edges()
+            recovered = BreakpointGraph.from_sparse(*graph.to_sparse())
+            self.assertListEqual(self.state(recovered), self.state(graph))
+            self.assertSetEqual(set(recovered.nodes()), set(graph.nodes()))
+        vertices, matrices = graph.to_sparse()
+        with self.assertRaises(ValueError):
+            BreakpointGraph.from_sparse(vertices[1:], matrices)
+
+
+class BreakpointGraphEventsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.genome1 = BGGenome("red")
+        self.genome2 = BGGenome("green")
+        self.v1 = TaggedBlockVertex("v1")
+        self.v2 = TaggedBlockVertex("v2")
+        self.v3 = TaggedBlockVertex("v3")
+        self.v4 = TaggedBlockVertex("v4")
+
+    def test_edge_events(self):
+        graph = BreakpointGraph()
+        events = []
+        callback = events.append
+        self.assertIs(graph.subscribe(callback), callback)
+        graph.add_edge(self.v1, self.v2, multicolor=Multicolor(self.genome1))
+        graph.add_edge(self.v1, self.v2, multicolor=Multicolor(self.genome2))
+        graph.delete_edge(self.v1, self.v2, multicolor=Multicolor(self.genome1))
+        graph.delete_edge(self.v1, self.v2, multicolor=Multicolor(self.genome2))
+        self.assertListEqual([event.kind for event in events],
+                             [BGGraphEvent.EDGE_ADDED, BGGraphEvent.MULTICOLOR_CHANGED,
+                              BGGraphEvent.MULTICOLOR_CHANGED, BGGraphEvent.MULTICOLOR_CHANGED,
+                              BGGraphEvent.EDGE_REMOVED])
+        self.assertEqual(events[0].multicolor, Multicolor(self.genome1))
+        self.assertIsNone(events[0].previous_multicolor)
+        self.assertEqual(events[1].multicolor, Multicolor(self.genome1, self.genome2))
+        self.assertEqual(events[1].previous_multicolor, Multicolor(self.genome1))
+        self.assertEqual(events[3].previous_multicolor, Multicolor(self.genome2))
+        self.assertEqual(events[3].multicolor, Multicolor())
+        self.assertIsNone(events[4].multicolor)
+        self.assertSetEqual({(event.vertex1, event.vertex2, event.key) for event in events}, {(self.v1, self.v2, 0)})
+
+    def test_incremental_consumer(self):
+        graph = GRIMMReader.get_breakpoint_graph([">red", "1 2 3 $", ">green", "1 -2 3 $"])
+        edges = {(frozenset((v1, v2)), key): multicolor for v1, v2, key, multicolor, _ in graph.iter_edges_raw()}
+
+        def consumer(event):
+            if event.kind == BGGraphEvent.EDGE_REMOVED:
+                del edges[(frozenset((event.vertex1, event.vertex2)), event.key)]
+            elif event.kind in (BGGraphEvent.EDGE_ADDED, BGGraphEvent.MULTICOLOR_CHANGED):
+                edges[(frozenset((event.vertex1, event.vertex2)), event.key)] = event.multicolor
+
+        graph.subscribe(consumer)
+        checkpoint = graph.checkpoint()
+        v1h, v2t = graph.get_vertex_by_name("1h"), graph.get_vertex_by_name("2t")
+        v2h, v3t = graph.get_vertex_by_name("2h"), graph.get_vertex_by_name("3t")
+        graph.apply_kbreak(KBreak(start_edges=[(v1h, v2t), (v2h, v3t)], result_edges=[(v1h, v2h), (v2t, v3t)],
+                                  multicolor=Multicolor(self.genome1)))
+        self.assertDictEqual(edges, {(frozenset((v1, v2)), key): multicolor
+                                     for v1, v2, key, multicolor, _ in graph.iter_edges_raw()})
+        graph.split_all_edges_between_two_vertices(v1h, graph.get_vertex_by_name("2t"))
+        graph.rollback(checkpoint)
+        self.assertDictEqual(edges, {(frozenset((v1, v2)), key): multicolor
+                                     for v1, v2, key, multicolor, _ in graph.iter_edges_raw()})
+
+    def test_vertex_events_and_unsubscribe(self):
+        graph = BreakpointGraph()
+        inf_v1, inf_v2 = TaggedInfinityVertex("v1"), TaggedInfinityVertex("v2")
+        multicolor = Multicolor(self.genome1)
+        graph.add_edge(self.v1, inf_v1, multicolor=multicolor)
+        graph.add_edge(self.v2, inf_v2, multicolor=multicolor)
+        events = []
+        graph.subscribe(events.append)
+        checkpoint = graph.checkpoint()
+        graph.apply_kbreak(KBreak(start_edges=[(self.v1, inf_v1), (self.v2, inf_v2)],
+                                  result_edges=[(self.v1, self.v2), (inf_v1, inf_v2)], multicolor=multicolor))
+        removed_vertices = {event.vertex1 for event in events if event.kind == BGGraphEvent.VERTEX_REMOVED}
+        self.assertSetEqual(removed_vertices, {inf_v1, inf_v2})
+        del events[:]
+        graph.rollback(checkpoint)
+        added_vertices = {event.vertex1 for event in events if event.kind == BGGraphEvent.VERTEX_ADDED}
+        self.assertSetEqual(added_vertices, {inf_v1, inf_v2})
+        del events[:]
+        fork = graph.fork()
+        fork.delete_all_edges_between_two_vertices(self.v1, inf_v1)
+        self.assertListEqual(events, [])
+        graph.unsubscribe(events.append)
+        graph.delete_all_edges_between_two_vertices(self.v1, inf_v1)
+        self.assertListEqual(events, [])
+        with self.assertRaises(ValueError):
+            graph.unsubscribe(events.append)
+
+
 class BGConnectedComponentFilterTestCase(unittest.TestCase):
     def setUp(self):
         self.default_BG_connected_component_filter = BGConnectedComponentFilter()
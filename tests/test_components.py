@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import random
+import unittest
+
+import networkx as nx
+
+from bg.breakpoint_graph import BreakpointGraph, BGComponentView, TwoNodeConnectedComponentFilter, \
+    CompleteMultiEdgeConnectedComponentFilter
+from bg.components import BGComponentMemo, BGComponentTracker, get_component_fingerprint
+from bg.genome import BGGenome
+from bg.grimm import GRIMMReader
+from bg.kbreak import KBreak
+from bg.multicolor import Multicolor
+from bg.vertices import TaggedBlockVertex, TaggedInfinityVertex
+
+__author__ = "Sergey Aganezov"
+__email__ = "aganezov(at)cs.jhu.edu"
+__status__ = "production"
+
+
+def _component_summary(graph):
+    return sorted(str(vertex) for vertex in graph.nodes()), len(list(graph.edges()))
+
+
+class BGComponentTrackerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.genome1 = BGGenome("red")
+        self.genome2 = BGGenome("green")
+        self.vertices = [TaggedBlockVertex(str(cnt)) for cnt in range(8)]
+
+    def assertTrackerIsCorrect(self, graph):
+        tracker = graph.components_tracker
+        expected = sorted(sorted(str(vertex) for vertex in component) for component in nx.connected_components(graph.bg))
+        tracked = sorted(sorted(str(vertex) for vertex in vertices) for _, vertices in tracker.get_components())
+        self.assertListEqual(tracked, expected)
+        for _, vertices in tracker.get_components():
+            self.assertEqual(len({tracker.get_component_id(vertex) for vertex in vertices}), 1)
+
+    def test_initialization_from_existing_graph(self):
+        graph = GRIMMReader.get_breakpoint_graph([">red", "1 2 $", "3 @", ">green", "1 -2 $", "3 @"])
+        tracker = graph.enable_components_tracking()
+        self.assertIsInstance(tracker, BGComponentTracker)
+        self.assertIs(tracker, graph.enable_components_tracking())
+        self.assertEqual(len(tracker), len(list(nx.connected_components(graph.bg))))
+        self.assertDictEqual(graph.get_touched_components(), {})
+        self.assertTrackerIsCorrect(graph)
+
+    def test_component_id_after_changes(self):
+        graph = BreakpointGraph()
+        v1, v2, v3, v4 = self.vertices[:4]
+        graph.enable_components_tracking()
+        graph.add_edge(v1, v2, multicolor=Multicolor(self.genome1))
+        graph.add_edge(v3, v4, multicolor=Multicolor(self.genome1))
+        self.assertNotEqual(graph.get_component_id(v1), graph.get_component_id(v3))
+        graph.add_edge(v2, v3, multicolor=Multicolor(self.genome2))
+        self.assertEqual(graph.get_component_id(v1), graph.get_component_id(v4))
+        graph.add_edge(v2, v3, multicolor=Multicolor(self.genome1), merge=False)
+        graph.delete_edge(v2, v3, multicolor=Multicolor(self.genome2))
+        self.assertEqual(graph.get_component_id(v1), graph.get_component_id(v4))
+        graph.delete_edge(v2, v3, multicolor=Multicolor(self.genome1))
+        self.assertNotEqual(graph.get_component_id(v1), graph.get_component_id(v4))
+        self.assertIsNone(graph.get_component_id(self.vertices[5]))
+        self.assertTrackerIsCorrect(graph)
+
+    def test_touched_components(self):
+        graph = BreakpointGraph()
+        v1, v2, v3, v4 = self.vertices[:4]
+        graph.add_edge(v1, v2, multicolor=Multicolor(self.genome1))
+        graph.add_edge(v3, v4, multicolor=Multicolor(self.genome1))
+        graph.enable_components_tracking()
+        graph.add_edge(v2, v1, multicolor=Multicolor(self.genome2))
+        touched = graph.get_touched_components()
+        self.assertListEqual(list(touched.values()), [{v1, v2}])
+        self.assertDictEqual(graph.get_touched_components(), {})
+        graph.delete_edge(v3, v4, multicolor=Multicolor(self.genome1))
+        self.assertSetEqual(set(graph.get_component_id(v) for v in (v3, v4)), set(graph.get_touched_components()))
+
+    def test_apply_kbreak(self):
+        graph = BreakpointGraph()
+        v1, v2, v3, v4 = self.vertices[:4]
+        inf_v1, inf_v2 = TaggedInfinityVertex("0"), TaggedInfinityVertex("1")
+        multicolor = Multicolor(self.genome1)
+        graph.add_edge(self.vertices[0], inf_v1, multicolor=multicolor)
+        graph.add_edge(self.vertices[1], inf_v2, multicolor=multicolor)
+        graph.add_edge(v3, v4, multicolor=multicolor)
+        graph.enable_components_tracking()
+        kbreak = KBreak(start_edges=[(v1, inf_v1), (v2, inf_v2)], result_edges=[(v1, v2), (inf_v1, inf_v2)],
+                        multicolor=multicolor)
+        graph.apply_kbreak(kbreak=kbreak)
+        self.assertIsNone(graph.get_component_id(inf_v1))
+        self.assertEqual(graph.get_component_id(v1), graph.get_component_id(v2))
+        self.assertTrackerIsCorrect(graph)
+
+    def test_random_changes(self):
+        for backend in ("networkx", "compact"):
+            random.seed(0)
+            graph = BreakpointGraph(backend=backend)
+            graph.enable_components_tracking()
+            colors = [self.genome1, self.genome2]
+            for _ in range(300):
+                v1, v2 = random.choice(self.vertices), random.choice(self.vertices)
+                if random.random() < 0.55:
+                    graph.add_edge(v1, v2, multicolor=Multicolor(random.choice(colors)), merge=random.random() < 0.5)
+                elif v1 in graph.bg and v2 in graph.bg[v1]:
+                    graph.delete_all_edges_between_two_vertices(v1, v2)
+                self.assertTrackerIsCorrect(graph)
+
+    def test_connected_components_subgraphs(self):
+        graph = GRIMMReader.get_breakpoint_graph([">red", "1 2 $", "3 @", ">green", "1 -2 $", "3 @"])
+        expected = sorted(len(list(cc.nodes())) for cc in graph.connected_components_subgraphs())
+        graph.enable_components_tracking()
+        self.assertListEqual(sorted(len(list(cc.nodes())) for cc in graph.connected_components_subgraphs()), expected)
+        graph.disable_components_tracking()
+        self.assertIsNone(graph.components_tracker)
+
+    def test_connected_components_subgraphs_copy(self):
+        graph = GRIMMReader.get_breakpoint_graph([">red", "1 2 $", ">green", "1 -2 $"])
+        components = list(graph.connected_components_subgraphs(copy=True))
+        sizes = sorted(len(list(cc.edges())) for cc in components)
+        for edge in list(graph.edges()):
+            graph.delete_edge(edge.vertex1, edge.vertex2, multicolor=edge.multicolor)
+        self.assertListEqual(sorted(len(list(cc.edges())) for cc in components), sizes)
+
+    def test_connected_components_views(self):
+        graph = GRIMMReader.get_breakpoint_graph([">red", "1 2 $", "3 @", ">green", "1 -2 $", "3 @"])
+        for tracking in (False, True):
+            if tracking:
+                graph.enable_components_tracking()
+            views = list(graph.connected_components_views())
+            subgraphs = list(graph.connected_components_subgraphs())
+            self.assertEqual(len(views), len(subgraphs))
+            for view in views:
+                self.assertIsInstance(view, BGComponentView)
+                subgraph = next(cc for cc in subgraphs if set(cc.nodes()) == set(view.nodes()))
+                self.assertEqual(len(view), len(list(subgraph.nodes())))
+                self.assertEqual(view.number_of_edges, len(list(subgraph.edges())))
+                self.assertEqual(len(list(view.edges())), view.number_of_edges)
+                self.assertSetEqual(view.get_overall_set_of_colors(),
+                                    {color for edge in subgraph.edges() for color in edge.multicolor.colors})
+                self.assertEqual(view.has_irregular_vertices,
+                                 any(vertex.is_irregular_vertex for vertex in subgraph.nodes()))
+                self.assertSetEqual(set(view.to_breakpoint_graph().nodes()), set(subgraph.nodes()))
+
+    def test_connected_component_filters_on_views(self):
+        graph = GRIMMReader.get_breakpoint_graph([">red", "1 2 $", "3 @", ">green", "1 -2 $", "3 @"])
+        for cc_filter in (TwoNodeConnectedComponentFilter(), CompleteMultiEdgeConnectedComponentFilter()):
+            on_subgraphs = sorted(cc_filter.accept_connected_component(cc=cc, breakpoint_graph=graph)
+                                  for cc in graph.connected_components_subgraphs(copy=False))
+            on_views = sorted(cc_filter.accept_connected_component(cc=cc, breakpoint_graph=graph)
+                              for cc in graph.connected_components_views())
+            self.assertListEqual(on_views, on_subgraphs)
+
+    def test_map_components(self):
+        graph = GRIMMReader.get_breakpoint_graph([">red", "1 2 $", "3 @", "4 5 @", ">green", "1 -2 $", "3 @", "4 -5 @"])
+        expected = [_component_summary(cc.to_breakpoint_graph()) for cc in graph.connected_components_views()]
+        self.assertListEqual(graph.map_components(_component_summary), expected)
+        self.assertListEqual(graph.map_components(_component_summary, workers=2, chunksize=2), expected)
+        graph.enable_components_tracking()
+        expected = [_component_summary(cc.to_breakpoint_graph()) for cc in graph.connected_components_views()]
+        self.assertListEqual(graph.map_components(_component_summary, workers=2), expected)
+
+    def test_from_component_payload(self):
+        graph = GRIMMReader.get_breakpoint_graph([">red", "1 2 $", ">green", "1 -2 $"], merge_edges=False)
+        for cc in graph.connected_components_views():
+            component = BreakpointGraph.from_component_payload(cc.to_payload())
+            self.assertSetEqual(set(component.nodes()), set(cc.nodes()))
+            self.assertCountEqual([(frozenset((edge.vertex1, edge.vertex2)), edge.multicolor) for edge in component.edges()],
+                                  [(frozenset((edge.vertex1, edge.vertex2)), edge.multicolor) for edge in cc.edges()])
+
+
+class BGComponentFingerprintTestCase(unittest.TestCase):
+    def setUp(self):
+        self.data = [">red", "1 2 3 $", "4 5 @", "6 7 @",
+                     ">green", "1 2 -3 $", "4 -5 @", "6 -7 @"]
+
+    def test_isomorphic_components_share_fingerprint(self):
+        graph = GRIMMReader.get_breakpoint_graph(self.data)
+        fingerprints = {}
+        for cc in graph.connected_components_views():
+            fingerprint = get_component_fingerprint(cc)
+            for vertex in cc.nodes():
+                fingerprints[vertex.name] = fingerprint
+        self.assertEqual(fingerprints["4h"], fingerprints["6h"])
+        self.assertEqual(fingerprints["5t"], fingerprints["7t"])
+        self.assertNotEqual(fingerprints["4h"], fingerprints["1h"])
+        for cc in graph.connected_components_views():
+            self.assertEqual(get_component_fingerprint(cc), get_component_fingerprint(cc.to_breakpoint_graph()))
+
+    def test_fingerprint_depends_on_multicolors(self):
+        genome1, genome2 = BGGenome("red"), BGGenome("green")
+        v1, v2, v3, v4 = [TaggedBlockVertex(str(cnt)) for cnt in range(4)]
+        graph1, graph2, graph3 = BreakpointGraph(), BreakpointGraph(), BreakpointGraph()
+        graph1.add_edge(v1, v2, multicolor=Multicolor(genome1, genome2))
+        graph2.add_edge(v3, v4, multicolor=Multicolor(genome1, genome2))
+        graph3.add_edge(v1, v2, multicolor=Multicolor(genome1))
+        self.assertEqual(get_component_fingerprint(graph1), get_component_fingerprint(graph2))
+        self.assertNotEqual(get_component_fingerprint(graph1), get_component_fingerprint(graph3))
+        graph2.add_edge(v3, v4, multicolor=Multicolor(genome1), merge=False)
+        self.assertNotEqual(get_component_fingerprint(graph1), get_component_fingerprint(graph2))
+
+    def test_memo(self):
+        graph = GRIMMReader.get_breakpoint_graph(self.data)
+        calls = []
+
+        def number_of_edges(component):
+            calls.append(component)
+            return len(list(component.edges()))
+
+        for verify in (True, False):
+            memo = BGComponentMemo(number_of_edges, verify=verify)
+            del calls[:]
+            results = [memo(cc) for cc in graph.connected_components_views()]
+            self.assertListEqual(results, [len(list(cc.edges())) for cc in graph.connected_components_views()])
+            self.assertEqual(memo.hits + memo.misses, len(results))
+            self.assertEqual(memo.misses, len(calls))
+            self.assertLess(len(calls), len(results))
+            self.assertEqual(len(memo), len(calls))
+            memo.clear()
+            self.assertEqual(len(memo), 0)
+            self.assertEqual(memo.hits, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
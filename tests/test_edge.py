@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import copy
+import pickle
 from collections import Counter
 
 from marshmallow import ValidationError, post_load, fields
@@ -390,6 +392,32 @@ class BGEdgeTestCase(unittest.TestCase):
             with self.assertRaises(ValueError):
                 edge.update_data(source=source)
 
+    def test_slots_and_pickling(self):
+        v1, v2 = TaggedBlockVertex("v1"), TaggedBlockVertex("v2")
+        edge = BGEdge(vertex1=v1, vertex2=v2, multicolor=Multicolor(self.genome1, self.genome1), data={"a": 1})
+        self.assertIn("multicolor", BGEdge.__slots__)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            restored = pickle.loads(pickle.dumps(edge, protocol=protocol))
+            self.assertEqual(restored, edge)
+            self.assertEqual(restored.multicolor.multicolors[self.genome1], 2)
+        self.assertEqual(copy.deepcopy(edge), edge)
+        self.assertFalse(hasattr(edge, "__dict__"))
+        with self.assertRaises(AttributeError):
+            edge.special_attribute = 1
+
+    def test_json_schema_instance_override(self):
+        class BGEdgeJSONSchemaWithSpecialName(BGEdge.BGEdgeJSONSchema):
+            pass
+
+        v1, v2 = TaggedBlockVertex("v1"), TaggedBlockVertex("v2")
+        edge = BGEdge(vertex1=v1, vertex2=v2, multicolor=Multicolor(self.genome1))
+        other_edge = BGEdge(vertex1=v1, vertex2=v2, multicolor=Multicolor(self.genome1))
+        edge.json_schema = BGEdgeJSONSchemaWithSpecialName()
+        self.assertEqual(edge.json_schema_name, "BGEdgeJSONSchemaWithSpecialName")
+        self.assertEqual(other_edge.json_schema_name, "BGEdgeJSONSchema")
+        self.assertIsInstance(BGEdge.json_schema, BGEdge.BGEdgeJSONSchema)
+        self.assertEqual(copy.copy(edge).json_schema_name, "BGEdgeJSONSchemaWithSpecialName")
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()  # pragma: no cover
@@ -9,7 +9,7 @@ from bg.genome import BGGenome
 from bg.grimm import GRIMMReader, GRIMMWriter
 from bg.kbreak import KBreak
 from bg.multicolor import Multicolor
-from bg.vertices import TaggedBlockVertex, TaggedInfinityVertex
+from bg.vertices import TaggedBlockVertex, TaggedInfinityVertex, BGVertexPool
 
 __author__ = 'Sergey Aganezov'
 __email__ = "aganezov(at)cs.jhu.edu"
@@ -400,6 +400,33 @@ class GRIMMReaderTestCase(unittest.TestCase):
         iedge = result_bg.get_edge_by_two_vertices(vertex1=ah, vertex2=ahi)
         self.assertTupleEqual(iedge.data["fragment"]["forward_orientation"], (ah, ahi))
 
+    def test_get_breakpoint_graph_vertices_are_interned(self):
+        data = [">genome_1", "a b__repeat:x c $",
+                ">genome_2", "a -b__repeat:x c $",
+                ">genome_3", "c a b__repeat:x @"]
+        result_bg = GRIMMReader.get_breakpoint_graph(data, merge_edges=False)
+        nodes = {vertex.name: vertex for vertex in result_bg.nodes()}
+        for bgedge in result_bg.edges():
+            self.assertIs(bgedge.vertex1, nodes[bgedge.vertex1.name])
+            self.assertIs(bgedge.vertex2, nodes[bgedge.vertex2.name])
+        for vertex in nodes.values():
+            if vertex.is_block_vertex:
+                self.assertIs(vertex.mate_vertex, nodes[vertex.mate_vertex.name])
+                self.assertIs(vertex.mate_vertex.mate_vertex, vertex)
+        self.assertIs(nodes["bt__repeat:x"].mate_vertex, nodes["bh__repeat:x"])
+
+    def test_get_breakpoint_graph_shared_vertex_pool(self):
+        vertex_pool = BGVertexPool()
+        graph1 = GRIMMReader.get_breakpoint_graph([">genome_1", "a b $"], vertex_pool=vertex_pool)
+        graph2 = GRIMMReader.get_breakpoint_graph([">genome_2", "-b a $"], vertex_pool=vertex_pool)
+        self.assertEqual(len(vertex_pool), 7)
+        self.assertIs(graph1.get_vertex_by_name("ah"), graph2.get_vertex_by_name("ah"))
+        self.assertIs(graph1.get_vertex_by_name("bt"), vertex_pool.get("bt"))
+        self.assertIn("ah__infinity", vertex_pool)
+        self.assertNotIn(TaggedBlockVertex("ct"), vertex_pool)
+        graph3 = GRIMMReader.get_breakpoint_graph([">genome_2", "-b a $"])
+        self.assertIsNot(graph3.get_vertex_by_name("ah"), graph1.get_vertex_by_name("ah"))
+
 
 class GRIMMWriterTestCase(unittest.TestCase):
     def setUp(self):
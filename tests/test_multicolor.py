@@ -11,7 +11,10 @@ __status__ = "production"
 import unittest
 
 from bg.genome import BGGenome
-from bg.multicolor import Multicolor
+import pickle
+from copy import deepcopy
+
+from bg.multicolor import BitsetMulticolor, ColorRegistry, DEFAULT_COLOR_REGISTRY, FrozenMulticolor, Multicolor, SplitGuidance
 
 
 class MulticolorTestCase(unittest.TestCase):
@@ -280,6 +283,10 @@ class MulticolorTestCase(unittest.TestCase):
         mc2 = Multicolor(self.genome1, self.genome1, self.genome2, self.genome2)
         self.assertFalse(mc2 < mc1)
         self.assertFalse(mc2 <= mc1)
+        # colors, that are present only in the right argument, make it greater as well, so that `a < b` is the same as `b > a`
+        mc2 = Multicolor(self.genome1, self.genome1)
+        self.assertTrue(mc2 < mc1)
+        self.assertTrue(mc1 > mc2)
 
     def test__gt__and__ge__(self):
         # multicolor are compared as follows:
@@ -673,5 +680,204 @@ class MulticolorTestCase(unittest.TestCase):
                 Multicolor().intersect(incorrect_argument)
 
 
+class FrozenMulticolorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.genome1 = BGGenome("red")
+        self.genome2 = BGGenome("green")
+
+    def test_freeze_hash_consing(self):
+        multicolor = Multicolor(self.genome1, self.genome2, self.genome2)
+        frozen = FrozenMulticolor.freeze(multicolor)
+        self.assertIsInstance(frozen, FrozenMulticolor)
+        self.assertEqual(frozen, multicolor)
+        self.assertIs(FrozenMulticolor.freeze(Multicolor(self.genome2, self.genome1, self.genome2)), frozen)
+        self.assertIs(FrozenMulticolor.freeze(frozen), frozen)
+        self.assertEqual(hash(frozen), hash(FrozenMulticolor(self.genome1, self.genome2, self.genome2)))
+        multicolor.update(self.genome1)
+        self.assertEqual(frozen.multicolors[self.genome1], 1)
+
+    def test_immutability(self):
+        frozen = FrozenMulticolor(self.genome1)
+        with self.assertRaises(TypeError):
+            frozen.update(self.genome2)
+        with self.assertRaises(TypeError):
+            frozen.delete([self.genome1])
+        with self.assertRaises(TypeError):
+            frozen.multicolors[self.genome2] = 1
+        with self.assertRaises(AttributeError):
+            frozen.multicolors = None
+        with self.assertRaises(AttributeError):
+            Multicolor.left_merge(frozen, Multicolor(self.genome2))
+        self.assertEqual(frozen, Multicolor(self.genome1))
+
+    def test_inplace_operations_rebind(self):
+        frozen = FrozenMulticolor(self.genome1)
+        reference = frozen
+        frozen += Multicolor(self.genome2)
+        self.assertIsInstance(frozen, FrozenMulticolor)
+        self.assertEqual(frozen, Multicolor(self.genome1, self.genome2))
+        self.assertEqual(reference, Multicolor(self.genome1))
+        frozen -= Multicolor(self.genome1)
+        self.assertEqual(frozen, Multicolor(self.genome2))
+        self.assertEqual(reference * 2, Multicolor(self.genome1, self.genome1))
+
+    def test_copy(self):
+        frozen = FrozenMulticolor.freeze(Multicolor(self.genome1, self.genome2))
+        self.assertIs(deepcopy(frozen), frozen)
+        self.assertIs(pickle.loads(pickle.dumps(frozen)), frozen)
+
+
+class BitsetMulticolorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.genome1 = BGGenome("red")
+        self.genome2 = BGGenome("green")
+        self.genome3 = BGGenome("blue")
+        self.genomes = [self.genome1, self.genome2, self.genome3]
+
+    def get_colors_lists(self):
+        # all lists of colors with multiplicity of each color being at most 2
+        result = [[]]
+        for genome in self.genomes:
+            result = [colors + [genome] * multiplicity for colors in result for multiplicity in range(3)]
+        return result
+
+    def test_initialization(self):
+        registry = ColorRegistry()
+        multicolor = BitsetMulticolor(self.genome1, self.genome2, self.genome2, registry=registry)
+        self.assertEqual(len(registry), 2)
+        self.assertEqual(multicolor.mask, 0b11)
+        self.assertDictEqual(multicolor.counts, {registry.get_bit(self.genome2): 2})
+        self.assertEqual(multicolor.multicolors, Multicolor(self.genome1, self.genome2, self.genome2).multicolors)
+        self.assertSetEqual(multicolor.colors, {self.genome1, self.genome2})
+        self.assertEqual(multicolor.multiplicity(registry.get_bit(self.genome3)), 0)
+        self.assertIs(BitsetMulticolor().registry, DEFAULT_COLOR_REGISTRY)
+        with self.assertRaises(TypeError):
+            BitsetMulticolor(self.genome1, colors=[self.genome2])
+
+    def test_same_results_as_multicolor(self):
+        registry = ColorRegistry()
+        for colors1 in self.get_colors_lists():
+            for colors2 in self.get_colors_lists():
+                multicolor1, multicolor2 = Multicolor(*colors1), Multicolor(*colors2)
+                bitset_multicolor1 = BitsetMulticolor(*colors1)
+                for other in (BitsetMulticolor(*colors2), BitsetMulticolor(*colors2, registry=registry), multicolor2):
+                    self.assertEqual((bitset_multicolor1 + other).multicolors, (multicolor1 + multicolor2).multicolors)
+                    self.assertEqual((bitset_multicolor1 - other).multicolors, (multicolor1 - multicolor2).multicolors)
+                    self.assertEqual(bitset_multicolor1.intersect(other).multicolors, multicolor1.intersect(multicolor2).multicolors)
+                    self.assertEqual(BitsetMulticolor.similarity_score(bitset_multicolor1, other),
+                                     Multicolor.similarity_score(multicolor1, multicolor2))
+                    self.assertEqual(bitset_multicolor1 == other, multicolor1 == multicolor2)
+                    self.assertEqual(bitset_multicolor1 < other, multicolor1 < multicolor2)
+                    self.assertEqual(bitset_multicolor1 <= other, multicolor1 <= multicolor2)
+                    self.assertEqual(bitset_multicolor1 > other, multicolor1 > multicolor2)
+                    self.assertEqual(bitset_multicolor1 >= other, multicolor1 >= multicolor2)
+                self.assertEqual((bitset_multicolor1 * 2).multicolors, (multicolor1 * 2).multicolors)
+
+    def test_mixed_comparisons(self):
+        # python evaluates `a < b` with `b.__gt__` (and vice versa), if class of `b` is a heir of the one of `a`,
+        # so results must not depend on which of the multicolors is a bitset based one
+        for colors1 in self.get_colors_lists():
+            for colors2 in self.get_colors_lists():
+                multicolor1, multicolor2 = Multicolor(*colors1), Multicolor(*colors2)
+                bitset_multicolor1, bitset_multicolor2 = BitsetMulticolor(*colors1), BitsetMulticolor(*colors2)
+                self.assertEqual(multicolor1 < multicolor2, multicolor2 > multicolor1)
+                for left, right in ((multicolor1, bitset_multicolor2), (bitset_multicolor1, multicolor2),
+                                    (FrozenMulticolor(*colors1), bitset_multicolor2)):
+                    self.assertEqual(left < right, multicolor1 < multicolor2)
+                    self.assertEqual(left <= right, multicolor1 <= multicolor2)
+                    self.assertEqual(left > right, multicolor1 > multicolor2)
+                    self.assertEqual(left >= right, multicolor1 >= multicolor2)
+
+    def test_inplace_operations(self):
+        multicolor = BitsetMulticolor(self.genome1)
+        reference = multicolor
+        multicolor += Multicolor(self.genome1, self.genome2)
+        self.assertIs(multicolor, reference)
+        self.assertEqual(multicolor, Multicolor(self.genome1, self.genome1, self.genome2))
+        multicolor -= BitsetMulticolor(self.genome1)
+        self.assertEqual(multicolor, Multicolor(self.genome1, self.genome2))
+        multicolor.update(self.genome3, self.genome3)
+        multicolor.delete([self.genome1, self.genome3])
+        self.assertEqual(multicolor, Multicolor(self.genome2, self.genome3))
+        multicolor.multicolors = Multicolor(self.genome1).multicolors
+        self.assertEqual(multicolor, BitsetMulticolor(self.genome1))
+        self.assertIs(BitsetMulticolor.left_merge(multicolor, Multicolor(self.genome2)), multicolor)
+        self.assertEqual(multicolor, Multicolor(self.genome1, self.genome2))
+        merged = BitsetMulticolor.merge(multicolor, Multicolor(self.genome2))
+        self.assertIsInstance(merged, BitsetMulticolor)
+        self.assertEqual(merged, Multicolor(self.genome1, self.genome2, self.genome2))
+
+    def test_copy_and_pickling(self):
+        registry = ColorRegistry()
+        multicolor = BitsetMulticolor(self.genome1, self.genome2, self.genome2, registry=registry)
+        copied = deepcopy(multicolor)
+        self.assertIs(copied.registry, registry)
+        copied.update(self.genome3)
+        self.assertEqual(multicolor, Multicolor(self.genome1, self.genome2, self.genome2))
+        for source in (multicolor, BitsetMulticolor(self.genome3, self.genome3)):
+            restored = pickle.loads(pickle.dumps(source))
+            self.assertIsInstance(restored, BitsetMulticolor)
+            self.assertEqual(restored, source)
+        self.assertIs(pickle.loads(pickle.dumps(BitsetMulticolor(self.genome1))).registry, DEFAULT_COLOR_REGISTRY)
+
+    def test_mixing_with_multicolor(self):
+        multicolor = Multicolor(self.genome1) + BitsetMulticolor(self.genome2)
+        self.assertEqual(multicolor, Multicolor(self.genome1, self.genome2))
+        self.assertTrue(Multicolor(self.genome1) <= BitsetMulticolor(self.genome1, self.genome2))
+        self.assertTrue(FrozenMulticolor.freeze(BitsetMulticolor(self.genome1)) == BitsetMulticolor(self.genome1))
+        self.assertEqual(Multicolor.split_colors(BitsetMulticolor(self.genome1, self.genome2), guidance=[Multicolor(self.genome1)]),
+                         [Multicolor(self.genome1), Multicolor(self.genome2)])
+        with self.assertRaises(TypeError):
+            BitsetMulticolor(self.genome1) + 1
+
+
+class SplitGuidanceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.genome1 = BGGenome("red")
+        self.genome2 = BGGenome("green")
+        self.genome3 = BGGenome("blue")
+        self.genome4 = BGGenome("black")
+
+    def test_preparation(self):
+        # guidance entries are deduplicated and sorted from largest to smallest once, empty entries are dropped
+        guidance = SplitGuidance([Multicolor(self.genome1), Multicolor(),
+                                  Multicolor(self.genome1, self.genome2), Multicolor(self.genome1)])
+        self.assertEqual(len(guidance), 2)
+        self.assertDictEqual(guidance.entries[0], {self.genome1: 1, self.genome2: 1})
+        self.assertListEqual(guidance.color_index[self.genome1], [0, 1])
+        self.assertListEqual(guidance.color_index[self.genome2], [0])
+        guidance = SplitGuidance([Multicolor(self.genome1, self.genome1), Multicolor(self.genome1)],
+                                 account_for_color_multiplicity_in_guidance=False)
+        self.assertEqual(len(guidance), 1)
+
+    def test_split_same_as_split_colors(self):
+        guidance_list = [Multicolor(self.genome1, self.genome2, self.genome3), Multicolor(self.genome1, self.genome2),
+                         Multicolor(self.genome4, self.genome4), Multicolor(self.genome3)]
+        multicolors = [Multicolor(self.genome1, self.genome2, self.genome3, self.genome4),
+                       Multicolor(self.genome1, self.genome1, self.genome2, self.genome2, self.genome4),
+                       Multicolor(self.genome4, self.genome4, self.genome4, self.genome3),
+                       Multicolor(self.genome2)]
+        for account in (True, False):
+            guidance = SplitGuidance(guidance_list, account_for_color_multiplicity_in_guidance=account)
+            for multicolor in multicolors:
+                reference = Multicolor.split_colors(multicolor, guidance=guidance_list,
+                                                    account_for_color_multiplicity_in_guidance=account)
+                result = guidance.split(multicolor)
+                self.assertListEqual(result, reference)
+                self.assertListEqual(Multicolor.split_colors(multicolor, guidance=guidance), reference)
+                self.assertEqual(Multicolor.merge(*result), multicolor)
+
+    def test_split_multiplicity(self):
+        guidance = SplitGuidance([Multicolor(self.genome1, self.genome2)])
+        multicolor = Multicolor(self.genome1, self.genome1, self.genome1, self.genome2, self.genome2)
+        self.assertListEqual(guidance.split(multicolor), [Multicolor(self.genome1, self.genome2),
+                                                          Multicolor(self.genome1, self.genome2),
+                                                          Multicolor(self.genome1)])
+        guidance = SplitGuidance([Multicolor(self.genome1, self.genome2)],
+                                 account_for_color_multiplicity_in_guidance=False)
+        self.assertListEqual(guidance.split(multicolor), [multicolor])
+        self.assertIsNot(guidance.split(multicolor)[0], multicolor)
+
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()  # pragma: no cover
@@ -0,0 +1,380 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import unittest
+
+import networkx as nx
+from networkx import MultiGraph
+
+from bg.breakpoint_graph import BreakpointGraph
+from bg.edge import BGEdge
+from bg.genome import BGGenome
+from bg.grimm import GRIMMReader
+from bg.kbreak import KBreak
+from bg.multicolor import Multicolor
+from bg.storage import CompactMultiGraph, ForkedMultiGraph, FrozenMultiGraph
+from bg.vertices import TaggedBlockVertex, TaggedInfinityVertex
+
+__author__ = "Sergey Aganezov"
+__email__ = "aganezov(at)cs.jhu.edu"
+__status__ = "production"
+
+
+class StorageTestCase(unittest.TestCase):
+    def setUp(self):
+        self.v1 = TaggedBlockVertex("v1")
+        self.v2 = TaggedBlockVertex("v2")
+        self.v3 = TaggedBlockVertex("v3")
+
+    @staticmethod
+    def record(multicolor, data=None):
+        return {"multicolor": multicolor, "data": data}
+
+
+class CompactMultiGraphTestCase(StorageTestCase):
+    def test_empty_initialization(self):
+        graph = CompactMultiGraph()
+        self.assertEqual(len(graph), 0)
+        self.assertEqual(len(graph.edges()), 0)
+        self.assertEqual(len(list(graph.nodes())), 0)
+
+    def test_add_edge_keys_are_networkx_compatible(self):
+        graph = CompactMultiGraph()
+        reference = MultiGraph()
+        for storage in (graph, reference):
+            storage.add_edge(self.v1, self.v2, attr_dict=self.record(Multicolor("red")))
+            storage.add_edge(self.v1, self.v2, attr_dict=self.record(Multicolor("green")))
+            storage.add_edge(self.v2, self.v3, attr_dict=self.record(Multicolor("green")))
+            storage.remove_edge(self.v1, self.v2, key=0)
+            storage.add_edge(self.v2, self.v1, attr_dict=self.record(Multicolor("blue")))
+        self.assertSetEqual(set(graph[self.v1][self.v2].keys()), set(reference[self.v1][self.v2].keys()))
+        self.assertSetEqual(set(graph.nodes()), set(reference.nodes()))
+        self.assertEqual(len(graph.edges()), len(reference.edges()))
+        self.assertSetEqual({(frozenset((v1, v2)), key) for v1, v2, key in graph.edges(keys=True)},
+                            {(frozenset((v1, v2)), key) for v1, v2, key in reference.edges(keys=True)})
+
+    def test_edge_record_access_writes_through(self):
+        graph = CompactMultiGraph()
+        key = graph.add_edge(self.v1, self.v2, attr_dict=self.record(Multicolor("red"), {"origin": None}))
+        graph[self.v1][self.v2][key]["attr_dict"]["multicolor"] += Multicolor("green")
+        graph[self.v2][self.v1][key]["attr_dict"]["data"] = {}
+        v1, v2, k, data = list(graph.edges(nbunch=self.v2, keys=True, data=True))[0]
+        self.assertEqual(v1, self.v2)
+        self.assertEqual(v2, self.v1)
+        self.assertEqual(data["attr_dict"]["multicolor"], Multicolor("red", "green"))
+        self.assertDictEqual(data["attr_dict"]["data"], {})
+
+    def test_remove_edge_and_node(self):
+        graph = CompactMultiGraph()
+        graph.add_edge(self.v1, self.v2, attr_dict=self.record(Multicolor("red")))
+        graph.add_edge(self.v2, self.v3, attr_dict=self.record(Multicolor("red")))
+        graph.remove_edge(self.v1, self.v2)
+        self.assertIn(self.v1, graph)
+        self.assertFalse(graph.has_edge(self.v1, self.v2))
+        with self.assertRaises(nx.NetworkXError):
+            graph.remove_edge(self.v1, self.v2)
+        graph.remove_node(self.v2)
+        self.assertNotIn(self.v2, graph)
+        self.assertEqual(len(graph.edges()), 0)
+        with self.assertRaises(nx.NetworkXError):
+            graph.remove_node(self.v2)
+
+    def test_pair_index_with_parallel_edges(self):
+        graph = CompactMultiGraph()
+        for color in ("red", "green", "blue"):
+            graph.add_edge(self.v1, self.v2, attr_dict=self.record(Multicolor(color)))
+        graph.add_edge(self.v1, self.v3, attr_dict=self.record(Multicolor("red")))
+        self.assertEqual(graph.number_of_edges(self.v2, self.v1), 3)
+        graph.remove_edge(self.v2, self.v1, key=1)
+        graph.remove_edge(self.v1, self.v2, key=0)
+        self.assertListEqual(list(graph[self.v1][self.v2].keys()), [2])
+        self.assertEqual(graph[self.v2][self.v1][2]["attr_dict"]["multicolor"], Multicolor("blue"))
+        graph.remove_edge(self.v1, self.v2)
+        self.assertNotIn(self.v2, graph[self.v1])
+        self.assertIn(self.v3, graph[self.v1])
+        self.assertEqual(graph.number_of_edges(self.v1, self.v2), 0)
+
+    def test_edge_records(self):
+        graph = CompactMultiGraph()
+        red, green = Multicolor("red"), Multicolor("green")
+        graph.add_edge(self.v1, self.v2, attr_dict=self.record(red, {"origin": None}))
+        graph.add_edge(self.v2, self.v3, attr_dict=self.record(green))
+        records = list(graph.edge_records())
+        self.assertListEqual([(v1, v2, key) for v1, v2, key, _, _ in records], list(graph.edges(keys=True)))
+        self.assertIs(records[0][3], red)
+        self.assertDictEqual(records[0][4], {"origin": None})
+        self.assertListEqual([(v1, v2) for v1, v2, _, _, _ in graph.edge_records(nbunch=[self.v3])],
+                             [(self.v3, self.v2)])
+
+    def test_unsupported_edge_attributes(self):
+        with self.assertRaises(ValueError):
+            CompactMultiGraph().add_edge(self.v1, self.v2, weight=1)
+
+    def test_networkx_algorithms(self):
+        graph = CompactMultiGraph()
+        graph.add_edge(self.v1, self.v2, attr_dict=self.record(Multicolor("red")))
+        graph.add_edge(self.v2, self.v1, attr_dict=self.record(Multicolor("green")))
+        graph.add_node(self.v3)
+        components = sorted(nx.connected_components(graph), key=len)
+        self.assertListEqual(components, [{self.v3}, {self.v1, self.v2}])
+        self.assertEqual(len(nx.find_cycle(graph, self.v1)), 2)
+
+    def test_subgraph(self):
+        graph = CompactMultiGraph()
+        graph.add_edge(self.v1, self.v2, attr_dict=self.record(Multicolor("red")))
+        graph.add_edge(self.v2, self.v3, attr_dict=self.record(Multicolor("red")))
+        subgraph = graph.subgraph([self.v1, self.v2])
+        self.assertSetEqual(set(subgraph.nodes()), {self.v1, self.v2})
+        self.assertEqual(len(subgraph.edges()), 1)
+        self.assertIs(subgraph[self.v1][self.v2][0]["attr_dict"]["multicolor"],
+                      graph[self.v1][self.v2][0]["attr_dict"]["multicolor"])
+
+
+class ForkedMultiGraphTestCase(StorageTestCase):
+    def base(self, base_class):
+        graph = base_class()
+        graph.add_edge(self.v1, self.v2, attr_dict=self.record(Multicolor("red")))
+        graph.add_edge(self.v1, self.v2, attr_dict=self.record(Multicolor("green")))
+        graph.add_edge(self.v2, self.v3, attr_dict=self.record(Multicolor("red")))
+        return graph
+
+    def test_reads_through_base(self):
+        for base_class in (MultiGraph, CompactMultiGraph):
+            base = self.base(base_class)
+            graph = ForkedMultiGraph(base=base)
+            self.assertTrue(graph.is_pristine())
+            self.assertEqual(len(graph), 3)
+            self.assertEqual(graph.number_of_edges(), 3)
+            self.assertListEqual(list(graph.edges(keys=True)), list(base.edges(keys=True)))
+            self.assertListEqual(list(graph.edges(self.v3)), list(base.edges(self.v3)))
+            self.assertEqual(len(list(graph.edge_records())), 3)
+            self.assertIn(self.v1, graph)
+            self.assertNotIn(TaggedBlockVertex("v4"), graph)
+
+    def test_changes_do_not_affect_base(self):
+        for base_class in (MultiGraph, CompactMultiGraph):
+            base = self.base(base_class)
+            base_edges = list(base.edges(keys=True))
+            graph = ForkedMultiGraph(base=base)
+            v4 = TaggedBlockVertex("v4")
+            graph.add_edge(self.v3, v4, attr_dict=self.record(Multicolor("blue")))
+            graph.remove_edge(self.v1, self.v2, key=0)
+            graph.add_edge(self.v1, self.v2, key=1, attr_dict=self.record(Multicolor("red")))
+            self.assertFalse(graph.is_pristine())
+            self.assertListEqual(list(base.edges(keys=True)), base_edges)
+            self.assertEqual(base[self.v1][self.v2][1]["attr_dict"]["multicolor"], Multicolor("green"))
+            self.assertEqual(graph[self.v1][self.v2][1]["attr_dict"]["multicolor"], Multicolor("red"))
+            self.assertEqual(graph.number_of_edges(), 3)
+            self.assertEqual(len(graph), 4)
+            graph.remove_node(self.v2)
+            self.assertNotIn(self.v2, graph)
+            self.assertIn(self.v2, base)
+            self.assertEqual(graph.number_of_edges(), 1)
+            self.assertSetEqual(set(graph), {self.v1, self.v3, v4})
+            self.assertDictEqual(dict(graph[self.v1]), {})
+            graph.add_edge(self.v2, self.v1, attr_dict=self.record(Multicolor("red")))
+            self.assertSetEqual(set(graph), {self.v1, self.v2, self.v3, v4})
+            self.assertEqual(len(graph), 4)
+            with self.assertRaises(nx.NetworkXError):
+                graph.remove_edge(self.v2, self.v3)
+            with self.assertRaises(nx.NetworkXError):
+                graph.remove_node(TaggedBlockVertex("v5"))
+
+    def test_stacked_layers(self):
+        base = self.base(MultiGraph)
+        layer = ForkedMultiGraph(base=base)
+        layer.remove_edge(self.v2, self.v3)
+        graph = ForkedMultiGraph(base=layer)
+        graph.add_edge(self.v2, self.v3, attr_dict=self.record(Multicolor("green")))
+        self.assertFalse(layer.has_edge(self.v2, self.v3))
+        self.assertTrue(graph.has_edge(self.v2, self.v3))
+        self.assertEqual(graph.number_of_edges(), 3)
+        self.assertEqual(layer.number_of_edges(), 2)
+
+    def test_compacted(self):
+        base = self.base(MultiGraph)
+        v4 = TaggedBlockVertex("v4")
+        layer = ForkedMultiGraph(base=base)
+        layer.remove_node(self.v3)
+        layer.add_edge(self.v1, v4, attr_dict=self.record(Multicolor("blue")))
+        graph = ForkedMultiGraph(base=layer)
+        graph.add_edge(self.v3, self.v2, attr_dict=self.record(Multicolor("green")))
+        graph.remove_edge(self.v1, self.v2, key=0)
+        compacted = graph.compacted()
+        self.assertIs(compacted.base, base)
+        self.assertEqual(compacted.depth, 1)
+        self.assertSetEqual(set(compacted), set(graph))
+        self.assertEqual(len(compacted), len(graph))
+        self.assertEqual(compacted.number_of_edges(), graph.number_of_edges())
+        self.assertCountEqual(list(compacted.edges(keys=True)), list(graph.edges(keys=True)))
+        compacted.add_edge(self.v2, self.v3, key=0, attr_dict=self.record(Multicolor("red")))
+        self.assertEqual(graph[self.v2][self.v3][0]["attr_dict"]["multicolor"], Multicolor("green"))
+        self.assertIs(compacted[self.v3][self.v2], compacted[self.v2][self.v3])
+
+    def test_depth_is_bounded(self):
+        graph = ForkedMultiGraph(base=self.base(MultiGraph))
+        for _ in range(3 * ForkedMultiGraph.MAX_DEPTH):
+            graph.add_edge(self.v1, self.v3, attr_dict=self.record(Multicolor("red")))
+            graph = ForkedMultiGraph(base=graph)
+            self.assertLessEqual(graph.depth, ForkedMultiGraph.MAX_DEPTH)
+        self.assertEqual(graph.number_of_edges(self.v1, self.v3), 3 * ForkedMultiGraph.MAX_DEPTH)
+        self.assertEqual(graph.number_of_edges(), 3 + 3 * ForkedMultiGraph.MAX_DEPTH)
+
+    def test_networkx_algorithms(self):
+        graph = ForkedMultiGraph(base=self.base(MultiGraph))
+        graph.remove_edge(self.v2, self.v3)
+        components = sorted(nx.connected_components(graph), key=len)
+        self.assertListEqual(components, [{self.v3}, {self.v1, self.v2}])
+        self.assertEqual(len(nx.find_cycle(graph, self.v1)), 2)
+
+    def test_subgraph(self):
+        graph = ForkedMultiGraph(base=self.base(CompactMultiGraph))
+        subgraph = graph.subgraph([self.v1, self.v2])
+        self.assertIsInstance(subgraph, MultiGraph)
+        self.assertEqual(len(subgraph.edges()), 2)
+        self.assertIs(subgraph[self.v1][self.v2][0]["attr_dict"]["multicolor"],
+                      graph[self.v1][self.v2][0]["attr_dict"]["multicolor"])
+
+
+class FrozenMultiGraphTestCase(StorageTestCase):
+    def source(self, source_class):
+        graph = source_class()
+        graph.add_edge(self.v2, self.v3, attr_dict=self.record(Multicolor("red")))
+        graph.add_edge(self.v1, self.v2, attr_dict=self.record(Multicolor("red")))
+        graph.add_edge(self.v1, self.v2, attr_dict=self.record(Multicolor("green")))
+        graph.add_edge(self.v3, self.v3, attr_dict=self.record(Multicolor("blue")))
+        return graph
+
+    def test_same_content_as_source(self):
+        for source_class in (MultiGraph, CompactMultiGraph):
+            source = self.source(source_class)
+            graph = FrozenMultiGraph(graph=source)
+            self.assertEqual(len(graph), 3)
+            self.assertEqual(graph.number_of_edges(), 4)
+            self.assertEqual(graph.number_of_edges(self.v1, self.v2), 2)
+            self.assertCountEqual([(frozenset((v1, v2)), key) for v1, v2, key in graph.edges(keys=True)],
+                                  [(frozenset((v1, v2)), key) for v1, v2, key in source.edges(keys=True)])
+            self.assertListEqual(list(graph[self.v1][self.v2]), [0, 1])
+            self.assertCountEqual(list(graph[self.v2]), [self.v1, self.v3])
+            self.assertIn(self.v3, graph[self.v3])
+            self.assertNotIn(self.v3, graph[self.v1])
+            self.assertTrue(graph.has_edge(self.v2, self.v1, key=1))
+            self.assertFalse(graph.has_edge(self.v1, self.v3))
+            self.assertIs(graph[self.v1][self.v2][1]["attr_dict"]["multicolor"],
+                          source[self.v1][self.v2][1]["attr_dict"]["multicolor"])
+            self.assertEqual(graph.new_edge_key(self.v1, self.v2), 2)
+
+    def test_changes_are_prohibited(self):
+        graph = FrozenMultiGraph(graph=self.source(CompactMultiGraph))
+        with self.assertRaises(nx.NetworkXError):
+            graph.add_edge(self.v1, self.v3, attr_dict=self.record(Multicolor("red")))
+        with self.assertRaises(nx.NetworkXError):
+            graph.remove_edge(self.v1, self.v2)
+        with self.assertRaises(nx.NetworkXError):
+            graph.remove_node(self.v1)
+        with self.assertRaises(nx.NetworkXError):
+            graph.add_node(TaggedBlockVertex("v4"))
+        with self.assertRaises(nx.NetworkXError):
+            graph[self.v1][self.v2][0]["attr_dict"]["multicolor"] = Multicolor("blue")
+
+    def test_snapshot_is_independent_of_source(self):
+        source = self.source(CompactMultiGraph)
+        graph = FrozenMultiGraph(graph=source)
+        source.remove_node(self.v1)
+        self.assertEqual(graph.number_of_edges(self.v1, self.v2), 2)
+
+    def test_networkx_algorithms(self):
+        graph = FrozenMultiGraph(graph=self.source(MultiGraph))
+        self.assertListEqual(list(nx.connected_components(graph)), [{self.v1, self.v2, self.v3}])
+        self.assertEqual(nx.shortest_path_length(graph, self.v1, self.v3), 2)
+
+    def test_subgraph_and_copy(self):
+        graph = FrozenMultiGraph(graph=self.source(CompactMultiGraph))
+        subgraph = graph.subgraph([self.v1, self.v2])
+        self.assertIsInstance(subgraph, FrozenMultiGraph)
+        self.assertEqual(subgraph.number_of_edges(), 2)
+        copy = graph.copy()
+        self.assertIsInstance(copy, CompactMultiGraph)
+        self.assertNotIsInstance(copy, FrozenMultiGraph)
+        copy.remove_node(self.v1)
+        self.assertEqual(copy.number_of_edges(), 2)
+        self.assertEqual(graph.number_of_edges(), 4)
+
+
+class CompactBreakpointGraphTestCase(unittest.TestCase):
+    def setUp(self):
+        self.genome1 = BGGenome("red")
+        self.genome2 = BGGenome("green")
+        self.grimm_data = [">red", "1 2 3 $", "4 -5 @",
+                           ">green", "1 -2 3 $", "4 5 @"]
+
+    def test_backend_selection(self):
+        self.assertIsInstance(BreakpointGraph().bg, MultiGraph)
+        self.assertIsInstance(BreakpointGraph(backend="compact").bg, CompactMultiGraph)
+        with self.assertRaises(ValueError):
+            BreakpointGraph(backend="non_existing")
+
+    def test_same_results_as_networkx_backend(self):
+        reference = GRIMMReader.get_breakpoint_graph(self.grimm_data)
+        graph = BreakpointGraph(backend="compact")
+        graph.update(reference, merge_edges=True)
+        self.assertEqual(len(list(graph.nodes())), len(list(reference.nodes())))
+        self.assertEqual(len(list(graph.edges())), len(list(reference.edges())))
+        for edge in reference.edges():
+            self.assertEqual(graph.get_condensed_edge(edge.vertex1, edge.vertex2).multicolor,
+                             reference.get_condensed_edge(edge.vertex1, edge.vertex2).multicolor)
+        self.assertSetEqual(graph.get_overall_set_of_colors(), {self.genome1, self.genome2})
+        self.assertEqual(len(list(graph.connected_components_subgraphs())),
+                         len(list(reference.connected_components_subgraphs())))
+        self.assertDictEqual(graph.get_genome_graph(color=self.genome1).get_blocks_order(),
+                             reference.get_genome_graph(color=self.genome1).get_blocks_order())
+        self.assertIsInstance(graph.get_genome_graph(color=self.genome1).bg, CompactMultiGraph)
+
+    def test_apply_kbreak(self):
+        graph = BreakpointGraph(backend="compact")
+        v1, v2, v3, v4 = [TaggedBlockVertex(name) for name in ("v1", "v2", "v3", "v4")]
+        multicolor = Multicolor(self.genome1)
+        graph.add_edge(v1, v2, multicolor=multicolor)
+        graph.add_edge(v3, v4, multicolor=multicolor + Multicolor(self.genome2))
+        kbreak = KBreak(start_edges=[(v1, v2), (v3, v4)], result_edges=[(v1, v3), (v2, v4)], multicolor=multicolor)
+        graph.apply_kbreak(kbreak=kbreak)
+        self.assertIsNone(graph.get_edge_by_two_vertices(v1, v2))
+        self.assertEqual(graph.get_edge_by_two_vertices(v3, v4).multicolor, Multicolor(self.genome2))
+        self.assertEqual(graph.get_edge_by_two_vertices(v1, v3).multicolor, multicolor)
+        self.assertEqual(graph.get_edge_by_two_vertices(v2, v4).multicolor, multicolor)
+
+    def test_infinity_vertices_cleanup_after_kbreak(self):
+        graph = BreakpointGraph(backend="compact")
+        v1, v2 = TaggedBlockVertex("v1"), TaggedBlockVertex("v2")
+        inf_v1, inf_v2 = TaggedInfinityVertex("v1"), TaggedInfinityVertex("v2")
+        multicolor = Multicolor(self.genome1)
+        graph.add_edge(v1, inf_v1, multicolor=multicolor)
+        graph.add_edge(v2, inf_v2, multicolor=multicolor)
+        kbreak = KBreak(start_edges=[(v1, inf_v1), (v2, inf_v2)], result_edges=[(v1, v2), (inf_v1, inf_v2)],
+                        multicolor=multicolor)
+        graph.apply_kbreak(kbreak=kbreak)
+        self.assertSetEqual(set(graph.nodes()), {v1, v2})
+        self.assertEqual(len(list(graph.edges())), 1)
+
+    def test_json_round_trip(self):
+        reference = GRIMMReader.get_breakpoint_graph(self.grimm_data)
+        graph = BreakpointGraph.from_json(reference.to_json(), backend="compact")
+        self.assertIsInstance(graph.bg, CompactMultiGraph)
+        self.assertEqual(len(list(graph.edges())), len(list(reference.edges())))
+        self.assertEqual(len(graph.to_json()["vertices"]), len(reference.to_json()["vertices"]))
+
+    def test_delete_and_split(self):
+        graph = BreakpointGraph(backend="compact")
+        v1, v2 = TaggedBlockVertex("v1"), TaggedBlockVertex("v2")
+        graph.add_edge(v1, v2, multicolor=Multicolor(self.genome1, self.genome2))
+        graph.split_all_edges()
+        self.assertEqual(len(list(graph.edges())), 2)
+        graph.merge_all_edges()
+        self.assertEqual(len(list(graph.edges())), 1)
+        graph.delete_bgedge(BGEdge(vertex1=v1, vertex2=v2, multicolor=Multicolor(self.genome1, self.genome2)))
+        self.assertEqual(len(list(graph.edges())), 0)
+        self.assertSetEqual(set(graph.nodes()), {v1, v2})
+
+
+if __name__ == '__main__':
+    unittest.main()
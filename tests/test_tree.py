@@ -4,7 +4,7 @@ from ete3 import TreeNode
 
 from bg.edge import BGEdge
 from bg.genome import BGGenome
-from bg.multicolor import Multicolor
+from bg.multicolor import BitsetMulticolor, Multicolor
 from bg.tree import BGTree
 
 __author__ = "Sergey Aganezov"
@@ -242,6 +242,25 @@ class BGTreeTestCase(unittest.TestCase):
         self.assertTrue(tree.multicolor_is_tree_consistent(Multicolor(self.bg_v1, self.bg_v3)))
         self.assertTrue(tree.multicolor_is_tree_consistent(Multicolor(self.bg_v3, self.bg_v2)))
 
+    def test_is_bitset_multicolor_tree_consistent(self):
+        # bitset based multicolors are checked with a help of bitmasks, but the result shall be the same, as for regular multicolors
+        tree = BGTree("(((v1, v2), v3),(v4, v5));")
+        genomes = [self.bg_v1, self.bg_v2, self.bg_v3, self.bg_v4, self.bg_v5, BGGenome("v6")]
+        for iteration in range(2):
+            for mask in range(2 ** len(genomes)):
+                colors = [genome for bit, genome in enumerate(genomes) if (mask >> bit) & 1]
+                for multicolor in (Multicolor(*colors), Multicolor(*(colors * 2))):
+                    bitset_multicolor = BitsetMulticolor(*multicolor.multicolors.elements())
+                    self.assertEqual(tree.multicolor_is_tree_consistent(bitset_multicolor),
+                                     tree.multicolor_is_tree_consistent(multicolor))
+                    self.assertEqual(tree.multicolor_is_vtree_consistent(bitset_multicolor),
+                                     tree.multicolor_is_vtree_consistent(multicolor))
+            if iteration == 0:
+                # masks shall be recomputed after tree topology change
+                tree.add_edge("v5", "v6")
+        self.assertFalse(tree.multicolor_is_tree_consistent(BitsetMulticolor(self.bg_v1, self.bg_v5)))
+        self.assertTrue(tree.multicolor_is_tree_consistent(BitsetMulticolor(BGGenome("v6"))))
+
     def test_is_bgedge_tree_consistent(self):
         # tests if supplied bgedge has a multicolor that is consistent with tree topology
         v1, v2 = "v1", "v2"
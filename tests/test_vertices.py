@@ -5,6 +5,7 @@ __author__ = "Sergey Aganezov"
 __email__ = "aganezov(at)cs.jhu.edu"
 __status__ = "production"
 
+import pickle
 import unittest
 
 from bg.vertices import BGVertex_JSON_SCHEMA_JSON_KEY, BGVertex, BlockVertex, InfinityVertex, TaggedVertex, TaggedBlockVertex, \
@@ -36,6 +37,24 @@ class BGVertexTestCase(unittest.TestCase):
         """ hash value from BGVertex is defines as hash value from the name of respective vertex """
         self.assertEqual(hash(self.vertex_class(self.str_name1)), hash(self.vertex_class(self.str_name1).name))
 
+    def test_name_and_hash_after_rename(self):
+        """ name and hash value are cached, and are recomputed after the name is changed """
+        v = self.vertex_class(self.str_name1)
+        self.assertEqual(hash(v), hash(v.name))
+        v.name = self.str_name2
+        self.assertIn(self.str_name2, v.name)
+        self.assertNotIn(self.str_name1, v.name)
+        self.assertEqual(hash(v), hash(v.name))
+        self.assertEqual(v, self.vertex_class(self.str_name2))
+
+    def test_pickling_drops_cached_values(self):
+        v = self.vertex_class(self.str_name1)
+        hash(v)
+        restored = pickle.loads(pickle.dumps(v))
+        self.assertIsNone(restored._hash)
+        self.assertEqual(restored, v)
+        self.assertEqual(restored.name, v.name)
+
     def test__eq__(self):
         """ BGVertices are equal is they are of the same class and have equal hash values """
         v1 = self.vertex_class(self.str_name1)
@@ -363,6 +382,22 @@ class TaggedVertexTestCase(BGVertexTestCase):
         # silent fail options can be specified to remove the non present tag without raising the exception
         t_v.remove_tag("repeat", 2, silent_fail=True)
 
+    def test_name_and_hash_after_tags_change(self):
+        t_v = self.vertex_class(self.str_name1)
+        name, hash_value = t_v.name, hash(t_v)
+        t_v.add_tag("repeat", 1)
+        self.assertIn("repeat:1", t_v.name)
+        self.assertEqual(hash(t_v), hash(t_v.name))
+        self.assertNotEqual(hash(t_v), hash_value)
+        t_v.add_tag("repeat", 1)
+        self.assertEqual(t_v.name.count("repeat:1"), 1)
+        t_v.remove_tag("repeat", 1)
+        self.assertEqual(t_v.name, name)
+        self.assertEqual(hash(t_v), hash_value)
+        t_v.tags = [("repeat", 2)]
+        self.assertIn("repeat:2", t_v.name)
+        self.assertEqual(hash(t_v), hash(t_v.name))
+
     def test_remove_tag_incorrect(self):
         # when attempting to remove a non existing "tag" -- "value" pair and no silent_fail option is present,
         #   a value error is raised
@@ -407,6 +442,25 @@ class TaggedVertexTestCase(BGVertexTestCase):
         self.assertFalse(t_v.is_repeat_vertex)
 
 
+    def test_tag_predicates_are_shared_per_tag_names(self):
+        v1, v2 = self.vertex_class(self.str_name1), self.vertex_class(self.str_name3)
+        v1.add_tag("repeat", 1)
+        v2.add_tag("repeat", 2)
+        self.assertTrue(v1.is_repeat_vertex)
+        self.assertFalse(v1.is_tag_name_2_vertex)
+        self.assertIs(v1._tag_predicates, v2._tag_predicates)
+        self.assertTrue(v2.is_repeat_vertex)
+        self.assertFalse(v2.is_tag_name_2_vertex)
+        v2.add_tag("tag_name_2", 1)
+        self.assertIsNot(v1._tag_predicates, v2._tag_predicates)
+        self.assertTrue(v2.is_tag_name_2_vertex)
+        self.assertFalse(v1.is_tag_name_2_vertex)
+        v2.tags = []
+        self.assertFalse(v2.is_repeat_vertex)
+        with self.assertRaises(AttributeError):
+            getattr(v1, "non_existing_attribute")
+
+
 class TaggedBlockVertexTestCase(TaggedVertexTestCase, BlockVertexTestCase):
     def setUp(self):
         super(TaggedBlockVertexTestCase, self).setUp()
@@ -435,6 +489,13 @@ class TaggedBlockVertexTestCase(TaggedVertexTestCase, BlockVertexTestCase):
         tbv.add_tag("tag1", 1)
         self.assertTrue(tbv.is_tail_vertex)
 
+    def test_head_and_tail_after_rename(self):
+        tbv = self.vertex_class("vertext")
+        tbv.name = "vertexh"
+        self.assertTrue(tbv.is_head_vertex)
+        self.assertFalse(tbv.is_tail_vertex)
+        self.assertFalse(self.vertex_class("vertex").is_head_vertex)
+
 
 class TaggedInfinityVertexTestCase(TaggedVertexTestCase, InfinityVertexTestCase):
     def setUp(self):